@@ -0,0 +1,77 @@
+"""
+Per-call cost of the distance formulas.
+
+Run from the repository root with ``make benchmark``, or::
+
+    PYTHONPATH=. python benchmarks/distance.py
+"""
+
+from __future__ import print_function
+
+import random
+import timeit
+
+from geopy import distance
+
+
+NUMBER = 2000
+
+# Pairs of points, the same for every formula: spread over the globe, and
+# nearly antipodal, where Vincenty's formula may not converge.
+random.seed(0)
+PAIRS = {
+    'random': [
+        (
+            (random.uniform(-89, 89), random.uniform(-180, 180)),
+            (random.uniform(-89, 89), random.uniform(-180, 180)),
+        )
+        for _ in range(NUMBER)
+    ],
+    'antipodal': [
+        (
+            (lat, lng),
+            (-lat + random.uniform(-1, 1), lng + 180 + random.uniform(-1, 1)),
+        )
+        for lat, lng in (
+            (random.uniform(-10, 10), random.uniform(-180, 180))
+            for _ in range(NUMBER)
+        )
+    ],
+}
+
+
+def measure_all(cls, pairs):
+    """
+    Measure every pair with ``cls``, counting failures to converge.
+    """
+    failures = 0
+    for a, b in pairs:
+        try:
+            cls(a, b)
+        except ValueError:
+            failures += 1
+    return failures
+
+
+def main():
+    """
+    Print the mean time per distance of each formula.
+    """
+    formulas = [distance.great_circle, distance.vincenty]
+    if distance.geographiclib_available:
+        formulas.append(distance.geodesic)
+    else:
+        print("geographiclib is not installed; skipping geodesic")
+    for name, pairs in sorted(PAIRS.items()):
+        for cls in formulas:
+            failures = measure_all(cls, pairs)
+            seconds = min(timeit.repeat(
+                lambda cls=cls: measure_all(cls, pairs), repeat=3, number=1
+            ))
+            print("%-10s %-14s %8.2f us/call  %d/%d failed to converge" % (
+                name, cls.__name__, seconds / NUMBER * 1e6, failures, NUMBER
+            ))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,50 @@
+"""
+Cost of constructing a distance from two points, by type of point.
+
+Tuples of numbers and :class:`geopy.point.Point` objects take the fast path,
+which reads their coordinates directly. Strings are parsed into a new
+``Point`` first, as every type of point used to be.
+
+Run from the repository root with ``make benchmark``, or::
+
+    PYTHONPATH=. python benchmarks/distance_init.py
+"""
+
+from __future__ import print_function
+
+import timeit
+
+from geopy.distance import great_circle, vincenty
+from geopy.point import Point
+
+
+NUMBER = 20000
+
+NEWPORT_RI = (41.49008, -71.312796)
+CLEVELAND_OH = (41.499498, -81.695391)
+
+POINTS = [
+    ('tuple', NEWPORT_RI, CLEVELAND_OH),
+    ('Point', Point(NEWPORT_RI), Point(CLEVELAND_OH)),
+    ('string', "41.49008, -71.312796", "41.499498, -81.695391"),
+]
+
+
+def main():
+    """
+    Print the mean time to construct each kind of distance.
+    """
+    for cls in (great_circle, vincenty):
+        for name, a, b in POINTS:
+            seconds = min(timeit.repeat(
+                lambda: cls(a, b), # pylint: disable=W0640
+                repeat=5,
+                number=NUMBER
+            ))
+            print("%-14s %-8s %8.2f us/call" % (
+                cls.__name__, name, seconds / NUMBER * 1e6
+            ))
+
+
+if __name__ == '__main__':
+    main()
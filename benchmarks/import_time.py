@@ -0,0 +1,59 @@
+"""
+Time taken to import :mod:`geopy.geocoders` in a new interpreter, as
+reported by ``python -X importtime`` (Python 3.7 or later), and the modules
+contributing most to it.
+
+Run from the repository root with ``make benchmark``, or::
+
+    PYTHONPATH=. python benchmarks/import_time.py
+"""
+
+from __future__ import print_function
+
+import subprocess
+import sys
+
+
+RUNS = 5
+MODULE = 'geopy.geocoders'
+SLOWEST = 10
+
+
+def import_times(module):
+    """
+    Cumulative import time of each module imported by ``import module``,
+    in microseconds, by module name.
+    """
+    output = subprocess.check_output(
+        [sys.executable, '-X', 'importtime', '-c', 'import %s' % module],
+        stderr=subprocess.STDOUT,
+        universal_newlines=True,
+    )
+    times = {}
+    for line in output.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+def main():
+    """
+    Print the best total import time of a few runs, and its slowest parts.
+    """
+    if sys.version_info < (3, 7):
+        print("python -X importtime requires Python 3.7 or later")
+        return
+    best = min(
+        (import_times(MODULE) for _ in range(RUNS)),
+        key=lambda times: times[MODULE]
+    )
+    print("import %-30s %8.1f ms" % (MODULE, best[MODULE] / 1000.))
+    slowest = sorted(best.items(), key=lambda item: -item[1])
+    for name, cumulative in slowest[1:SLOWEST + 1]:
+        print("  %-35s %8.1f ms" % (name, cumulative / 1000.))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,82 @@
+"""
+Cost of :class:`geopy.point.Point` objects: construction, comparison,
+memory and parsing.
+
+Run from the repository root with ``make benchmark``, or::
+
+    PYTHONPATH=. python benchmarks/point.py
+"""
+
+from __future__ import print_function
+
+import random
+import timeit
+
+try:
+    import tracemalloc
+except ImportError: # Python < 3.4
+    tracemalloc = None
+
+from geopy.point import Point, PointArray
+
+
+NUMBER = 100000
+
+
+def per_call(function):
+    """
+    Mean time of a call of ``function``, in microseconds.
+    """
+    seconds = min(timeit.repeat(function, repeat=5, number=NUMBER))
+    return seconds / NUMBER * 1e6
+
+
+def main():
+    """
+    Print the cost of common operations on points.
+    """
+    point, other = Point(41.5, -81.0), Point(41.5, -81.0)
+    print("Point(lat, lng)     %6.3f us" % per_call(
+        lambda: Point(41.5, -81.0)
+    ))
+    print("Point((lat, lng))   %6.3f us" % per_call(
+        lambda: Point((41.5, -81.0))
+    ))
+    print("point == other      %6.3f us" % per_call(lambda: point == other))
+    print("hash(point)         %6.3f us" % per_call(lambda: hash(point)))
+
+    if tracemalloc is None:
+        return
+    tracemalloc.start()
+    start = tracemalloc.get_traced_memory()[0]
+    points = [Point(i * 1e-5, -81.0) for i in range(NUMBER)]
+    used = tracemalloc.get_traced_memory()[0] - start
+    tracemalloc.stop()
+    # Leave out the list holding the points.
+    used -= 8 * len(points)
+    print("memory              %6.1f bytes/point" % (used / len(points)))
+
+
+def parse():
+    """
+    Print the cost of parsing strings one by one and all at once.
+    """
+    random.seed(0)
+    strings = [
+        "%.6f,%.6f" % (random.uniform(-90, 90), random.uniform(-180, 180))
+        for _ in range(NUMBER)
+    ]
+    seconds = min(timeit.repeat(
+        lambda: [Point.from_string(string) for string in strings],
+        repeat=3, number=1
+    ))
+    print("Point.from_string   %6.3f us/string" % (seconds / NUMBER * 1e6))
+    seconds = min(timeit.repeat(
+        lambda: PointArray.from_strings(strings), repeat=3, number=1
+    ))
+    print("from_strings        %6.3f us/string" % (seconds / NUMBER * 1e6))
+
+
+if __name__ == '__main__':
+    main()
+    parse()
@@ -8,7 +8,32 @@ geocoders and other data sources.
 geopy is tested against CPython 2.7, CPython 3.2, CPython 3.4, PyPy, and PyPy3.
 """
 
+from types import ModuleType
+
+from geopy import geocoders
+from geopy.compat import replace_module
 from geopy.point import Point
 from geopy.location import Location
-from geopy.geocoders import * # pylint: disable=W0401
 from geopy.util import __version__
+
+__all__ = ("Point", "Location") + geocoders.__all__
+
+
+class _GeopyModule(ModuleType):
+    """
+    Type of ``geopy``, which looks geocoders up in :mod:`geopy.geocoders`,
+    so that they are imported when first used.
+    """
+
+    def __getattr__(self, name):
+        if name in geocoders.__all__:
+            return getattr(geocoders, name)
+        raise AttributeError(
+            "module %r has no attribute %r" % (self.__name__, name)
+        )
+
+    def __dir__(self):
+        return sorted(set(self.__dict__) | set(__all__))
+
+
+replace_module(__name__, _GeopyModule)
@@ -0,0 +1,685 @@
+"""
+:class:`.AsyncGeocoder` runs any geocoder on an :mod:`asyncio` event loop.
+
+.. versionadded:: 1.12.0
+
+Requires Python 3.5 or later.
+"""
+
+import asyncio
+import socket
+import ssl
+from functools import partial
+from http.client import parse_headers
+from io import BytesIO
+from time import time
+
+from geopy.compat import URLError, urlparse
+from geopy.exc import GeopyError
+from geopy.geocoders import base
+from geopy.transport import ( # pylint: disable=W0212
+    _basic_auth,
+    _merge_headers,
+    _origin,
+    HTTPTransport,
+    PooledResponse,
+    DEFAULT_POOL_SIZE,
+    DEFAULT_IDLE_TIMEOUT,
+    DEFAULT_MAX_REDIRECTS,
+)
+
+
+__all__ = (
+    "AsyncGeocoder",
+    "AsyncHTTPTransport",
+    "DEFAULT_CONNECTION_LIMIT",
+)
+
+
+DEFAULT_CONNECTION_LIMIT = 100
+
+
+class AsyncConnectionPool(object):
+    """
+    Keep-alive stream connections to a single host, with at most ``limit``
+    of them open at once. Further requests wait for a free connection.
+    """
+
+    def __init__(
+            self,
+            scheme,
+            host,
+            port=None,
+            limit=DEFAULT_CONNECTION_LIMIT,
+            maxsize=DEFAULT_POOL_SIZE,
+            idle_timeout=DEFAULT_IDLE_TIMEOUT,
+            proxy=None,
+            ssl_context=None
+        ): # pylint: disable=R0913
+        self.scheme = scheme
+        self.host = host
+        self.port = port or (443 if scheme == 'https' else 80)
+        self.limit = limit
+        self.maxsize = maxsize
+        self.idle_timeout = idle_timeout
+        self.proxy = proxy
+        self.proxy_headers = {}
+        if proxy is not None:
+            parsed = urlparse(proxy)
+            self._proxy_address = (parsed.hostname, parsed.port or 80)
+            if parsed.username:
+                self.proxy_headers['Proxy-Authorization'] = _basic_auth(
+                    parsed.username, parsed.password or ''
+                )
+        self.ssl_context = ssl_context
+        self._idle = []
+        self._semaphore = None
+
+    async def acquire(self, fresh=False):
+        """
+        Check out a ``(reader, writer, reused)`` connection, waiting for
+        one to be released if ``limit`` are already in use. An idle
+        connection is reused if possible, unless ``fresh`` is true.
+        """
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.limit)
+        await self._semaphore.acquire()
+        try:
+            now = time()
+            while self._idle and not fresh:
+                reader, writer, last_used = self._idle.pop()
+                if now - last_used > self.idle_timeout or reader.at_eof():
+                    writer.close()
+                    continue
+                return reader, writer, True
+            reader, writer = await self._open()
+            return reader, writer, False
+        except BaseException:
+            self._semaphore.release()
+            raise
+
+    def release(self, reader, writer, reusable):
+        """
+        Hand a connection back, keeping it for reuse if ``reusable``.
+        """
+        self._semaphore.release()
+        if reusable and len(self._idle) < self.maxsize:
+            self._idle.append((reader, writer, time()))
+        else:
+            writer.close()
+
+    async def _open(self):
+        """
+        Open a connection to the host, through the proxy if there is one.
+        """
+        https = self.ssl_context if self.scheme == 'https' else None
+        if self.proxy is None:
+            return await asyncio.open_connection(self.host, self.port, ssl=https)
+
+        reader, writer = await asyncio.open_connection(*self._proxy_address)
+        if https is None:
+            return reader, writer
+
+        target = '%s:%s' % (self.host, self.port)
+        lines = ['CONNECT %s HTTP/1.1' % target, 'Host: %s' % target]
+        lines.extend('%s: %s' % item for item in self.proxy_headers.items())
+        writer.write(('\r\n'.join(lines) + '\r\n\r\n').encode('latin-1'))
+        _, status, _, _ = await _read_head(reader)
+        if status != 200:
+            writer.close()
+            raise OSError('Tunnel connection failed: %s' % status)
+        if not hasattr(writer, 'start_tls'): # Python < 3.11
+            writer.close()
+            raise OSError('HTTPS through a proxy requires Python 3.11')
+        await writer.start_tls(https, server_hostname=self.host)
+        return reader, writer
+
+    def clear(self):
+        """
+        Close every idle connection.
+        """
+        idle, self._idle = self._idle, []
+        for _, writer, _ in idle:
+            writer.close()
+
+
+async def _read_head(reader):
+    """
+    Read a response's status line and headers. Returns
+    ``(version, status, reason, headers)``.
+    """
+    line = await reader.readline()
+    if not line:
+        raise ConnectionResetError('Connection closed by the server')
+    version, status, reason = (
+        line.decode('latin-1').rstrip('\r\n').split(' ', 2) + ['']
+    )[:3]
+    lines = []
+    while True:
+        line = await reader.readline()
+        if line in (b'\r\n', b'\n', b''):
+            break
+        lines.append(line)
+    headers = parse_headers(BytesIO(b''.join(lines) + b'\r\n'))
+    return version, int(status), reason, headers
+
+
+async def _read_body(reader, version, headers, method, status):
+    """
+    Read a response's body. Returns ``(body, will_close)``.
+    """
+    will_close = (
+        headers.get('Connection', '').lower() == 'close' or
+        version == 'HTTP/1.0'
+    )
+    if method == 'HEAD' or status in (204, 304) or 100 <= status < 200:
+        return b'', will_close
+
+    if headers.get('Transfer-Encoding', '').lower() == 'chunked':
+        chunks = []
+        while True:
+            size = int((await reader.readline()).split(b';')[0], 16)
+            if not size:
+                break
+            chunks.append(await reader.readexactly(size))
+            await reader.readexactly(2)
+        while (await reader.readline()) not in (b'\r\n', b'\n', b''):
+            pass
+        return b''.join(chunks), will_close
+
+    length = headers.get('Content-Length')
+    if length is not None:
+        return await reader.readexactly(int(length)), will_close
+    return await reader.read(), True
+
+
+class AsyncHTTPTransport(HTTPTransport):
+    """
+    Non-blocking counterpart of :class:`geopy.transport.HTTPTransport`
+    built on :mod:`asyncio` streams. Calling it returns a coroutine.
+
+    Connections are kept alive and pooled per host, with at most ``limit``
+    open per host at any time, so thousands of lookups can be in flight
+    on one event loop without exhausting sockets. A transport should be
+    used from a single event loop.
+    """
+
+    def __init__(
+            self,
+            headers=None,
+            proxies=None,
+            auth=None,
+            limit=DEFAULT_CONNECTION_LIMIT,
+            maxsize=DEFAULT_POOL_SIZE,
+            idle_timeout=DEFAULT_IDLE_TIMEOUT,
+            max_redirects=DEFAULT_MAX_REDIRECTS
+        ): # pylint: disable=R0913
+        """
+        :param dict headers: Headers sent with every request, unless the
+            request overrides them.
+
+        :param dict proxies: Proxy per url scheme, as for
+            :class:`geopy.transport.HTTPTransport`.
+
+        :param tuple auth: (username, password) sent as HTTP simple
+            authentication with every request.
+
+        :param int limit: Maximum number of connections open to one host.
+
+        :param int maxsize: Maximum number of idle connections kept per
+            host.
+
+        :param int idle_timeout: Seconds after which an idle connection is
+            closed rather than reused.
+
+        :param int max_redirects: Number of redirects followed before
+            giving up.
+        """
+        super(AsyncHTTPTransport, self).__init__(
+            headers=headers,
+            proxies=proxies,
+            auth=auth,
+            max_redirects=max_redirects,
+        )
+        self.limit = limit
+        self.maxsize = maxsize
+        self.idle_timeout = idle_timeout
+        self.pools = {}
+        self.ssl_context = ssl.create_default_context()
+
+    def connection_pool(self, scheme, host, port=None, proxy=None):
+        """
+        Get or create the pool for a host, optionally reached through
+        a proxy.
+        """
+        if proxy is not None and scheme == 'http':
+            host = port = None
+        key = (scheme, host, port, proxy)
+        pool = self.pools.get(key)
+        if pool is None:
+            pool = self.pools[key] = AsyncConnectionPool(
+                scheme,
+                host,
+                port,
+                limit=self.limit,
+                maxsize=self.maxsize,
+                idle_timeout=self.idle_timeout,
+                proxy=proxy,
+                ssl_context=self.ssl_context,
+            )
+        return pool
+
+    def clear(self):
+        """
+        Close every idle connection.
+        """
+        for pool in self.pools.values():
+            pool.clear()
+
+    async def __call__(self, req, timeout=None):
+        """
+        Perform ``req``, a url or ``Request``. Raises ``HTTPError`` and
+        ``URLError`` like :class:`geopy.transport.HTTPTransport`.
+        """
+        try:
+            return await asyncio.wait_for(self._call(req), timeout)
+        except asyncio.TimeoutError:
+            raise URLError(socket.timeout('timed out'))
+
+    async def _call(self, req):
+        """
+        Perform ``req``, following redirects.
+        """
+        url, method, data, headers = self._prepare(req)
+        redirect = None
+        for _ in range(self.max_redirects + 1):
+            response = await self._request(url, method, data, headers)
+            redirect = self._redirect(url, method, data, response)
+            if redirect is None:
+                break
+            headers = self._redirect_headers(url, redirect[0], headers)
+            url, method, data = redirect
+        self._raise_for_status(url, response, redirected=redirect is not None)
+        return response
+
+    async def _request(self, url, method, data, headers): # pylint: disable=W0221
+        """
+        Send a single request over a pooled connection.
+        """
+        parsed = urlparse(url)
+        path = parsed.path or '/'
+        if parsed.query:
+            path = '?'.join((path, parsed.query))
+        proxy = self._proxy_for(parsed.scheme, parsed.hostname)
+        scheme, host, port = _origin(parsed)
+        pool = self.connection_pool(scheme, host, port, proxy=proxy)
+        headers = _merge_headers(
+            {'Host': parsed.netloc.rpartition('@')[2]}, headers
+        )
+        if proxy is not None and parsed.scheme == 'http':
+            path = url
+            headers = _merge_headers(headers, pool.proxy_headers)
+        if data is not None:
+            headers = _merge_headers(
+                headers, {'Content-Length': str(len(data))}
+            )
+
+        head = ['%s %s HTTP/1.1' % (method, path)]
+        head.extend('%s: %s' % item for item in headers.items())
+        message = ('\r\n'.join(head) + '\r\n\r\n').encode('latin-1')
+        if data is not None:
+            message += data
+
+        fresh = False
+        while True:
+            reader, writer, reused = await pool.acquire(fresh)
+            reusable = False
+            try:
+                writer.write(message)
+                version, status, reason, response_headers = await _read_head(
+                    reader
+                )
+                body, will_close = await _read_body(
+                    reader, version, response_headers, method, status
+                )
+                reusable = not will_close
+            except (OSError, asyncio.IncompleteReadError, ValueError) as error:
+                if reused and method in ('GET', 'HEAD'):
+                    # The server dropped an idle keep-alive connection;
+                    # retry once on a fresh one.
+                    fresh = True
+                    continue
+                raise URLError(error)
+            finally:
+                pool.release(reader, writer, reusable)
+            return PooledResponse(url, status, reason, response_headers, body)
+
+
+class DeferredRequest(BaseException):
+    """
+    Raised out of a geocoder method run by :class:`.AsyncGeocoder` when it
+    needs a response that has not been fetched yet. It derives from
+    ``BaseException`` so that it passes through the geocoder's own error
+    handling untouched.
+    """
+
+    def __init__(self, key, requester, request, timeout, kwargs):
+        super(DeferredRequest, self).__init__(key)
+        self.key = key
+        self.requester = requester
+        self.request = request
+        self.timeout = timeout
+        self.kwargs = kwargs
+
+
+class DeferredCacheLookup(BaseException):
+    """
+    Raised out of a geocoder method run by :class:`.AsyncGeocoder` when it
+    looks up a response in a cache which may block, such as a
+    :class:`geopy.cache.SQLiteCache`, so that the lookup is made in the
+    loop's default executor.
+    """
+
+    def __init__(self, cache, key):
+        super(DeferredCacheLookup, self).__init__(key)
+        self.cache = cache
+        self.key = key
+
+
+class _DeferredCache(object):
+    """
+    Stand-in for a geocoder's ``cache`` while a method is being run by
+    :class:`.AsyncGeocoder`: each response is looked up once per call,
+    however many times the method is run, and caches which may block are
+    read and written in the loop's default executor.
+    """
+
+    def __init__(self, lookups, writes, cache):
+        self.lookups = lookups
+        self.writes = writes
+        self.cache = cache
+
+    def get(self, key):
+        """
+        The response cached for ``key``, or None.
+        """
+        name = (id(self.cache), key)
+        if name in self.lookups:
+            return self.lookups[name]
+        if getattr(self.cache, 'blocking', True):
+            raise DeferredCacheLookup(self.cache, key)
+        page = self.lookups[name] = self.cache.get(key)
+        return page
+
+    def set(self, key, value):
+        """
+        Cache ``value`` for ``key``, once per call.
+        """
+        name = (id(self.cache), key)
+        if name in self.writes:
+            return
+        if getattr(self.cache, 'blocking', True):
+            self.writes[name] = (self.cache, key, value)
+        else:
+            self.writes[name] = None
+            self.cache.set(key, value)
+
+
+class AsyncGeocoder(object):
+    """
+    Asynchronous front end for any geocoder::
+
+        >>> from geopy.geocoders import AsyncGeocoder, Nominatim
+        >>> geolocator = AsyncGeocoder(Nominatim())
+        >>> location = await geolocator.geocode("175 5th Avenue NYC")
+
+    The wrapped geocoder's own methods build the request url and parse the
+    response, exactly as they do when called synchronously; only the HTTP
+    exchange is moved onto the event loop. This works by running the
+    method, and whenever it asks for a response that has not been fetched
+    yet, suspending it, awaiting the request on :class:`.AsyncHTTPTransport`,
+    and running the method again with the response available. Requests
+    made with a custom ``requester`` (e.g. :class:`.YahooPlaceFinder`'s
+    ``requests``) are run in the loop's default executor instead, as are
+    the lookups and writes of a cache which may block, such as a
+    :class:`geopy.cache.SQLiteCache`.
+
+    A method is thus run once more for every request it makes. The wrapped
+    geocoder must let :class:`.DeferredRequest` through: its code must not
+    catch ``BaseException``, and its ``finally`` blocks run on every run.
+
+    Many coroutines may share one ``AsyncGeocoder``.
+    """
+
+    def __init__(self, geocoder, transport=None):
+        """
+        :param geocoder: A configured geocoder instance, e.g.
+            ``Nominatim()``.
+
+        :param transport: :class:`.AsyncHTTPTransport` to send requests
+            with. By default one is created with the geocoder's headers,
+            proxies and credentials.
+        """
+        self.geocoder = geocoder
+        if transport is None:
+            sync_transport = geocoder.urlopen
+            transport = AsyncHTTPTransport(
+                headers=getattr(sync_transport, 'headers', geocoder.headers),
+                proxies=getattr(sync_transport, 'proxies', geocoder.proxies),
+                auth=getattr(sync_transport, 'auth', None),
+            )
+        self.transport = transport
+        # Requests in progress, by url, shared when the geocoder has a
+        # single_flight.
+        self._in_flight = {}
+
+    async def geocode(self, *args, **kwargs):
+        """
+        Coroutine version of the wrapped geocoder's ``geocode``; takes the
+        same arguments.
+        """
+        return await self.run(self.geocoder.geocode, *args, **kwargs)
+
+    async def reverse(self, *args, **kwargs):
+        """
+        Coroutine version of the wrapped geocoder's ``reverse``; takes the
+        same arguments.
+        """
+        return await self.run(self.geocoder.reverse, *args, **kwargs)
+
+    async def run(self, method, *args, **kwargs):
+        """
+        Run any method of the wrapped geocoder which makes requests through
+        ``_call_geocoder``, e.g. ``GoogleV3.timezone``, without blocking
+        the event loop.
+        """
+        loop = asyncio.get_event_loop()
+        responses = {}
+        # API keys drawn from key pools, reused by every run.
+        keys = {}
+        # Cache lookups and writes, made once by every run.
+        lookups = {}
+        writes = {}
+        while True:
+            counts = {}
+            state = base._deferred # pylint: disable=W0212
+            previous = (
+                getattr(state, 'requester', None),
+                getattr(state, 'cache', None),
+                getattr(state, 'keys', None),
+            )
+            state.requester = partial(self._replay, responses, counts)
+            state.cache = partial(_DeferredCache, lookups, writes)
+            state.keys = keys
+            try:
+                return method(*args, **kwargs)
+            except DeferredRequest as deferred:
+                pending = deferred
+            except DeferredCacheLookup as lookup:
+                pending = lookup
+            finally:
+                state.requester, state.cache, state.keys = previous
+                await self._write(loop, writes)
+
+            if isinstance(pending, DeferredCacheLookup):
+                lookups[(id(pending.cache), pending.key)] = (
+                    await loop.run_in_executor(
+                        None, pending.cache.get, pending.key
+                    )
+                )
+                continue
+            try:
+                responses[pending.key] = (
+                    await self._fetch_shared(pending), None
+                )
+            except Exception as error: # pylint: disable=W0703
+                responses[pending.key] = (None, error)
+
+    @staticmethod
+    async def _write(loop, writes):
+        """
+        Make the cache writes queued by a run of a method.
+        """
+        for name, write in list(writes.items()):
+            if write is not None:
+                cache, key, value = write
+                writes[name] = None
+                await loop.run_in_executor(None, cache.set, key, value)
+
+    @staticmethod
+    def _replay(responses, counts, requester, req, timeout=None, **kwargs):
+        """
+        Stand-in for the requester while a method is being run: answer
+        with the response fetched on a previous run, or defer.
+        """
+        if hasattr(req, 'get_full_url'):
+            key = (req.get_full_url(), req.data)
+        else:
+            key = (req, None)
+        key += (repr(sorted(kwargs.items())), )
+        # Identical requests made several times in one run, e.g. retries,
+        # are told apart by their position.
+        count = counts.get(key, 0)
+        counts[key] = count + 1
+        key += (count, )
+
+        if key not in responses:
+            raise DeferredRequest(key, requester, req, timeout, kwargs)
+        page, error = responses[key]
+        if error is not None:
+            raise error
+        if isinstance(page, PooledResponse):
+            # The body may have been read by a previous run.
+            page = PooledResponse(
+                page.url, page.status, page.reason, page.headers, page.content
+            )
+        return page
+
+    async def _fetch_shared(self, deferred):
+        """
+        Perform a deferred request, or, if the geocoder has a
+        ``single_flight``, wait for an identical one in progress.
+        """
+        single_flight = self.geocoder.single_flight
+        if single_flight is None:
+            return await self._fetch(deferred)
+        # Leave out the position of the request within its run.
+        key = deferred.key[:-1]
+        task = self._in_flight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch(deferred))
+            self._in_flight[key] = task
+            task.add_done_callback(lambda _: self._in_flight.pop(key, None))
+        else:
+            single_flight._count_shared() # pylint: disable=W0212
+        # Shielded, so that a cancelled caller does not cancel the others.
+        return await asyncio.shield(task)
+
+    async def _fetch(self, deferred):
+        """
+        Perform a deferred request, waiting for the geocoder's rate limiter
+        and retrying as its retry policy allows.
+
+        The rate limiter and circuit breaker may block, on a lock or on the
+        database of a :class:`geopy.ratelimit.SQLiteRateLimiter`, so they
+        are called in the loop's default executor.
+        """
+        loop = asyncio.get_event_loop()
+        geocoder = self.geocoder
+        policy = geocoder.retry_policy
+        breaker = geocoder.circuit_breaker
+        url = deferred.request
+        if hasattr(url, 'get_full_url'):
+            url = url.get_full_url()
+        started = time()
+        attempt = 1
+        while True:
+            trial = breaker is not None and await loop.run_in_executor(
+                None, breaker.before, url
+            )
+            try:
+                delay = await loop.run_in_executor(
+                    None, geocoder._reserve, url # pylint: disable=W0212
+                )
+                if delay > 0:
+                    await asyncio.sleep(delay)
+            except BaseException:
+                if trial:
+                    breaker.cancel(url)
+                raise
+            outcome = None
+            try:
+                page = await self._send(deferred)
+            except asyncio.CancelledError as error:
+                outcome = error
+                raise
+            except Exception as error: # pylint: disable=W0703
+                outcome = error
+                if not isinstance(error, GeopyError):
+                    try:
+                        geocoder._raise_geocoder_error(error) # pylint: disable=W0212
+                    except GeopyError as mapped:
+                        outcome = mapped
+                delay = None
+                if policy is not None:
+                    delay = policy.delay(outcome, attempt, started)
+                if delay is None:
+                    raise
+            except BaseException as error:
+                outcome = error
+                raise
+            finally:
+                recorded = None
+                if breaker is None:
+                    pass
+                elif isinstance(outcome, asyncio.CancelledError) or not (
+                        isinstance(outcome, Exception) or outcome is None
+                ):
+                    # Cancelled by the caller, which says nothing of the
+                    # service: let the next request be the trial.
+                    if trial:
+                        breaker.cancel(url)
+                else:
+                    recorded = loop.run_in_executor(
+                        None, breaker.record, url, outcome
+                    )
+            if recorded is not None:
+                await recorded
+            if outcome is None:
+                return page
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def _send(self, deferred):
+        """
+        Perform a deferred request once.
+        """
+        if isinstance(deferred.requester, HTTPTransport) and not deferred.kwargs:
+            return await self.transport(deferred.request, timeout=deferred.timeout)
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(None, partial(
+            deferred.requester,
+            deferred.request,
+            timeout=deferred.timeout,
+            **deferred.kwargs
+        ))
@@ -0,0 +1,478 @@
+"""
+Caches of geocoder responses.
+
+A geocoder uses a cache once it is assigned to its ``cache`` attribute::
+
+    >>> from geopy.cache import LRUCache
+    >>> from geopy.geocoders import Nominatim
+    >>> geolocator = Nominatim()
+    >>> geolocator.cache = LRUCache(maxsize=10000, ttl=24 * 3600)
+
+Responses are then looked up by request url, with credentials such as API
+keys left out, before going to the network, and repeated queries are parsed
+from the cached response into new :class:`geopy.location.Location` objects.
+
+To share one cache between every geocoder of a process, set it on the base
+class instead::
+
+    >>> from geopy.cache import SQLiteCache
+    >>> from geopy.geocoders.base import Geocoder
+    >>> Geocoder.cache = SQLiteCache('/var/cache/geopy.sqlite')
+
+Identical requests made at the same time, before any of them is cached,
+can share a single request through a :class:`.SingleFlight`::
+
+    >>> from geopy.cache import SingleFlight
+    >>> Geocoder.single_flight = SingleFlight()
+
+.. versionadded:: 1.12.0
+"""
+
+import os
+import threading
+from collections import OrderedDict
+from time import time
+
+try:
+    import sqlite3
+    sqlite3_available = True
+except ImportError: # pragma: no cover
+    sqlite3_available = False
+
+from geopy.compat import urlparse
+from geopy.point import Point
+from geopy.util import logger
+
+
+__all__ = (
+    "LRUCache",
+    "SQLiteCache",
+    "ReverseCache",
+    "SingleFlight",
+)
+
+
+class LRUCache(object):
+    """
+    In-memory cache holding at most ``maxsize`` responses, evicting the
+    least recently used first. Responses older than ``ttl`` seconds, if
+    given, are discarded on access. It may be shared by several geocoders
+    and threads.
+
+    ``hits`` and ``misses`` count lookups since the cache was created.
+    """
+
+    # Lookups never wait, so :class:`geopy.aio.AsyncGeocoder` makes them
+    # on the event loop.
+    blocking = False
+
+    def __init__(self, maxsize=1024, ttl=None):
+        """
+        :param int maxsize: Maximum number of responses kept.
+
+        :param float ttl: Seconds after which a response is stale. By
+            default responses never expire.
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        """
+        The response cached for ``key``, or None.
+        """
+        with self._lock:
+            try:
+                value, expires = self._data.pop(key)
+            except KeyError:
+                self.misses += 1
+                return None
+            if expires is not None and expires < time():
+                self.misses += 1
+                return None
+            # Re-inserting marks the entry as the most recently used.
+            self._data[key] = (value, expires)
+            self.hits += 1
+            return value
+
+    def set(self, key, value):
+        """
+        Cache ``value`` for ``key``.
+        """
+        expires = time() + self.ttl if self.ttl is not None else None
+        with self._lock:
+            self._data.pop(key, None)
+            self._data[key] = (value, expires)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self):
+        """
+        Remove every response.
+        """
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self):
+        return len(self._data)
+
+    def __contains__(self, key):
+        return key in self._data
+
+
+class SQLiteCache(object):
+    """
+    Persistent cache of raw responses in an SQLite database, which any
+    number of processes and threads may use at once.
+
+    The database is opened in write-ahead-log mode, so readers never wait
+    for writers. Each response is kept for the time to live of the service
+    it came from, identified by the host name of its url, e.g.
+    ``maps.googleapis.com``. When the responses grow beyond ``max_size``
+    bytes, the least recently used are removed. Expired responses are
+    removed along with them.
+
+    ``hits`` and ``misses`` count lookups made by this instance.
+    """
+
+    # Lookups may wait for a lock held by another process, so
+    # :class:`geopy.aio.AsyncGeocoder` makes them in an executor.
+    blocking = True
+
+    # Check the size of the cache once every this many new responses.
+    EVICTION_INTERVAL = 100
+
+    # Record when a response was last used at most this often, in seconds,
+    # so that most lookups only read the database.
+    ACCESS_INTERVAL = 60
+
+    def __init__(
+            self,
+            path,
+            ttl=None,
+            ttls=None,
+            max_size=None,
+            timeout=30
+        ): # pylint: disable=R0913
+        """
+        :param string path: Database file. It is created if missing.
+
+        :param float ttl: Seconds after which a response is stale. By
+            default responses never expire.
+
+        :param dict ttls: Time to live of the responses of particular
+            services, by host name, overriding ``ttl``. E.g.,
+            {"maps.googleapis.com": 30 * 24 * 3600}.
+
+        :param int max_size: Maximum total size of the responses, in bytes.
+            By default the cache grows without bound.
+
+        :param float timeout: Seconds to wait for another process holding a
+            lock on the database.
+        """
+        if not sqlite3_available: # pragma: no cover
+            raise ImportError(
+                'sqlite3 is needed for SQLiteCache; Python was built '
+                'without it.'
+            )
+        self.path = path
+        self.ttl = ttl
+        self.ttls = ttls or {}
+        self.max_size = max_size
+        self.timeout = timeout
+        self.hits = 0
+        self.misses = 0
+        self._writes = 0
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._connect()
+
+    def _connect(self):
+        """
+        This thread's connection to the database. Connections are not
+        shared between threads, nor inherited by forked processes.
+        """
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None and self._local.pid == os.getpid():
+            return conn
+        conn = sqlite3.connect(
+            self.path, timeout=self.timeout, isolation_level=None
+        )
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('PRAGMA synchronous=NORMAL')
+        conn.execute(
+            'CREATE TABLE IF NOT EXISTS responses ('
+            ' key TEXT PRIMARY KEY,'
+            ' host TEXT NOT NULL,'
+            ' value TEXT NOT NULL,'
+            ' size INTEGER NOT NULL,'
+            ' expires REAL,'
+            ' accessed REAL NOT NULL)'
+        )
+        conn.execute(
+            'CREATE INDEX IF NOT EXISTS responses_accessed'
+            ' ON responses (accessed)'
+        )
+        self._local.conn = conn
+        self._local.pid = os.getpid()
+        return conn
+
+    def get(self, key):
+        """
+        The response cached for ``key``, or None.
+        """
+        now = time()
+        try:
+            conn = self._connect()
+            row = conn.execute(
+                'SELECT value, expires, accessed FROM responses WHERE key = ?',
+                (key, )
+            ).fetchone()
+            if row is not None and row[1] is not None and row[1] < now:
+                # Left for evict() to remove.
+                row = None
+            if row is not None and now - row[2] >= self.ACCESS_INTERVAL:
+                conn.execute(
+                    'UPDATE responses SET accessed = ? WHERE key = ?',
+                    (now, key)
+                )
+        except sqlite3.Error as error:
+            logger.debug("SQLiteCache.get failed: %s", error)
+            row = None
+        with self._lock:
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        return row[0]
+
+    def set(self, key, value):
+        """
+        Cache ``value`` for ``key``.
+        """
+        now = time()
+        host = urlparse(key).hostname or ''
+        ttl = self.ttls.get(host, self.ttl)
+        expires = now + ttl if ttl is not None else None
+        try:
+            conn = self._connect()
+            conn.execute(
+                'INSERT OR REPLACE INTO responses'
+                ' (key, host, value, size, expires, accessed)'
+                ' VALUES (?, ?, ?, ?, ?, ?)',
+                (key, host, value, len(value.encode('utf-8')), expires, now)
+            )
+            with self._lock:
+                self._writes += 1
+                evict = self._writes % self.EVICTION_INTERVAL == 0
+        except sqlite3.Error as error:
+            logger.debug("SQLiteCache.set failed: %s", error)
+            return
+        if evict:
+            try:
+                self.evict()
+            except sqlite3.Error as error:
+                # Unlike a missed write, this lets the cache outgrow
+                # max_size.
+                logger.warning("SQLiteCache.evict failed: %s", error)
+
+    def evict(self):
+        """
+        Remove expired responses, then the least recently used ones while
+        the cache is larger than ``max_size``.
+        """
+        conn = self._connect()
+        conn.execute(
+            'DELETE FROM responses WHERE expires IS NOT NULL AND expires < ?',
+            (time(), )
+        )
+        if self.max_size is None:
+            return
+        excess = conn.execute(
+            'SELECT COALESCE(SUM(size), 0) FROM responses'
+        ).fetchone()[0] - self.max_size
+        keys = []
+        rows = conn.execute(
+            'SELECT key, size FROM responses ORDER BY accessed, key DESC'
+        )
+        for key, size in rows:
+            if excess <= 0:
+                break
+            keys.append((key, ))
+            excess -= size
+        rows.close()
+        if keys:
+            conn.executemany('DELETE FROM responses WHERE key = ?', keys)
+
+    def clear(self):
+        """
+        Remove every response.
+        """
+        self._connect().execute('DELETE FROM responses')
+
+    def __len__(self):
+        return self._connect().execute(
+            'SELECT COUNT(*) FROM responses'
+        ).fetchone()[0]
+
+    def __contains__(self, key):
+        return self._connect().execute(
+            'SELECT 1 FROM responses WHERE key = ?', (key, )
+        ).fetchone() is not None
+
+
+class _Flight(object): # pylint: disable=R0903
+    """
+    A call in progress, and its outcome once done.
+    """
+
+    __slots__ = ("result", "error", "done")
+
+    def __init__(self):
+        self.result = None
+        self.error = None
+        self.done = threading.Event()
+
+
+class SingleFlight(object):
+    """
+    Coalesces identical calls made concurrently: while a call with a given
+    key is in progress, further calls with the same key wait for it and
+    get its result, or its exception, instead of making their own.
+
+    A geocoder with a ``single_flight`` makes its requests through it,
+    keyed by url and transport, so that threads geocoding the same address
+    at the same moment send one request between them and parse the same
+    response. Geocoders with transports of their own, and so possibly
+    other credentials or proxies, never share requests, even when they
+    share a ``SingleFlight``. :class:`geopy.aio.AsyncGeocoder` coalesces
+    the requests of concurrent coroutines likewise.
+
+    Requests made with different API keys differ in their url, so
+    geocoders drawing a key from a :class:`geopy.keypool.KeyPool` for
+    each call rarely share them.
+
+    ``shared`` counts the calls answered by another's.
+    """
+
+    def __init__(self):
+        self.shared = 0
+        self._flights = {}
+        self._lock = threading.Lock()
+
+    def _count_shared(self):
+        """
+        Count a call answered by another's.
+        """
+        with self._lock:
+            self.shared += 1
+
+    def do(self, key, function):
+        """
+        Call ``function`` and return its result, unless a call with the
+        same ``key`` is in progress, in which case wait for its result.
+        """
+        with self._lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = _Flight()
+            else:
+                self.shared += 1
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.result
+        try:
+            flight.result = function()
+        except BaseException as error:
+            flight.error = error
+            raise
+        finally:
+            with self._lock:
+                del self._flights[key]
+            flight.done.set()
+        return flight.result
+
+    def __len__(self):
+        return len(self._flights)
+
+
+class ReverseCache(object):
+    """
+    Reverse geocoding front end which reuses the address found for a
+    nearby point instead of querying the service again.
+
+    Points are snapped to a grid of ``precision`` decimal degrees: with the
+    default of 4, points within about 11 metres of one another share a
+    cell, and only the first point of a cell is sent to the geocoder.
+    Useful for GPS traces, where consecutive fixes a few metres apart
+    resolve to the same address::
+
+        >>> from geopy.cache import ReverseCache
+        >>> geolocator = ReverseCache(Nominatim(), precision=4)
+        >>> addresses = [geolocator.reverse(fix) for fix in trace]
+        >>> geolocator.saved
+        1873
+
+    Other attributes and methods are those of the wrapped geocoder.
+    """
+
+    def __init__(self, geocoder, precision=4, maxsize=1024, ttl=None):
+        """
+        :param geocoder: Geocoder whose ``reverse`` results are cached.
+
+        :param int precision: Number of decimal places coordinates are
+            rounded to.
+
+        :param int maxsize: Maximum number of cells remembered.
+
+        :param float ttl: Seconds after which a cell's address is looked up
+            again. By default they never expire.
+        """
+        self.geocoder = geocoder
+        self.precision = precision
+        self.scale = 10 ** precision
+        self.cache = LRUCache(maxsize=maxsize, ttl=ttl)
+
+    @property
+    def saved(self):
+        """
+        Number of ``reverse`` calls answered without a request.
+        """
+        return self.cache.hits
+
+    def cell(self, query):
+        """
+        The grid cell of a point, as a pair of integers.
+        """
+        if not isinstance(query, (Point, list, tuple)):
+            # Validates the query as the geocoder would.
+            query = self.geocoder._coerce_point_to_string(query) # pylint: disable=W0212
+        point = Point(query)
+        return (
+            int(round(point.latitude * self.scale)),
+            int(round(point.longitude * self.scale)),
+        )
+
+    def reverse(self, query, exactly_one=True, **kwargs):
+        """
+        Reverse geocode ``query``, or return the result of a previous
+        query in the same cell made with the same arguments. Takes the
+        arguments of the wrapped geocoder's ``reverse``.
+        """
+        key = (self.cell(query), exactly_one, tuple(sorted(kwargs.items())))
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached[0]
+        result = self.geocoder.reverse(query, exactly_one=exactly_one, **kwargs)
+        # Wrapped, so that points without an address are cached too.
+        self.cache.set(key, (result, ))
+        return result
+
+    def __getattr__(self, name):
+        return getattr(self.geocoder, name)
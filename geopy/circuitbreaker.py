@@ -0,0 +1,227 @@
+"""
+Failing fast while a geocoding service is down.
+
+A geocoder with a ``circuit_breaker`` stops sending requests once the
+service has failed several times in a row, and raises
+:class:`geopy.exc.GeocoderCircuitOpen` straight away instead of waiting out
+its timeout on every call::
+
+    >>> from geopy.circuitbreaker import CircuitBreaker
+    >>> from geopy.geocoders import Bing
+    >>> geolocator = Bing(api_key)
+    >>> geolocator.circuit_breaker = CircuitBreaker(failures=5, cooldown=30)
+
+After ``cooldown`` seconds, a single trial request is let through: the
+circuit closes again if it succeeds, and stays open for another cool-down
+if it fails. A trial which has not finished within ``trial_timeout``
+seconds is given up on, and another one let through. A breaker set on a
+geocoder class, with ``per_host``, keeps a circuit for each host its
+geocoders talk to::
+
+    >>> Bing.circuit_breaker = CircuitBreaker(per_host=True)
+    >>> Bing.circuit_breaker.states()
+    {'dev.virtualearth.net': 'closed'}
+
+.. versionadded:: 1.12.0
+"""
+
+import threading
+
+from geopy.compat import monotonic, urlparse
+from geopy.exc import (
+    GeopyError,
+    GeocoderCircuitOpen,
+    GeocoderServiceError,
+    GeocoderTimedOut,
+    GeocoderUnavailable,
+)
+
+
+__all__ = (
+    "CircuitBreaker",
+    "Circuit",
+    "CLOSED",
+    "OPEN",
+    "HALF_OPEN",
+    "TRIPPING_ERRORS",
+)
+
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half-open'
+
+# Errors counted as failures of the service. As with retries, they are
+# matched by exact class: a rejected query means the service is up.
+# Requests failing with any other Exception count as failed, too, while
+# requests interrupted by their caller, e.g. by KeyboardInterrupt or by
+# cancelling a coroutine, are not recorded.
+TRIPPING_ERRORS = frozenset(
+    [GeocoderServiceError, GeocoderTimedOut, GeocoderUnavailable]
+)
+
+
+class Circuit(object):
+    """
+    State of one circuit of a :class:`.CircuitBreaker`.
+
+    ``state`` is one of ``CLOSED``, ``OPEN`` or ``HALF_OPEN``; ``failures``
+    counts the consecutive failures of the service, ``trips`` the times the
+    circuit opened, and ``rejected`` the requests refused while open.
+    """
+
+    def __init__(self, failures, cooldown, trial_timeout=60):
+        self.threshold = failures
+        self.cooldown = cooldown
+        self.trial_timeout = trial_timeout
+        self.state = CLOSED
+        self.failures = 0
+        self.trips = 0
+        self.rejected = 0
+        self._opened = None
+        self._trial = None
+        self._lock = threading.Lock()
+
+    def before(self):
+        """
+        Raise :class:`geopy.exc.GeocoderCircuitOpen` unless a request may
+        be sent now. Returns True if the request is the trial.
+        """
+        with self._lock:
+            if self.state == CLOSED:
+                return False
+            now = monotonic()
+            if self.state == OPEN:
+                retry_after = self.cooldown - (now - self._opened)
+            else:
+                # The trial in progress may have been lost.
+                retry_after = self.trial_timeout - (now - self._trial)
+            if retry_after <= 0:
+                # Let this request through as the trial.
+                self.state = HALF_OPEN
+                self._trial = now
+                return True
+            self.rejected += 1
+        error = GeocoderCircuitOpen(
+            'Service failed %d times in a row; not retrying for %.1fs.' % (
+                self.failures, retry_after
+            )
+        )
+        error.retry_after = retry_after
+        raise error
+
+    def cancel(self):
+        """
+        Give back the trial let through by :meth:`before` when its request
+        is not sent after all, so that the next request is the trial.
+        """
+        with self._lock:
+            if self.state == HALF_OPEN:
+                self.state = OPEN
+
+    def record(self, error=None):
+        """
+        Record the outcome of a request: the exception it raised, or None
+        if it succeeded.
+        """
+        with self._lock:
+            if error is None or (
+                    isinstance(error, GeopyError)
+                    and type(error) not in TRIPPING_ERRORS
+            ):
+                self.state = CLOSED
+                self.failures = 0
+                return
+            self.failures += 1
+            if self.state == HALF_OPEN or self.failures >= self.threshold:
+                if self.state != OPEN:
+                    self.trips += 1
+                self.state = OPEN
+                self._opened = monotonic()
+
+
+class CircuitBreaker(object):
+    """
+    Opens after ``failures`` consecutive failures, and lets a trial request
+    through ``cooldown`` seconds later. Thread-safe.
+    """
+
+    def __init__(
+            self,
+            failures=5,
+            cooldown=30,
+            per_host=False,
+            trial_timeout=60
+        ):
+        """
+        :param int failures: Number of consecutive failures which open the
+            circuit.
+
+        :param float cooldown: Seconds the circuit stays open before a
+            trial request.
+
+        :param bool per_host: Keep a circuit for each host, rather than one
+            for every request.
+
+        :param float trial_timeout: Seconds after which a trial request
+            which has not finished is given up on, and another let through.
+        """
+        if failures < 1:
+            raise ValueError("failures must be at least 1")
+        self.failures = failures
+        self.cooldown = cooldown
+        self.per_host = per_host
+        self.trial_timeout = trial_timeout
+        self.circuits = {}
+        self._lock = threading.Lock()
+
+    def circuit(self, url=None):
+        """
+        The :class:`.Circuit` requests to ``url`` go through.
+        """
+        host = urlparse(url).hostname if self.per_host and url else None
+        circuit = self.circuits.get(host)
+        if circuit is None:
+            with self._lock:
+                circuit = self.circuits.get(host)
+                if circuit is None:
+                    circuit = self.circuits[host] = Circuit(
+                        self.failures, self.cooldown, self.trial_timeout
+                    )
+        return circuit
+
+    def before(self, url=None):
+        """
+        Raise :class:`geopy.exc.GeocoderCircuitOpen` unless a request to
+        ``url`` may be sent now. Returns True if the request is the trial.
+        """
+        return self.circuit(url).before()
+
+    def cancel(self, url=None):
+        """
+        Give back the trial request to ``url`` let through by
+        :meth:`before`, which is not sent after all.
+        """
+        self.circuit(url).cancel()
+
+    def record(self, url=None, error=None):
+        """
+        Record the outcome of a request to ``url``: the exception it
+        raised, or None if it succeeded.
+        """
+        self.circuit(url).record(error)
+
+    def state(self, url=None):
+        """
+        State of the circuit of ``url``: ``'closed'``, ``'open'`` or
+        ``'half-open'``.
+        """
+        return self.circuit(url).state
+
+    def states(self):
+        """
+        State of every circuit, by host, or by None without ``per_host``.
+        """
+        with self._lock:
+            circuits = list(self.circuits.items())
+        return dict((host, circuit.state) for host, circuit in circuits)
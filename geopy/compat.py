@@ -11,6 +11,13 @@ if py3k: # pragma: no cover
 else: # pragma: no cover
     string_compare = (str, unicode)
 
+# Clock for measuring intervals, which system clock changes do not affect
+# where Python has one.
+try:
+    from time import monotonic # pylint: disable=W0611,F0401,W0611,E0611
+except ImportError: # pragma: no cover
+    from time import time as monotonic # pylint: disable=W0611,F0401,W0611,E0611
+
 # Unicode compatibility, borrowed from 'six'
 if py3k: # pragma: no cover
     def u(s):
@@ -27,13 +34,22 @@ else: # pragma: no cover
 
 if py3k: # pragma: no cover
     from urllib.parse import (urlencode, quote, # pylint: disable=W0611,F0401,W0611,E0611
-                              urlparse, parse_qs)
+                              urlparse, urljoin, parse_qs, parse_qsl)
     from urllib.request import (Request, urlopen, # pylint: disable=W0611,F0401,W0611,E0611
                                 build_opener, ProxyHandler,
                                 URLError, install_opener,
                                 HTTPPasswordMgrWithDefaultRealm,
-                                HTTPBasicAuthHandler)
+                                HTTPBasicAuthHandler, getproxies,
+                                proxy_bypass)
     from urllib.error import HTTPError # pylint: disable=W0611,F0401,W0611,E0611
+    from http.client import (HTTPConnection, HTTPSConnection, # pylint: disable=W0611,F0401,W0611,E0611
+                             HTTPException)
+    from queue import Queue, Empty # pylint: disable=W0611,F0401,W0611,E0611
+    from base64 import encodebytes # pylint: disable=W0611,F0401,W0611,E0611
+    try:
+        from collections.abc import MutableMapping # pylint: disable=W0611,F0401,W0611,E0611
+    except ImportError: # Python 3.2
+        from collections import MutableMapping # pylint: disable=W0611,F0401,W0611,E0611
 
     def itervalues(d):
         """
@@ -52,12 +68,18 @@ if py3k: # pragma: no cover
 
 else: # pragma: no cover
     from urllib import urlencode as original_urlencode, quote # pylint: disable=W0611,F0401,W0611,E0611
+    from urllib import getproxies, proxy_bypass # pylint: disable=W0611,F0401,W0611,E0611
     from urllib2 import (Request, HTTPError,   # pylint: disable=W0611,F0401,W0611,E0611
                          ProxyHandler, URLError, urlopen,
                          build_opener, install_opener,
                          HTTPPasswordMgrWithDefaultRealm,
                          HTTPBasicAuthHandler)
-    from urlparse import urlparse, parse_qs
+    from urlparse import urlparse, urljoin, parse_qs, parse_qsl
+    from httplib import (HTTPConnection, HTTPSConnection, # pylint: disable=W0611,F0401,W0611,E0611
+                         HTTPException)
+    from Queue import Queue, Empty # pylint: disable=W0611,F0401,W0611,E0611
+    from base64 import encodestring as encodebytes # pylint: disable=W0611,F0401,W0611,E0611
+    from collections import MutableMapping # pylint: disable=W0611,F0401,W0611,E0611
 
     def force_str(str_or_unicode):
         """
@@ -99,3 +121,25 @@ else: # pragma: no cover
         For Python3
         """
         return d.iteritems()
+
+
+# Modules replaced by replace_module, kept alive: Python 2 clears the
+# namespace of a module once it is garbage collected, and their functions
+# still refer to it.
+_replaced_modules = []
+
+
+def replace_module(name, module_type):
+    """
+    Replace the module ``name`` in ``sys.modules`` with an instance of
+    ``module_type``, a subclass of ``types.ModuleType`` with the same
+    namespace. It may define ``__getattr__`` and ``__dir__`` methods, which
+    modules only support as functions from Python 3.7. Call it last in the
+    module, as later assignments do not reach the replacement.
+    """
+    module = sys.modules[name]
+    replacement = module_type(name, module.__doc__)
+    replacement.__dict__.update(module.__dict__)
+    _replaced_modules.append(module)
+    sys.modules[name] = replacement
+    return replacement
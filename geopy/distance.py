@@ -43,6 +43,15 @@ Here's an example usage of distance.vincenty::
     >>> print(vincenty(newport_ri, cleveland_oh).miles)
     538.3904451566326
 
+Geodesic distance (:class:`.geodesic`) uses the same ellipsoidal models,
+solved with the algorithm of Charles Karney, which converges for every pair
+of points, including nearly antipodal ones where Vincenty's formula fails.
+It requires geographiclib (``pip install "geopy[geodesic]"``)::
+
+    >>> from geopy.distance import geodesic
+    >>> print(geodesic(newport_ri, cleveland_oh).miles)
+    538.3904453677203
+
 Using great-circle distance::
 
     >>> from geopy.distance import great_circle
@@ -61,6 +70,15 @@ directly::
 
     >>> distance.vincenty(ne, cl, ellipsoid=(6377., 6356., 1 / 297.)).miles
 
+Whole matrices of distances, from each of some points to each of others,
+are computed by :func:`.distance_matrix`::
+
+    >>> from geopy.distance import distance_matrix
+    >>> points = [newport_ri, cleveland_oh]
+    >>> distance_matrix(points, [cleveland_oh], method='vincenty')
+    array([[866.4554329],
+           [  0.       ]])
+
 Distances support simple arithmetic, making it easy to do things like
 calculate the length of a path::
 
@@ -70,15 +88,60 @@ calculate the length of a path::
     >>> print((d(ne, cl) + d(cl, wa) + d(wa, pa)).miles)
     3276.157156868931
 
+Paths of any length, e.g. GPS tracks, are measured in a single pass by
+``measure_path``, from any iterable of points such as a generator or a file
+reader, without holding them in memory::
+
+    >>> import csv
+    >>> with open('track.csv') as track:
+    ...     rows = csv.DictReader(track)
+    ...     points = ((row['lat'], row['lon']) for row in rows)
+    ...     print(distance.vincenty().measure_path(points).km)
+    42.19496209331383
+
+while ``segments`` yields the length of each of its segments in turn.
+
+Many distances at once are computed by ``measure_many``, which takes
+columns of coordinates rather than points. It is vectorized with NumPy when
+it is installed (``pip install "geopy[numpy]"``)::
+
+    >>> import numpy
+    >>> lats = numpy.array([41.49008, 38.89037])
+    >>> lngs = numpy.array([-71.312796, -77.03196])
+    >>> great_circle().measure_many(lats, lngs, 41.499498, -81.695391)
+    array([ 864.21449434,  490.85847333])
+
 """
 from __future__ import division
 
+from array import array
+from copy import copy
 from math import atan, tan, sin, cos, pi, sqrt, atan2, asin
+from math import radians as to_radians
 from geopy.units import radians
 from geopy import units, util
-from geopy.point import Point
+from geopy.util import NUMBER_TYPES
+from geopy.point import Point, PointArray
 from geopy.compat import string_compare
 
+try:
+    from importlib.util import find_spec
+except ImportError: # pragma: no cover
+    try:
+        import numpy
+        numpy_available = True
+    except ImportError:
+        numpy_available = False
+else:
+    # As in geopy.point, NumPy is only imported once it is used.
+    numpy_available = find_spec('numpy') is not None
+
+try:
+    from geographiclib.geodesic import Geodesic
+    geographiclib_available = True
+except ImportError:
+    geographiclib_available = False
+
 # IUGG mean earth radius in kilometers, from
 # https://en.wikipedia.org/wiki/Earth_radius#Mean_radius.  Using a
 # sphere with this radius results in an error of up to about 0.5%.
@@ -101,6 +164,57 @@ ELLIPSOIDS = {
     'GRS-67':        (6378.1600, 6356.774719, 1 / 298.25)
 }
 
+
+def _lat_lng(point):
+    """
+    Latitude and longitude of a point, in degrees.
+
+    Points, and tuples of numbers within range, are read directly; other
+    values, e.g. strings, are parsed and normalized by :class:`.Point`.
+    """
+    if isinstance(point, Point):
+        return point.latitude, point.longitude
+    if isinstance(point, tuple) and 2 <= len(point) <= 3:
+        latitude, longitude = point[0], point[1]
+        if (
+                isinstance(latitude, NUMBER_TYPES) and
+                isinstance(longitude, NUMBER_TYPES) and
+                -90 <= latitude <= 90 and
+                -180 <= longitude <= 180 and
+                (len(point) == 2 or isinstance(point[2], NUMBER_TYPES))
+        ):
+            return latitude, longitude
+    point = Point(point)
+    return point.latitude, point.longitude
+
+
+def _radians(point):
+    """
+    Latitude and longitude of a point, in radians.
+    """
+    latitude, longitude = _lat_lng(point)
+    return to_radians(latitude), to_radians(longitude)
+
+
+def _central_angle( # pylint: disable=W0621,R0913
+        lat1, lng1, lat2, lng2, sin=sin, cos=cos, sqrt=sqrt, atan2=atan2
+    ):
+    """
+    Angle, in radians, between two points given in radians. The trigonometric
+    functions may be replaced by NumPy's to compute many angles at once.
+    """
+    sin_lat1, cos_lat1 = sin(lat1), cos(lat1)
+    sin_lat2, cos_lat2 = sin(lat2), cos(lat2)
+
+    delta_lng = lng2 - lng1
+    cos_delta_lng, sin_delta_lng = cos(delta_lng), sin(delta_lng)
+
+    return atan2(sqrt((cos_lat2 * sin_delta_lng) ** 2 +
+                      (cos_lat1 * sin_lat2 -
+                       sin_lat1 * cos_lat2 * cos_delta_lng) ** 2),
+                 sin_lat1 * sin_lat2 + cos_lat1 * cos_lat2 * cos_delta_lng)
+
+
 class Distance(object):
     """
     Base for :class:`.great_circle` and :class:`.vincenty`.
@@ -108,16 +222,22 @@ class Distance(object):
 
     def __init__(self, *args, **kwargs):
         kilometers = kwargs.pop('kilometers', 0)
-        if len(args) == 1:
+        if len(args) == 1 and isinstance(args[0], PointArray):
+            # The points of a path, as measure_path takes them.
+            for segment in self.segments(args[0]):
+                kilometers += segment
+        elif len(args) == 1:
             # if we only get one argument we assume
             # it's a known distance instead of
             # calculating it first
             kilometers += args[0]
-        elif len(args) > 1:
+        elif len(args) == 2:
+            kilometers += self.measure(args[0], args[1])
+        elif len(args) > 2:
             for a, b in util.pairwise(args):
                 kilometers += self.measure(a, b)
 
-        kilometers += units.kilometers(**kwargs)
+        kilometers += units.kilometers(**kwargs) if kwargs else 0.
         self.__kilometers = kilometers
 
     def __add__(self, other):
@@ -159,6 +279,35 @@ class Distance(object):
         """
         raise NotImplementedError()
 
+    def segments(self, points):
+        """
+        Yield the length, in kilometers, of each segment of the path through
+        ``points``, as it is read.
+
+        ``points`` may be any iterable, e.g. a generator or a database
+        cursor; it is read once, and only two of its points are held at a
+        time.
+
+        .. versionadded:: 1.12.0
+        """
+        for a, b in util.pairwise(points):
+            yield self.measure(a, b)
+
+    def measure_path(self, points):
+        """
+        Length of the path through ``points``, as a distance of this
+        class with the same ellipsoid or radius, read in a single pass in
+        constant memory. See :meth:`segments`.
+
+        .. versionadded:: 1.12.0
+        """
+        kilometers = 0
+        for segment in self.segments(points):
+            kilometers += segment
+        result = copy(self)
+        result.__kilometers = kilometers
+        return result
+
     def __repr__(self): # pragma: no cover
         return 'Distance(%s)' % self.kilometers
 
@@ -238,23 +387,56 @@ class great_circle(Distance):
         super(great_circle, self).__init__(*args, **kwargs)
 
     def measure(self, a, b):
-        a, b = Point(a), Point(b)
+        lat1, lng1 = _radians(a)
+        lat2, lng2 = _radians(b)
 
-        lat1, lng1 = radians(degrees=a.latitude), radians(degrees=a.longitude)
-        lat2, lng2 = radians(degrees=b.latitude), radians(degrees=b.longitude)
+        return self.RADIUS * _central_angle(lat1, lng1, lat2, lng2)
 
-        sin_lat1, cos_lat1 = sin(lat1), cos(lat1)
-        sin_lat2, cos_lat2 = sin(lat2), cos(lat2)
+    def measure_many(self, lats1, lngs1, lats2, lngs2):
+        """
+        Distances, in kilometers, between many pairs of points: the i-th
+        distance is from (``lats1[i]``, ``lngs1[i]``) to
+        (``lats2[i]``, ``lngs2[i]``).
 
-        delta_lng = lng2 - lng1
-        cos_delta_lng, sin_delta_lng = cos(delta_lng), sin(delta_lng)
+        Coordinates are in degrees, and are not normalized as
+        :class:`geopy.point.Point` would: latitudes must be within
+        [-90, 90].
+
+        With NumPy installed, the coordinates may be any array-like and
+        are computed on without a Python loop. They are broadcast against
+        each other, so e.g. a single ``lats2`` and ``lngs2`` give the
+        distances from every point to one destination. The result is a
+        NumPy array.
 
-        d = atan2(sqrt((cos_lat2 * sin_delta_lng) ** 2 +
-                       (cos_lat1 * sin_lat2 -
-                        sin_lat1 * cos_lat2 * cos_delta_lng) ** 2),
-                  sin_lat1 * sin_lat2 + cos_lat1 * cos_lat2 * cos_delta_lng)
+        Without NumPy, the coordinates must be sequences of the same
+        length, and the result is an ``array.array('d')``.
 
-        return self.RADIUS * d
+        The columns of a :class:`geopy.point.PointArray` may be given
+        directly, e.g. ``measure_many(a.latitudes, a.longitudes,
+        b.latitudes, b.longitudes)``.
+
+        .. versionadded:: 1.12.0
+        """
+        if numpy_available:
+            import numpy # pylint: disable=W0621
+            lat1, lng1, lat2, lng2 = (
+                numpy.radians(numpy.asarray(coordinates, dtype=float))
+                for coordinates in (lats1, lngs1, lats2, lngs2)
+            )
+            return self.RADIUS * _central_angle(
+                lat1, lng1, lat2, lng2, sin=numpy.sin, cos=numpy.cos,
+                sqrt=numpy.sqrt, atan2=numpy.arctan2
+            )
+
+        if not len(lats1) == len(lngs1) == len(lats2) == len(lngs2):
+            raise ValueError("Coordinate sequences differ in length.")
+        return array('d', (
+            self.RADIUS * _central_angle(
+                radians(degrees=lat1), radians(degrees=lng1),
+                radians(degrees=lat2), radians(degrees=lng2)
+            )
+            for lat1, lng1, lat2, lng2 in zip(lats1, lngs1, lats2, lngs2)
+        ))
 
     def destination(self, point, bearing, distance=None): # pylint: disable=W0621
         """
@@ -318,10 +500,12 @@ class vincenty(Distance):
     ellipsoid_key = None
     ELLIPSOID = None
 
+    # ELLIPSOID, and constants of the formula derived from it.
+    _constants = None
+
     def __init__(self, *args, **kwargs):
         self.set_ellipsoid(kwargs.pop('ellipsoid', 'WGS-84'))
         self.iterations = kwargs.pop('iterations', 20)
-        major, minor, f = self.ELLIPSOID # pylint: disable=W0612
         super(vincenty, self).__init__(*args, **kwargs)
 
     def set_ellipsoid(self, ellipsoid):
@@ -341,24 +525,45 @@ class vincenty(Distance):
             self.ellipsoid_key = None
         return
 
+    def _ellipsoid_constants(self):
+        """
+        (major, minor, f, 1 - f, (major ** 2 - minor ** 2) / minor ** 2) of
+        the ellipsoid, computed again only when ``ELLIPSOID`` changes.
+        """
+        constants = self._constants
+        if constants is None or constants[0] is not self.ELLIPSOID:
+            ellipsoid = self.ELLIPSOID
+            if isinstance(ellipsoid, string_compare):
+                major, minor, f = ELLIPSOIDS[ellipsoid]
+            else:
+                major, minor, f = ellipsoid
+            constants = self._constants = (
+                ellipsoid, major, minor, f, 1 - f,
+                (major ** 2 - minor ** 2) / minor ** 2
+            )
+        return constants[1:]
+
     def measure(self, a, b):
-        a, b = Point(a), Point(b)
-        lat1, lng1 = radians(degrees=a.latitude), radians(degrees=a.longitude)
-        lat2, lng2 = radians(degrees=b.latitude), radians(degrees=b.longitude)
+        lat1, lng1 = _radians(a)
+        lat2, lng2 = _radians(b)
 
-        if isinstance(self.ELLIPSOID, string_compare):
-            major, minor, f = ELLIPSOIDS[self.ELLIPSOID]
-        else:
-            major, minor, f = self.ELLIPSOID
+        major, minor, f, one_minus_f, ecc_sq = self._ellipsoid_constants() # pylint: disable=W0612
 
         delta_lng = lng2 - lng1
 
-        reduced_lat1 = atan((1 - f) * tan(lat1))
-        reduced_lat2 = atan((1 - f) * tan(lat2))
+        reduced_lat1 = atan(one_minus_f * tan(lat1))
+        reduced_lat2 = atan(one_minus_f * tan(lat2))
 
         sin_reduced1, cos_reduced1 = sin(reduced_lat1), cos(reduced_lat1)
         sin_reduced2, cos_reduced2 = sin(reduced_lat2), cos(reduced_lat2)
 
+        # Products which do not change from one iteration to the next.
+        sin_sin_reduced = sin_reduced1 * sin_reduced2
+        cos_cos_reduced = cos_reduced1 * cos_reduced2
+        cos_sin_reduced = cos_reduced1 * sin_reduced2
+        sin_cos_reduced = sin_reduced1 * cos_reduced2
+        f_16 = f / 16.
+
         lambda_lng = delta_lng
         lambda_prime = 2 * pi
 
@@ -372,33 +577,27 @@ class vincenty(Distance):
 
             sin_sigma = sqrt(
                 (cos_reduced2 * sin_lambda_lng) ** 2 +
-                (cos_reduced1 * sin_reduced2 -
-                 sin_reduced1 * cos_reduced2 * cos_lambda_lng) ** 2
+                (cos_sin_reduced - sin_cos_reduced * cos_lambda_lng) ** 2
             )
 
             if sin_sigma == 0:
                 return 0 # Coincident points
 
-            cos_sigma = (
-                sin_reduced1 * sin_reduced2 +
-                cos_reduced1 * cos_reduced2 * cos_lambda_lng
-            )
+            cos_sigma = sin_sin_reduced + cos_cos_reduced * cos_lambda_lng
 
             sigma = atan2(sin_sigma, cos_sigma)
 
-            sin_alpha = (
-                cos_reduced1 * cos_reduced2 * sin_lambda_lng / sin_sigma
-            )
+            sin_alpha = cos_cos_reduced * sin_lambda_lng / sin_sigma
             cos_sq_alpha = 1 - sin_alpha ** 2
 
             if cos_sq_alpha != 0:
                 cos2_sigma_m = cos_sigma - 2 * (
-                    sin_reduced1 * sin_reduced2 / cos_sq_alpha
+                    sin_sin_reduced / cos_sq_alpha
                 )
             else:
                 cos2_sigma_m = 0.0 # Equatorial line
 
-            C = f / 16. * cos_sq_alpha * (4 + f * (4 - 3 * cos_sq_alpha))
+            C = f_16 * cos_sq_alpha * (4 + f * (4 - 3 * cos_sq_alpha))
 
             lambda_prime = lambda_lng
             lambda_lng = (
@@ -414,7 +613,7 @@ class vincenty(Distance):
         if i > iter_limit:
             raise ValueError("Vincenty formula failed to converge!")
 
-        u_sq = cos_sq_alpha * (major ** 2 - minor ** 2) / minor ** 2
+        u_sq = cos_sq_alpha * ecc_sq
 
         A = 1 + u_sq / 16384. * (
             4096 + u_sq * (-768 + u_sq * (320 - 175 * u_sq))
@@ -439,6 +638,168 @@ class vincenty(Distance):
         s = minor * A * (sigma - delta_sigma)
         return s
 
+    def measure_many(
+            self, lats1, lngs1, lats2, lngs2, return_failed=False
+        ): # pylint: disable=R0913
+        """
+        Distances, in kilometers, between many pairs of points: the i-th
+        distance is from (``lats1[i]``, ``lngs1[i]``) to
+        (``lats2[i]``, ``lngs2[i]``). See
+        :meth:`geopy.distance.great_circle.measure_many` for how
+        coordinates are given.
+
+        Rather than raising ``ValueError`` for the whole batch, pairs the
+        formula does not converge for within ``iterations`` get a distance
+        of NaN. With ``return_failed``, ``(distances, failed)`` is returned
+        instead, where ``failed`` holds the flat indices of those pairs;
+        pairs with NaN coordinates get a distance of NaN without being
+        listed::
+
+            >>> distances, failed = vincenty().measure_many(
+            ...     [0, 10], [0, 10], [0, 10], [180, 11], return_failed=True)
+            >>> failed.tolist()
+            [0]
+
+        With NumPy installed all pairs are iterated on together, and those
+        which have converged are masked out of further iterations.
+
+        .. versionadded:: 1.12.0
+        """
+        if not numpy_available:
+            if not len(lats1) == len(lngs1) == len(lats2) == len(lngs2):
+                raise ValueError("Coordinate sequences differ in length.")
+            distances, failed = array('d'), array('l')
+            pairs = zip(lats1, lngs1, lats2, lngs2)
+            for index, (lat1, lng1, lat2, lng2) in enumerate(pairs):
+                if any(c != c for c in (lat1, lng1, lat2, lng2)):
+                    distances.append(float('nan'))
+                    continue
+                try:
+                    distances.append(self.measure((lat1, lng1), (lat2, lng2)))
+                except ValueError:
+                    distances.append(float('nan'))
+                    failed.append(index)
+            if return_failed:
+                return distances, failed
+            return distances
+
+        import numpy # pylint: disable=W0621
+        lat1, lng1, lat2, lng2 = numpy.broadcast_arrays(*(
+            numpy.radians(numpy.asarray(coordinates, dtype=float))
+            for coordinates in (lats1, lngs1, lats2, lngs2)
+        ))
+        shape = lat1.shape
+        lat1, lng1, lat2, lng2 = (
+            coordinates.ravel() for coordinates in (lat1, lng1, lat2, lng2)
+        )
+
+        major, minor, f, one_minus_f, ecc_sq = self._ellipsoid_constants() # pylint: disable=W0612
+
+        delta_lng = lng2 - lng1
+
+        reduced_lat1 = numpy.arctan(one_minus_f * numpy.tan(lat1))
+        reduced_lat2 = numpy.arctan(one_minus_f * numpy.tan(lat2))
+
+        sin_reduced1 = numpy.sin(reduced_lat1)
+        cos_reduced1 = numpy.cos(reduced_lat1)
+        sin_reduced2 = numpy.sin(reduced_lat2)
+        cos_reduced2 = numpy.cos(reduced_lat2)
+
+        lambda_lng = delta_lng.copy()
+        sin_sigma = numpy.zeros_like(delta_lng)
+        cos_sigma = numpy.zeros_like(delta_lng)
+        sigma = numpy.zeros_like(delta_lng)
+        cos_sq_alpha = numpy.zeros_like(delta_lng)
+        cos2_sigma_m = numpy.zeros_like(delta_lng)
+        converged = numpy.zeros(delta_lng.shape, dtype=bool)
+        coincident = numpy.zeros(delta_lng.shape, dtype=bool)
+
+        # Indices of the pairs still being iterated on.
+        active = numpy.arange(delta_lng.size)
+
+        with numpy.errstate(divide='ignore', invalid='ignore'):
+            for _ in range(self.iterations):
+                if not active.size:
+                    break
+                s_r1, c_r1 = sin_reduced1[active], cos_reduced1[active]
+                s_r2, c_r2 = sin_reduced2[active], cos_reduced2[active]
+                lambda_prime = lambda_lng[active]
+                sin_lambda_lng = numpy.sin(lambda_prime)
+                cos_lambda_lng = numpy.cos(lambda_prime)
+
+                s_sigma = numpy.sqrt(
+                    (c_r2 * sin_lambda_lng) ** 2 +
+                    (c_r1 * s_r2 - s_r1 * c_r2 * cos_lambda_lng) ** 2
+                )
+                c_sigma = s_r1 * s_r2 + c_r1 * c_r2 * cos_lambda_lng
+                sig = numpy.arctan2(s_sigma, c_sigma)
+
+                sin_alpha = c_r1 * c_r2 * sin_lambda_lng / s_sigma
+                c_sq_alpha = 1 - sin_alpha ** 2
+                c2_sigma_m = numpy.where(
+                    c_sq_alpha != 0,
+                    c_sigma - 2 * s_r1 * s_r2 / c_sq_alpha,
+                    0.0 # Equatorial line
+                )
+
+                C = f / 16. * c_sq_alpha * (4 + f * (4 - 3 * c_sq_alpha))
+
+                lambda_new = (
+                    delta_lng[active] + (1 - C) * f * sin_alpha * (
+                        sig + C * s_sigma * (
+                            c2_sigma_m + C * c_sigma * (
+                                -1 + 2 * c2_sigma_m ** 2
+                            )
+                        )
+                    )
+                )
+
+                lambda_lng[active] = lambda_new
+                sin_sigma[active] = s_sigma
+                cos_sigma[active] = c_sigma
+                sigma[active] = sig
+                cos_sq_alpha[active] = c_sq_alpha
+                cos2_sigma_m[active] = c2_sigma_m
+
+                done_coincident = s_sigma == 0
+                done = done_coincident | (
+                    numpy.abs(lambda_new - lambda_prime) <= 10e-12
+                )
+                coincident[active[done_coincident]] = True
+                converged[active[done]] = True
+                active = active[~done]
+
+        u_sq = cos_sq_alpha * ecc_sq
+
+        A = 1 + u_sq / 16384. * (
+            4096 + u_sq * (-768 + u_sq * (320 - 175 * u_sq))
+        )
+
+        B = u_sq / 1024. * (256 + u_sq * (-128 + u_sq * (74 - 47 * u_sq)))
+
+        delta_sigma = (
+            B * sin_sigma * (
+                cos2_sigma_m + B / 4. * (
+                    cos_sigma * (
+                        -1 + 2 * cos2_sigma_m ** 2
+                    ) - B / 6. * cos2_sigma_m * (
+                        -3 + 4 * sin_sigma ** 2
+                    ) * (
+                        -3 + 4 * cos2_sigma_m ** 2
+                    )
+                )
+            )
+        )
+
+        s = minor * A * (sigma - delta_sigma)
+        s[coincident] = 0
+        s[~converged] = numpy.nan
+        if return_failed:
+            # Pairs with NaN coordinates never converge, but did not fail.
+            valid = ~numpy.isnan(lat1 + lng1 + lat2 + lng2)
+            return s.reshape(shape), numpy.flatnonzero(~converged & valid)
+        return s.reshape(shape)
+
     def destination(self, point, bearing, distance=None): # pylint: disable=W0621
         """
         TODO docs.
@@ -453,20 +814,16 @@ class vincenty(Distance):
         if isinstance(distance, Distance):
             distance = distance.kilometers
 
-        ellipsoid = self.ELLIPSOID
-        if isinstance(ellipsoid, string_compare):
-            ellipsoid = ELLIPSOIDS[ellipsoid]
-
-        major, minor, f = ellipsoid
+        _, minor, f, one_minus_f, ecc_sq = self._ellipsoid_constants()
 
-        tan_reduced1 = (1 - f) * tan(lat1)
+        tan_reduced1 = one_minus_f * tan(lat1)
         cos_reduced1 = 1 / sqrt(1 + tan_reduced1 ** 2)
         sin_reduced1 = tan_reduced1 * cos_reduced1
         sin_bearing, cos_bearing = sin(bearing), cos(bearing)
         sigma1 = atan2(tan_reduced1, cos_bearing)
         sin_alpha = cos_reduced1 * sin_bearing
         cos_sq_alpha = 1 - sin_alpha ** 2
-        u_sq = cos_sq_alpha * (major ** 2 - minor ** 2) / minor ** 2
+        u_sq = cos_sq_alpha * ecc_sq
 
         A = 1 + u_sq / 16384. * (
             4096 + u_sq * (-768 + u_sq * (320 - 175 * u_sq))
@@ -497,7 +854,7 @@ class vincenty(Distance):
 
         lat2 = atan2(
             sin_reduced1 * cos_sigma + cos_reduced1 * sin_sigma * cos_bearing,
-            (1 - f) * sqrt(
+            one_minus_f * sqrt(
                 sin_alpha ** 2 + (
                     sin_reduced1 * sin_sigma -
                     cos_reduced1 * cos_sigma * cos_bearing
@@ -527,7 +884,311 @@ class vincenty(Distance):
         return Point(units.degrees(radians=lat2), units.degrees(radians=lng2))
 
 
+class geodesic(Distance):
+    """
+    Calculate the geodesic distance between two points using the algorithm
+    of Charles Karney, as implemented by geographiclib, with an ellipsoidal
+    model of the earth.
+
+    It is accurate to about 15 nanometers, more so than :class:`.vincenty`,
+    and always converges, so it may be used where :class:`.vincenty`
+    fails, e.g. for nearly antipodal points. The ``ellipsoid`` keyword
+    argument is given as for :class:`.vincenty`.
+
+    Example::
+
+        >>> from geopy.distance import geodesic
+        >>> newport_ri = (41.49008, -71.312796)
+        >>> cleveland_oh = (41.499498, -81.695391)
+        >>> print(geodesic(newport_ri, cleveland_oh).miles)
+        538.3904453677203
+
+    Requires geographiclib, which is installed by
+    ``pip install "geopy[geodesic]"``.
+
+    .. versionadded:: 1.12.0
+    """
+
+    ellipsoid_key = None
+    ELLIPSOID = None
+    geod = None
+
+    def __init__(self, *args, **kwargs):
+        if not geographiclib_available:
+            raise ImportError(
+                'geographiclib must be installed to compute geodesic '
+                'distances. Install with `pip install "geopy[geodesic]"`.'
+            )
+        self.set_ellipsoid(kwargs.pop('ellipsoid', 'WGS-84'))
+        super(geodesic, self).__init__(*args, **kwargs)
+
+    def set_ellipsoid(self, ellipsoid):
+        """
+        Change the ellipsoid used in the calculation.
+        """
+        if not isinstance(ellipsoid, (list, tuple)):
+            try:
+                self.ELLIPSOID = ELLIPSOIDS[ellipsoid]
+                self.ellipsoid_key = ellipsoid
+            except KeyError:
+                raise Exception(
+                    "Invalid ellipsoid. See geopy.distance.ELIPSOIDS"
+                )
+        else:
+            self.ELLIPSOID = ellipsoid
+            self.ellipsoid_key = None
+        major, _, f = self.ELLIPSOID
+        self.geod = Geodesic(major, f)
+
+    def measure(self, a, b):
+        lat1, lng1 = _lat_lng(a)
+        lat2, lng2 = _lat_lng(b)
+        return self.geod.Inverse(
+            lat1, lng1, lat2, lng2, Geodesic.DISTANCE
+        )['s12']
+
+    def measure_many(self, lats1, lngs1, lats2, lngs2):
+        """
+        Distances, in kilometers, between many pairs of points: the i-th
+        distance is from (``lats1[i]``, ``lngs1[i]``) to
+        (``lats2[i]``, ``lngs2[i]``). See
+        :meth:`geopy.distance.great_circle.measure_many` for how
+        coordinates are given.
+
+        geographiclib measures one pair at a time, so even with NumPy the
+        pairs are looped over in Python; unlike :class:`.vincenty`, every
+        pair converges.
+
+        .. versionadded:: 1.12.0
+        """
+        inverse = self.geod.Inverse
+        if numpy_available:
+            import numpy # pylint: disable=W0621
+            lat1, lng1, lat2, lng2 = numpy.broadcast_arrays(*(
+                numpy.asarray(coordinates, dtype=float)
+                for coordinates in (lats1, lngs1, lats2, lngs2)
+            ))
+            pairs = zip(lat1.flat, lng1.flat, lat2.flat, lng2.flat)
+            return numpy.fromiter(
+                (
+                    inverse(*(pair + (Geodesic.DISTANCE, )))['s12']
+                    for pair in pairs
+                ),
+                dtype=float,
+                count=lat1.size
+            ).reshape(lat1.shape)
+
+        if not len(lats1) == len(lngs1) == len(lats2) == len(lngs2):
+            raise ValueError("Coordinate sequences differ in length.")
+        return array('d', (
+            inverse(lat1, lng1, lat2, lng2, Geodesic.DISTANCE)['s12']
+            for lat1, lng1, lat2, lng2 in zip(lats1, lngs1, lats2, lngs2)
+        ))
+
+    def destination(self, point, bearing, distance=None): # pylint: disable=W0621
+        """
+        The point reached by travelling ``distance``, by default this
+        distance, from ``point`` along the geodesic leaving it at
+        ``bearing`` degrees.
+        """
+        point = Point(point)
+        if distance is None:
+            distance = self
+        if isinstance(distance, Distance):
+            distance = distance.kilometers
+
+        result = self.geod.Direct(
+            point.latitude, point.longitude, bearing, distance,
+            Geodesic.LATITUDE | Geodesic.LONGITUDE
+        )
+        return Point(result['lat2'], result['lon2'])
+
+
 # Set the default distance formula to the most generally accurate.
 
 distance = VincentyDistance = vincenty
 GreatCircleDistance = great_circle
+GeodesicDistance = geodesic
+
+
+# Formulas :func:`distance_matrix` can use, by name.
+MATRIX_METHODS = {
+    'great_circle': great_circle,
+    'vincenty': vincenty,
+    'geodesic': geodesic,
+}
+
+# Number of distances :func:`distance_matrix` computes at once.
+DEFAULT_CHUNK_SIZE = 65536
+
+# Formula and destination columns of a :func:`distance_matrix` worker
+# process, set by :func:`_init_matrix_worker`.
+_matrix_worker = {} # pylint: disable=C0103
+
+
+def _columns(points):
+    """
+    Latitude and longitude columns of a sequence of points.
+    """
+    if isinstance(points, PointArray):
+        if numpy_available:
+            import numpy # pylint: disable=W0621
+            return (
+                numpy.asarray(points.latitudes),
+                numpy.asarray(points.longitudes),
+            )
+        return points.latitudes, points.longitudes
+    lats, lngs = array('d'), array('d')
+    for point in points:
+        latitude, longitude = _lat_lng(point)
+        lats.append(latitude)
+        lngs.append(longitude)
+    if numpy_available:
+        import numpy # pylint: disable=W0621
+        return numpy.frombuffer(lats), numpy.frombuffer(lngs)
+    return lats, lngs
+
+
+def _matrix_rows(formula, lats_a, lngs_a, lats_b, lngs_b):
+    """
+    Distances from each of a few points to each of ``lats_b``, ``lngs_b``,
+    as a 2-d NumPy array, or a list of rows without NumPy.
+    """
+    if numpy_available:
+        import numpy # pylint: disable=W0621
+        return formula.measure_many(
+            lats_a[:, numpy.newaxis], lngs_a[:, numpy.newaxis],
+            lats_b[numpy.newaxis, :], lngs_b[numpy.newaxis, :]
+        )
+    count = len(lats_b)
+    return [
+        formula.measure_many([lat] * count, [lng] * count, lats_b, lngs_b)
+        for lat, lng in zip(lats_a, lngs_a)
+    ]
+
+
+def _init_matrix_worker(formula, lats_b, lngs_b):
+    """
+    Set up a :func:`distance_matrix` worker process.
+    """
+    _matrix_worker['args'] = (formula, lats_b, lngs_b)
+
+
+def _matrix_chunk(task):
+    """
+    Compute the rows of a chunk in a worker process.
+    """
+    start, lats_a, lngs_a = task
+    formula, lats_b, lngs_b = _matrix_worker['args']
+    return start, _matrix_rows(formula, lats_a, lngs_a, lats_b, lngs_b)
+
+
+def distance_matrix(
+        points_a,
+        points_b,
+        method='great_circle',
+        out=None,
+        chunk_size=DEFAULT_CHUNK_SIZE,
+        processes=None,
+        **kwargs
+    ): # pylint: disable=R0913
+    """
+    Distances, in kilometers, from each of ``points_a`` to each of
+    ``points_b``: the distance from ``points_a[i]`` to ``points_b[j]`` is
+    in row ``i``, column ``j`` of the result.
+
+    The matrix is computed a chunk of rows at a time, each of about
+    ``chunk_size`` distances, with the ``measure_many`` method of the
+    formula. Pairs :class:`.vincenty` does not converge for get a distance
+    of NaN; :class:`.geodesic` measures them, more slowly.
+
+    With NumPy installed, the result is a 2-d NumPy array. Matrices larger
+    than memory can be written to a file by giving a ``numpy.memmap`` as
+    ``out``::
+
+        >>> out = numpy.memmap('matrix.f8', dtype='float64', mode='w+',
+        ...                    shape=(len(customers), len(depots)))
+        >>> distance_matrix(customers, depots, out=out, processes=4)
+
+    Without NumPy, the result is a list of rows, each an ``array('d')``.
+
+    .. versionadded:: 1.12.0
+
+    :param points_a: Points of the rows, as a :class:`.PointArray` or a
+        sequence of anything :class:`.Point` accepts.
+
+    :param points_b: Points of the columns.
+
+    :param string method: Formula, 'great_circle', 'vincenty' or
+        'geodesic'.
+
+    :param out: Array of shape (``len(points_a)``, ``len(points_b)``), or
+        without NumPy a list of ``len(points_a)`` items, to write the
+        distances into. Allocated if not given.
+
+    :param int chunk_size: Approximate number of distances computed at
+        once. The default keeps the intermediate arrays of a chunk within
+        the processor's cache.
+
+    :param int processes: If given, chunks are computed by a pool of this
+        many processes, to use several cores. Only the parent process
+        writes to ``out``.
+
+    Other keyword arguments, e.g. ``ellipsoid`` or ``radius``, are passed
+    to the formula.
+    """
+    try:
+        formula = MATRIX_METHODS[method](**kwargs)
+    except KeyError:
+        raise ValueError(
+            "Unknown method %r; use one of %s." % (
+                method, ", ".join(sorted(MATRIX_METHODS))
+            )
+        )
+    if numpy_available:
+        import numpy # pylint: disable=W0621
+    lats_a, lngs_a = _columns(points_a)
+    lats_b, lngs_b = _columns(points_b)
+    rows, columns = len(lats_a), len(lats_b)
+
+    if out is None:
+        out = (
+            numpy.empty((rows, columns)) if numpy_available
+            else [None] * rows
+        )
+    elif numpy_available and numpy.shape(out) != (rows, columns):
+        raise ValueError(
+            "out has shape %r, expected %r." % (
+                numpy.shape(out), (rows, columns)
+            )
+        )
+    elif not numpy_available and len(out) != rows:
+        raise ValueError("out has %d rows, expected %d." % (len(out), rows))
+
+    step = max(1, chunk_size // max(columns, 1))
+    tasks = (
+        (start, lats_a[start:start + step], lngs_a[start:start + step])
+        for start in range(0, rows, step)
+    )
+    if processes is None:
+        chunks = (
+            (start, _matrix_rows(formula, lats, lngs, lats_b, lngs_b))
+            for start, lats, lngs in tasks
+        )
+        for start, chunk in chunks:
+            out[start:start + len(chunk)] = chunk
+        return out
+
+    from multiprocessing import Pool
+    pool = Pool(
+        processes,
+        initializer=_init_matrix_worker,
+        initargs=(formula, lats_b, lngs_b)
+    )
+    try:
+        for start, chunk in pool.imap_unordered(_matrix_chunk, tasks):
+            out[start:start + len(chunk)] = chunk
+    finally:
+        pool.terminate()
+        pool.join()
+    return out
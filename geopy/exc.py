@@ -21,8 +21,16 @@ class GeocoderServiceError(GeopyError):
     exception that can be raised, and any non-geopy exception will be caught
     and turned into this. The exception's message will be that of the
     original exception.
+
+    ``retry_after`` is the number of seconds the service asked clients to
+    wait before trying again, from its ``Retry-After`` header, or None.
+    ``status`` is the HTTP status code of the response, or None if the
+    error was not an HTTP error status.
     """
 
+    retry_after = None
+    status = None
+
 class GeocoderQueryError(GeocoderServiceError):
     """
     Either geopy detected input that would cause a request to fail,
@@ -63,6 +71,15 @@ class GeocoderUnavailable(GeocoderServiceError):
     it was unavailable.
     """
 
+class GeocoderCircuitOpen(GeocoderUnavailable):
+    """
+    The request was not sent, because the geocoder's circuit breaker is
+    open after repeated failures of the service. ``retry_after`` is the
+    number of seconds until a request is let through again.
+
+    .. versionadded:: 1.12.0
+    """
+
 class GeocoderParseError(GeocoderServiceError):
     """
     Geopy could not parse the service's response. This is a bug in geopy.
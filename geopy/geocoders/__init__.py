@@ -71,79 +71,132 @@ need to geocode locations in Cleveland, Ohio, you could do::
 
 """
 
-__all__ = (
-    "get_geocoder_for_service",
-    "ArcGIS",
-    "Baidu",
-    "GaoDe",
-    "Tencent",
-    "Bing",
-    "DataBC",
-    "GeocoderDotUS",
-    "GeocodeFarm",
-    "GeoNames",
-    "GoogleV3",
-    "IGNFrance",
-    "OpenCage",
-    "OpenMapQuest",
-    "Nominatim",
-    "YahooPlaceFinder",
-    "LiveAddress",
-    'Yandex',
-    "What3Words",
-    "Photon",
-    "Mapzen",
-)
-
-
-from geopy.geocoders.arcgis import ArcGIS
-from geopy.geocoders.baidu import Baidu
-from geopy.geocoders.gaode import GaoDe
-from geopy.geocoders.tencent import Tencent
-from geopy.geocoders.bing import Bing
-from geopy.geocoders.databc import DataBC
-from geopy.geocoders.dot_us import GeocoderDotUS
-from geopy.geocoders.geocodefarm import GeocodeFarm
-from geopy.geocoders.geonames import GeoNames
-from geopy.geocoders.googlev3 import GoogleV3
-from geopy.geocoders.opencage import OpenCage
-from geopy.geocoders.openmapquest import OpenMapQuest
-from geopy.geocoders.osm import Nominatim
-from geopy.geocoders.placefinder import YahooPlaceFinder
-from geopy.geocoders.smartystreets import LiveAddress
-from geopy.geocoders.what3words import What3Words
-from geopy.geocoders.yandex import Yandex
-from geopy.geocoders.ignfrance import IGNFrance
-from geopy.geocoders.photon import Photon
-from geopy.geocoders.mapzen import Mapzen
-
+import sys
+from collections import OrderedDict
+from importlib import import_module
+from types import ModuleType
 
+from geopy.compat import MutableMapping, replace_module, string_compare
 from geopy.exc import GeocoderNotFound
 
 
-SERVICE_TO_GEOCODER = {
-    "arcgis": ArcGIS,
-    "baidu": Baidu,
-    "gaode": GaoDe,
-    "tencent": Tencent,
-    "bing": Bing,
-    "databc": DataBC,
-    "google": GoogleV3,
-    "googlev3": GoogleV3,
-    "geocoderdotus": GeocoderDotUS,
-    "geonames": GeoNames,
-    "yahoo": YahooPlaceFinder,
-    "placefinder": YahooPlaceFinder,
-    "opencage": OpenCage,
-    "openmapquest": OpenMapQuest,
-    "liveaddress": LiveAddress,
-    "nominatim": Nominatim,
-    "geocodefarm": GeocodeFarm,
-    "what3words": What3Words,
-    "yandex": Yandex,
-    "ignfrance": IGNFrance,
-    "photon": Photon
-}
+# Module defining each geocoder, in the order of ``__all__``. Geocoders are
+# imported when first used, rather than all of them whenever geopy is
+# imported: many need modules, e.g. xml.etree or requests, which take long
+# to import.
+_GEOCODER_MODULES = OrderedDict((
+    ("ArcGIS", "geopy.geocoders.arcgis"),
+    ("Baidu", "geopy.geocoders.baidu"),
+    ("GaoDe", "geopy.geocoders.gaode"),
+    ("Tencent", "geopy.geocoders.tencent"),
+    ("Bing", "geopy.geocoders.bing"),
+    ("DataBC", "geopy.geocoders.databc"),
+    ("GeocoderDotUS", "geopy.geocoders.dot_us"),
+    ("GeocodeFarm", "geopy.geocoders.geocodefarm"),
+    ("GeoNames", "geopy.geocoders.geonames"),
+    ("GoogleV3", "geopy.geocoders.googlev3"),
+    ("IGNFrance", "geopy.geocoders.ignfrance"),
+    ("OpenCage", "geopy.geocoders.opencage"),
+    ("OpenMapQuest", "geopy.geocoders.openmapquest"),
+    ("Nominatim", "geopy.geocoders.osm"),
+    ("YahooPlaceFinder", "geopy.geocoders.placefinder"),
+    ("LiveAddress", "geopy.geocoders.smartystreets"),
+    ("Yandex", "geopy.geocoders.yandex"),
+    ("What3Words", "geopy.geocoders.what3words"),
+    ("Photon", "geopy.geocoders.photon"),
+    ("Mapzen", "geopy.geocoders.mapzen"),
+    ("CompositeGeocoder", "geopy.geocoders.composite"),
+))
+
+if sys.version_info >= (3, 5):
+    _GEOCODER_MODULES["AsyncGeocoder"] = "geopy.aio"
+
+# Built from the geocoders' modules, since the geocoders are only defined
+# here once looked up.
+__all__ = ("get_geocoder_for_service", ) + tuple(_GEOCODER_MODULES)
+
+
+def _load(name):
+    """
+    Import the geocoder class ``name``, and keep it in this module's
+    namespace, so that it is only looked up once.
+    """
+    geocoder = getattr(import_module(_GEOCODER_MODULES[name]), name)
+    setattr(sys.modules[__name__], name, geocoder)
+    return geocoder
+
+
+class _GeocodersModule(ModuleType):
+    """
+    Type of ``geopy.geocoders``, which imports each geocoder the first time
+    it is looked up.
+    """
+
+    def __getattr__(self, name):
+        if name in _GEOCODER_MODULES:
+            return _load(name)
+        raise AttributeError(
+            "module %r has no attribute %r" % (self.__name__, name)
+        )
+
+    def __dir__(self):
+        return sorted(set(self.__dict__) | set(_GEOCODER_MODULES))
+
+
+class _GeocoderRegistry(MutableMapping):
+    """
+    Mapping of service names to geocoder classes, which imports each class
+    the first time it is looked up.
+    """
+
+    def __init__(self, geocoders):
+        self._geocoders = dict(geocoders)
+
+    def __getitem__(self, service):
+        geocoder = self._geocoders[service]
+        if isinstance(geocoder, string_compare):
+            geocoder = self._geocoders[service] = _load(geocoder)
+        return geocoder
+
+    def __setitem__(self, service, geocoder):
+        self._geocoders[service] = geocoder
+
+    def __delitem__(self, service):
+        del self._geocoders[service]
+
+    def __iter__(self):
+        return iter(self._geocoders)
+
+    def __len__(self):
+        return len(self._geocoders)
+
+    def __repr__(self):
+        return repr(dict(self))
+
+
+SERVICE_TO_GEOCODER = _GeocoderRegistry({
+    "arcgis": "ArcGIS",
+    "baidu": "Baidu",
+    "gaode": "GaoDe",
+    "tencent": "Tencent",
+    "bing": "Bing",
+    "databc": "DataBC",
+    "google": "GoogleV3",
+    "googlev3": "GoogleV3",
+    "geocoderdotus": "GeocoderDotUS",
+    "geonames": "GeoNames",
+    "yahoo": "YahooPlaceFinder",
+    "placefinder": "YahooPlaceFinder",
+    "opencage": "OpenCage",
+    "openmapquest": "OpenMapQuest",
+    "liveaddress": "LiveAddress",
+    "nominatim": "Nominatim",
+    "geocodefarm": "GeocodeFarm",
+    "what3words": "What3Words",
+    "yandex": "Yandex",
+    "ignfrance": "IGNFrance",
+    "photon": "Photon"
+})
 
 
 def get_geocoder_for_service(service):
@@ -163,6 +216,8 @@ def get_geocoder_for_service(service):
     except KeyError:
         raise GeocoderNotFound(
             "Unknown geocoder '%s'; options are: %s" %
-            (service, SERVICE_TO_GEOCODER.keys())
+            (service, list(SERVICE_TO_GEOCODER.keys()))
         )
 
+
+replace_module(__name__, _GeocodersModule)
@@ -210,6 +210,13 @@ class ArcGIS(Geocoder):  # pylint: disable=R0921,R0902,W0223
             response['address']
         )
 
+    def _cacheable(self, response):
+        """
+        Responses reporting an error, and tokens, which expire, are not
+        cached.
+        """
+        return 'error' not in response and 'token' not in response
+
     def _refresh_authentication_token(self):
         """
         POST to ArcGIS requesting a new token.
@@ -9,6 +9,7 @@ from geopy.exc import (
     GeocoderQuotaExceeded,
     GeocoderAuthenticationFailure,
 )
+from geopy.keypool import PooledKey, uses_key_pool
 from geopy.location import Location
 from geopy.util import logger
 
@@ -22,6 +23,8 @@ class Baidu(Geocoder):
         http://developer.baidu.com/map/webservice-geocoding.htm
     """
 
+    api_key = PooledKey()
+
     def __init__(
             self,
             api_key,
@@ -38,6 +41,8 @@ class Baidu(Geocoder):
         :param string api_key: The API key required by Baidu Map to perform
             geocoding requests. API keys are managed through the Baidu APIs
             console (http://lbsyun.baidu.com/apiconsole/key).
+            Several keys may be given, as a list or a
+            :class:`geopy.keypool.KeyPool`, to spread requests over them.
 
         :param string scheme: Use 'https' or 'http' as the API URL's scheme.
             Default is http and only http support.
@@ -68,6 +73,7 @@ class Baidu(Geocoder):
             )
         )
 
+    @uses_key_pool
     def geocode(
             self,
             query,
@@ -106,6 +112,7 @@ class Baidu(Geocoder):
             self._call_geocoder(url, timeout=timeout), exactly_one=exactly_one
         )
 
+    @uses_key_pool
     def search(self, query, city=None, bounds=None, location=None,
                radius=None, tag=None, exactly_one=True, timeout=None,
                ret_coordtype=None, coordtype=None, city_limit=False):
@@ -139,6 +146,7 @@ class Baidu(Geocoder):
         )
 
 
+    @uses_key_pool
     def reverse(self, query, timeout=None, coordtype=None):  # pylint: disable=W0221
         """
         Given a point, find an address.
@@ -231,6 +239,12 @@ class Baidu(Geocoder):
         else:
             return [parse_place(item) for item in place]
 
+    def _cacheable(self, response):
+        """
+        Responses with an error status are not cached.
+        """
+        return str(response.get('status')) == '0'
+
     @staticmethod
     def _check_status(status):
         """
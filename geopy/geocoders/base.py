@@ -5,20 +5,28 @@
 from ssl import SSLError
 from socket import timeout as SocketTimeout
 import json
+import threading
+from collections import deque, namedtuple
+from email.utils import parsedate_tz, mktime_tz
+from functools import partial
+from time import sleep, time
 
 from geopy.compat import (
     string_compare,
     HTTPError,
     py3k,
-    urlopen as urllib_urlopen,
-    build_opener,
-    ProxyHandler,
     URLError,
-    install_opener,
     Request,
+    Queue,
+    Empty,
+    urlparse,
+    parse_qsl,
+    urlencode,
 )
 from geopy.point import Point
+from geopy.transport import HTTPTransport
 from geopy.exc import (
+    GeopyError,
     GeocoderServiceError,
     ConfigurationError,
     GeocoderTimedOut,
@@ -29,15 +37,17 @@ from geopy.exc import (
     GeocoderUnavailable,
     GeocoderParseError,
 )
-from geopy.util import decode_page, __version__
+from geopy.util import decode_page, read_page, logger, __version__
 
 
 __all__ = (
     "Geocoder",
+    "BatchResult",
     "DEFAULT_FORMAT_STRING",
     "DEFAULT_SCHEME",
     "DEFAULT_TIMEOUT",
     "DEFAULT_WKID",
+    "DEFAULT_WORKERS",
 )
 
 
@@ -46,6 +56,26 @@ DEFAULT_SCHEME = 'https'
 DEFAULT_TIMEOUT = 1
 DEFAULT_WKID = 4326
 DEFAULT_USER_AGENT = "geopy/%s" % __version__
+DEFAULT_WORKERS = 4
+
+# Query parameters carrying an API key or account name, by which requests
+# are rate limited.
+KEY_PARAMS = ('key', 'ak', 'api_key', 'client', 'auth-id', 'username')
+
+# Query parameters carrying credentials, left out of cache keys.
+SECRET_PARAMS = frozenset((
+    'ak',
+    'api_key',
+    'auth-id',
+    'auth-token',
+    'client',
+    'key',
+    'password',
+    'signature',
+    'sn',
+    'token',
+    'username',
+))
 
 
 ERROR_CODE_MAP = {
@@ -63,11 +93,106 @@ ERROR_CODE_MAP = {
 }
 
 
+BatchResult = namedtuple("BatchResult", ("query", "result", "error"))
+BatchResult.__doc__ = """
+One item of :meth:`.Geocoder.geocode_many` or :meth:`.Geocoder.reverse_many`:
+the ``query`` given, and either the ``result`` the geocoder returned for it,
+or the ``error`` it raised.
+"""
+
+
+class _BatchItem(object): # pylint: disable=R0903
+    """
+    A query of a batch, waiting for a worker to answer it.
+    """
+
+    __slots__ = ("query", "result", "error", "done")
+
+    def __init__(self, query):
+        self.query = query
+        self.result = None
+        self.error = None
+        self.done = threading.Event()
+
+
+def _batch_worker(method, kwargs, tasks):
+    """
+    Answer batch items from ``tasks`` until given None.
+    """
+    while True:
+        item = tasks.get()
+        if item is None:
+            return
+        try:
+            item.result = method(item.query, **kwargs)
+        except BaseException as error: # pylint: disable=W0703
+            item.error = error
+            if not isinstance(error, Exception):
+                # e.g. SystemExit: the worker stops, and the batch raises
+                # it to the caller.
+                return
+        finally:
+            item.done.set()
+
+
+def _retry_after(response):
+    """
+    Seconds to wait before retrying, from the ``Retry-After`` header of an
+    error response, or None.
+    """
+    headers = getattr(response, 'headers', None)
+    if headers is None and hasattr(response, 'info'):
+        headers = response.info()
+    value = headers.get('Retry-After') if headers is not None else None
+    if not value:
+        return None
+    try:
+        return max(0., float(value))
+    except ValueError:
+        date = parsedate_tz(value)
+        if date is None:
+            return None
+        return max(0., mktime_tz(date) - time())
+
+
+# While :mod:`geopy.aio` drives a geocoder method on an event loop it sets
+# ``requester`` here, so that the method's network calls are answered from,
+# or deferred to, the loop instead of blocking the thread, ``cache``, which
+# wraps a geocoder's cache likewise, and ``keys``, the API keys the method
+# was given by key pools.
+_deferred = threading.local() # pylint: disable=C0103
+
+
 class Geocoder(object): # pylint: disable=R0921
     """
     Template object for geocoders.
     """
 
+    # Cache of responses, e.g. a :class:`geopy.cache.LRUCache`, consulted
+    # by :meth:`_call_geocoder` before going to the network.
+    cache = None
+
+    # Rate limiter, e.g. a :class:`geopy.ratelimit.RateLimiter`, waited
+    # for by :meth:`_call_geocoder` before each request.
+    rate_limiter = None
+
+    # :class:`geopy.retry.RetryPolicy` deciding which failed requests
+    # :meth:`_call_geocoder` sends again, and when.
+    retry_policy = None
+
+    # :class:`geopy.circuitbreaker.CircuitBreaker` through which
+    # :meth:`_call_geocoder` stops calling a failing service.
+    circuit_breaker = None
+
+    # :class:`geopy.cache.SingleFlight` through which :meth:`_call_geocoder`
+    # shares one request between identical concurrent calls.
+    single_flight = None
+
+    # Callable parsing JSON responses from their UTF-8 encoded bytes, or
+    # from text when cached, used by :meth:`_call_geocoder` in place of
+    # decoding them for json.loads; e.g. :func:`geopy.util.fast_json_loads`.
+    json_deserializer = None
+
     def __init__(
             self,
             format_string=DEFAULT_FORMAT_STRING,
@@ -90,13 +215,7 @@ class Geocoder(object): # pylint: disable=R0921
         self.timeout = timeout
         self.headers = {'User-Agent': user_agent or DEFAULT_USER_AGENT}
 
-        if self.proxies:
-            install_opener(
-                build_opener(
-                    ProxyHandler(self.proxies)
-                )
-            )
-        self.urlopen = urllib_urlopen
+        self.urlopen = HTTPTransport(headers=self.headers, proxies=self.proxies)
 
     @staticmethod
     def _coerce_point_to_string(point):
@@ -119,6 +238,77 @@ class Geocoder(object): # pylint: disable=R0921
         """
         raise NotImplementedError()
 
+    def _cacheable(self, response): # pylint: disable=W0613
+        """
+        Whether a deserialized response may be cached. Services which
+        report errors, such as an exceeded quota, in the body of an
+        otherwise successful response refuse those, so that they are not
+        replayed once the service has recovered.
+        """
+        return True
+
+    def _cache_key(self, url):
+        """
+        Normalized form of a request, used as its cache key: the url with
+        its query parameters sorted and credentials removed, followed by the
+        request body if there is one.
+        """
+        data = None
+        if hasattr(url, 'get_full_url'):
+            data = url.data
+            url = url.get_full_url()
+        parsed = urlparse(url)
+        path = parsed.path
+        api_key = getattr(self, 'api_key', None)
+        if api_key and isinstance(api_key, string_compare):
+            # e.g. IGNFrance puts the key in the path
+            path = path.replace(api_key, '')
+        params = sorted(
+            (name, value)
+            for name, value in parse_qsl(parsed.query, keep_blank_values=True)
+            if name.lower() not in SECRET_PARAMS
+        )
+        key = "%s://%s%s?%s" % (
+            parsed.scheme, parsed.netloc, path, urlencode(params)
+        )
+        if data:
+            key = "\n".join((key, data.decode('utf-8') if py3k else data))
+        return key
+
+    def _reserve(self, url):
+        """
+        Seconds to wait before sending a request to ``url``, as decided by
+        the geocoder's rate limiter.
+        """
+        if self.rate_limiter is None:
+            return 0.
+        if hasattr(url, 'get_full_url'):
+            url = url.get_full_url()
+        params = dict(parse_qsl(urlparse(url).query))
+        key = next(
+            (params[name] for name in KEY_PARAMS if params.get(name)),
+            getattr(self, 'api_key', None)
+        )
+        if not isinstance(key, string_compare):
+            key = None
+        return self.rate_limiter.reserve(url, key)
+
+    @staticmethod
+    def _deserialize(page, deserializer):
+        """
+        Deserialize a response, decoded or as bytes.
+        """
+        if deserializer is None:
+            return page
+        try:
+            return deserializer(page)
+        except ValueError:
+            if isinstance(page, bytes):
+                page = page.decode('utf-8', 'replace')
+            raise GeocoderParseError(
+                "Could not deserialize using deserializer:\n%s" % page
+            )
+
     def _call_geocoder(
             self,
             url,
@@ -131,6 +321,24 @@ class Geocoder(object): # pylint: disable=R0921
         """
         For a generated query URL, get the results.
         """
+        # JSON responses are parsed from bytes by a json_deserializer.
+        from_bytes = (
+            deserializer is json.loads and self.json_deserializer is not None
+        )
+        if from_bytes:
+            deserializer = self.json_deserializer
+
+        # Raw pages and requests made with another library are not cached.
+        cache = self.cache if not (raw or requester) else None
+        if cache is not None:
+            deferred_cache = getattr(_deferred, 'cache', None)
+            if deferred_cache is not None:
+                cache = deferred_cache(cache)
+            cache_key = self._cache_key(url)
+            page = cache.get(cache_key)
+            if page is not None:
+                return self._deserialize(page, deserializer)
+
         requester = requester or self.urlopen
 
         if not requester:
@@ -139,36 +347,114 @@ class Geocoder(object): # pylint: disable=R0921
             # work around for placefinder's use of requests
             req = url
 
+        deferred = getattr(_deferred, 'requester', None)
+        if deferred is not None:
+            # The event loop waits for the rate limiter, retries, and
+            # coalesces requests, itself.
+            send = partial(
+                self._send, partial(deferred, requester), req, timeout, kwargs
+            )
+        else:
+            send = partial(
+                self._send_with_retries, requester, req, timeout, kwargs
+            )
+
+        def fetch():
+            """
+            Send the request, and parse and cache the response.
+            """
+            page = send()
+            if raw:
+                return page
+            if from_bytes:
+                page = read_page(page)
+            else:
+                page = decode_page(page)
+            result = self._deserialize(page, deserializer)
+            if cache is not None and self._cacheable(result):
+                cache.set(
+                    cache_key, page.decode('utf-8') if from_bytes else page
+                )
+            return result
+
+        single_flight = self.single_flight
+        if single_flight is None or raw or deferred is not None:
+            return fetch()
+        # Only calls made through the same transport, and so with the same
+        # credentials, proxies and headers, share a request.
+        if hasattr(req, 'get_full_url'):
+            key = (requester, req.get_full_url(), req.data, deserializer)
+        else:
+            key = (requester, req, None, deserializer)
+        return single_flight.do(key, fetch)
+
+    def _send_with_retries(self, requester, req, timeout, kwargs):
+        """
+        Send a request, retrying failures as the geocoder's retry policy
+        allows.
+        """
+        policy = self.retry_policy
+        breaker = self.circuit_breaker
+        url = req.get_full_url() if hasattr(req, 'get_full_url') else req
+        started = time()
+        attempt = 1
+        while True:
+            # Ask the breaker first: a rejected request neither waits for
+            # the rate limiter nor counts against its quota.
+            trial = breaker is not None and breaker.before(url)
+            try:
+                delay = self._reserve(url)
+                if delay > 0:
+                    sleep(delay)
+            except BaseException:
+                # The trial was not sent: let the next request be it.
+                if trial:
+                    breaker.cancel(url)
+                raise
+            outcome = None
+            try:
+                page = self._send(requester, req, timeout, kwargs)
+            except BaseException as error: # pylint: disable=W0703
+                outcome = error
+                if not isinstance(error, GeopyError):
+                    raise
+                delay = None
+                if policy is not None:
+                    delay = policy.delay(error, attempt, started)
+                if delay is None:
+                    raise
+                logger.debug(
+                    "%s: retrying in %.2fs after %r",
+                    self.__class__.__name__, delay, error
+                )
+            finally:
+                if breaker is None:
+                    pass
+                elif isinstance(outcome, Exception) or outcome is None:
+                    breaker.record(url, outcome)
+                elif trial:
+                    # Interrupted by the caller, e.g. KeyboardInterrupt,
+                    # which says nothing of the service: let the next
+                    # request be the trial.
+                    breaker.cancel(url)
+            if outcome is None:
+                return page
+            sleep(delay)
+            attempt += 1
+
+    def _send(self, requester, req, timeout, kwargs):
+        """
+        Send a request once, and return the response. Failures raise the
+        matching :class:`geopy.exc.GeopyError`.
+        """
         try:
             page = requester(req, timeout=(timeout or self.timeout), **kwargs)
+        except GeopyError:
+            # e.g. a quota enforced by the rate limiter, replayed from
+            # the event loop.
+            raise
         except Exception as error: # pylint: disable=W0703
-            message = (
-                str(error) if not py3k
-                else (
-                    str(error.args[0])
-                    if len(error.args)
-                    else str(error)
-                )
-            )
-            if hasattr(self, '_geocoder_exception_handler'):
-                self._geocoder_exception_handler(error, message) # pylint: disable=E1101
-            if isinstance(error, HTTPError):
-                code = error.getcode()
-                try:
-                    raise ERROR_CODE_MAP[code](message)
-                except KeyError:
-                    raise GeocoderServiceError(message)
-            elif isinstance(error, URLError):
-                if "timed out" in message:
-                    raise GeocoderTimedOut('Service timed out')
-                elif "unreachable" in message:
-                    raise GeocoderUnavailable('Service not available')
-            elif isinstance(error, SocketTimeout):
-                raise GeocoderTimedOut('Service timed out')
-            elif isinstance(error, SSLError):
-                if "timed out" in message:
-                    raise GeocoderTimedOut('Service timed out')
-            raise GeocoderServiceError(message)
+            self._raise_geocoder_error(error)
 
         if hasattr(page, 'getcode'):
             status_code = page.getcode()
@@ -177,22 +463,44 @@ class Geocoder(object): # pylint: disable=R0921
         else:
             status_code = None
         if status_code in ERROR_CODE_MAP:
-            raise ERROR_CODE_MAP[page.status_code]("\n%s" % decode_page(page))
-
-        if raw:
-            return page
-
-        page = decode_page(page)
+            exc = ERROR_CODE_MAP[status_code]("\n%s" % decode_page(page))
+            exc.retry_after = _retry_after(page)
+            exc.status = status_code
+            raise exc
+        return page
 
-        if deserializer is not None:
-            try:
-                return deserializer(page)
-            except ValueError:
-                raise GeocoderParseError(
-                    "Could not deserialize using deserializer:\n%s" % page
-                )
-        else:
-            return page
+    def _raise_geocoder_error(self, error):
+        """
+        Raise the :class:`geopy.exc.GeopyError` matching an exception
+        raised by a requester.
+        """
+        message = (
+            str(error) if not py3k
+            else (
+                str(error.args[0])
+                if len(error.args)
+                else str(error)
+            )
+        )
+        if hasattr(self, '_geocoder_exception_handler'):
+            self._geocoder_exception_handler(error, message) # pylint: disable=E1101
+        if isinstance(error, HTTPError):
+            code = error.getcode()
+            exc = ERROR_CODE_MAP.get(code, GeocoderServiceError)(message)
+            exc.retry_after = _retry_after(error)
+            exc.status = code
+            raise exc
+        elif isinstance(error, URLError):
+            if "timed out" in message:
+                raise GeocoderTimedOut('Service timed out')
+            elif "unreachable" in message:
+                raise GeocoderUnavailable('Service not available')
+        elif isinstance(error, SocketTimeout):
+            raise GeocoderTimedOut('Service timed out')
+        elif isinstance(error, SSLError):
+            if "timed out" in message:
+                raise GeocoderTimedOut('Service timed out')
+        raise GeocoderServiceError(message)
 
     def geocode(self, query, exactly_one=True, timeout=None):
         """
@@ -200,6 +508,92 @@ class Geocoder(object): # pylint: disable=R0921
         """
         raise NotImplementedError()
 
+    def geocode_many(self, queries, workers=DEFAULT_WORKERS, **kwargs):
+        """
+        Geocode many queries concurrently.
+
+        Yields a :class:`.BatchResult` for each query, in the order of
+        ``queries``. A query that fails yields its exception as the
+        ``error`` rather than interrupting the batch. ``queries`` may be any
+        iterable, e.g. a file; it is read as results are consumed, and only
+        a few times ``workers`` queries are held at once, so batches of any
+        size run in constant memory::
+
+            >>> for item in geolocator.geocode_many(addresses, workers=8):
+            ...     if item.error is None:
+            ...         print(item.query, item.result)
+
+        :param int workers: Number of requests to run at once.
+
+        Other keyword arguments, e.g. ``exactly_one`` or ``timeout``, are
+        passed to :meth:`geocode`.
+        """
+        return self._call_many(self.geocode, queries, workers, kwargs)
+
+    def reverse_many(self, points, workers=DEFAULT_WORKERS, **kwargs):
+        """
+        Reverse geocode many points concurrently. See :meth:`geocode_many`.
+
+        Other keyword arguments are passed to :meth:`reverse`.
+        """
+        return self._call_many(self.reverse, points, workers, kwargs)
+
+    @classmethod
+    def _call_many(cls, method, queries, workers, kwargs):
+        """
+        Run ``method`` over ``queries`` on a pool of ``workers`` threads,
+        yielding results in order.
+        """
+        # Checked here, as a generator would only raise once iterated.
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+        return cls._iter_many(method, queries, workers, kwargs)
+
+    @staticmethod
+    def _iter_many(method, queries, workers, kwargs):
+        """
+        Generator behind :meth:`_call_many`.
+        """
+        tasks = Queue()
+        threads = []
+        for _ in range(workers):
+            thread = threading.Thread(
+                target=_batch_worker, args=(method, kwargs, tasks)
+            )
+            thread.daemon = True
+            thread.start()
+            threads.append(thread)
+
+        pending = deque()
+        queries = iter(queries)
+        try:
+            while True:
+                for query in queries:
+                    item = _BatchItem(query)
+                    tasks.put(item)
+                    pending.append(item)
+                    if len(pending) >= 2 * workers:
+                        break
+                if not pending:
+                    return
+                item = pending.popleft()
+                item.done.wait()
+                if item.error is not None and not isinstance(
+                        item.error, Exception
+                ):
+                    raise item.error
+                yield BatchResult(item.query, item.result, item.error)
+        finally:
+            # Drop queries not started yet, in case the caller stopped
+            # early, and let the workers exit.
+            try:
+                while True:
+                    tasks.get_nowait()
+            except Empty:
+                pass
+            for _ in threads:
+                tasks.put(None)
+
     def reverse(self, query, exactly_one=True, timeout=None):
         """
         Implemented in subclasses.
@@ -5,6 +5,7 @@
 from geopy.compat import urlencode
 from geopy.geocoders.base import Geocoder, DEFAULT_FORMAT_STRING, \
     DEFAULT_TIMEOUT, DEFAULT_SCHEME
+from geopy.keypool import PooledKey, uses_key_pool
 from geopy.location import Location
 from geopy.exc import (
     GeocoderAuthenticationFailure,
@@ -25,6 +26,8 @@ class Bing(Geocoder):
         https://msdn.microsoft.com/en-us/library/ff701715.aspx
     """
 
+    api_key = PooledKey()
+
     structured_query_params = {
         'addressLine',
         'locality',
@@ -46,6 +49,8 @@ class Bing(Geocoder):
         address information and your Bing Maps API key.
 
         :param string api_key: Should be a valid Bing Maps API key.
+            Several keys may be given, as a list or a
+            :class:`geopy.keypool.KeyPool`, to spread requests over them.
 
         :param string format_string: String containing '%s' where the
             string to geocode should be interpolated before querying the
@@ -75,6 +80,7 @@ class Bing(Geocoder):
         self.api_key = api_key
         self.api = "%s://dev.virtualearth.net/REST/v1/Locations" % self.scheme
 
+    @uses_key_pool
     def geocode(
             self,
             query,
@@ -160,6 +166,7 @@ class Bing(Geocoder):
             exactly_one
         )
 
+    @uses_key_pool
     def reverse(self, query, exactly_one=True, timeout=None):
         """
         Reverse geocode a point.
@@ -189,6 +196,12 @@ class Bing(Geocoder):
             exactly_one
         )
 
+    def _cacheable(self, response):
+        """
+        Responses with an error status are not cached.
+        """
+        return response.get("statusCode", 200) == 200
+
     @staticmethod
     def _parse_json(doc, exactly_one=True):  # pylint: disable=W0221
         """
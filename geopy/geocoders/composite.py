@@ -0,0 +1,243 @@
+"""
+:class:`.CompositeGeocoder` looks queries up with several geocoders.
+"""
+
+import threading
+from copy import copy
+
+from geopy.compat import Queue, Empty
+from geopy.exc import ConfigurationError, GeopyError
+from geopy.geocoders import base
+from geopy.geocoders.base import Geocoder
+
+
+__all__ = ("CompositeGeocoder", )
+
+
+FAILOVER = 'failover'
+HEDGED = 'hedged'
+
+# Threads hedged lookups run on, at most, shared by every composite
+# geocoder.
+DEFAULT_HEDGE_WORKERS = 16
+
+
+class _WorkerPool(object):
+    """
+    Up to ``size`` daemon threads, started as needed, running the tasks of
+    a shared queue. A task whose cancel event is set before a thread takes
+    it up is dropped.
+    """
+
+    def __init__(self, size):
+        self.size = size
+        self.tasks = Queue()
+        self.threads = []
+        self.lock = threading.Lock()
+
+    def submit(self, function, *args):
+        """
+        Run ``function(*args)`` on a worker thread, unless the returned
+        event is set before it starts.
+        """
+        cancel = threading.Event()
+        with self.lock:
+            if len(self.threads) < self.size:
+                thread = threading.Thread(target=self._work)
+                thread.daemon = True
+                thread.start()
+                self.threads.append(thread)
+        self.tasks.put((cancel, function, args))
+        return cancel
+
+    def _work(self):
+        """
+        Run tasks as they come.
+        """
+        while True:
+            cancel, function, args = self.tasks.get()
+            if not cancel.is_set():
+                function(*args)
+
+
+# W0223: a composite never parses a response itself, so it has no
+# _parse_json.
+class CompositeGeocoder(Geocoder): # pylint: disable=W0223
+    """
+    Geocoder asking an ordered list of configured geocoders in turn::
+
+        >>> from geopy.geocoders import CompositeGeocoder, GoogleV3, Nominatim
+        >>> geolocator = CompositeGeocoder([GoogleV3(api_key), Nominatim()])
+        >>> location = geolocator.geocode("175 5th Avenue NYC")
+        >>> location.provider
+        <geopy.geocoders.googlev3.GoogleV3 object at 0x...>
+
+    In ``failover`` mode, the next geocoder is asked whenever the previous
+    one fails or finds nothing. In ``hedged`` mode, the next geocoder is
+    also asked when the previous ones have not answered within
+    ``hedge_after`` seconds, and the first location found is returned;
+    slower geocoders are left to finish in the background, and those not
+    asked yet are not asked. Hedged lookups run on a pool of
+    ``hedge_pool.size`` threads shared by every composite geocoder, except
+    when run by :class:`geopy.aio.AsyncGeocoder`: the requests of those
+    threads could not be sent on the event loop, so the geocoders are
+    asked in failover mode instead.
+
+    Locations are tagged with the geocoder which found them, as their
+    ``provider``; a tagged copy is returned, so that locations held by a
+    geocoder's cache are left as they are. When no geocoder finds anything,
+    None is returned if any of them answered, and the error of the last one
+    raised otherwise.
+
+    .. versionadded:: 1.12.0
+    """
+
+    hedge_pool = _WorkerPool(DEFAULT_HEDGE_WORKERS)
+
+    def __init__(self, geocoders, mode=FAILOVER, hedge_after=1.): # pylint: disable=W0231
+        """
+        :param list geocoders: Geocoder instances, in order of preference.
+
+        :param string mode: ``'failover'`` or ``'hedged'``.
+
+        :param float hedge_after: In hedged mode, seconds to wait for an
+            answer before asking the next geocoder as well.
+        """
+        # Geocoder.__init__ is not called: each geocoder sends its own
+        # requests, so a composite needs no transport.
+        self.headers = {}
+        self.proxies = None
+        self.urlopen = None
+        if not geocoders:
+            raise ConfigurationError('At least one geocoder is needed.')
+        if mode not in (FAILOVER, HEDGED):
+            raise ConfigurationError(
+                "mode must be '%s' or '%s'." % (FAILOVER, HEDGED)
+            )
+        self.geocoders = list(geocoders)
+        self.mode = mode
+        self.hedge_after = hedge_after
+
+    def geocode(self, query, **kwargs): # pylint: disable=W0221
+        """
+        Geocode a location query.
+
+        Keyword arguments, e.g. ``exactly_one`` or ``timeout``, are passed
+        to the ``geocode`` method of each geocoder.
+        """
+        return self._lookup('geocode', query, kwargs)
+
+    def reverse(self, query, **kwargs): # pylint: disable=W0221
+        """
+        Given a point, find an address.
+
+        Keyword arguments are passed to the ``reverse`` method of each
+        geocoder.
+        """
+        return self._lookup('reverse', query, kwargs)
+
+    def _lookup(self, method, query, kwargs):
+        """
+        Run ``method`` of the geocoders as the mode dictates.
+        """
+        deferred = getattr(base._deferred, 'requester', None) # pylint: disable=W0212
+        if self.mode == HEDGED and deferred is None:
+            return self._hedged(method, query, kwargs)
+        return self._failover(method, query, kwargs)
+
+    @staticmethod
+    def _tag(result, geocoder):
+        """
+        Copies of the locations of ``result``, marked as found by
+        ``geocoder``.
+        """
+        def tag(location):
+            """
+            Tagged copy of ``location``.
+            """
+            if not hasattr(location, '_provider'):
+                return location
+            location = copy(location)
+            location._provider = geocoder # pylint: disable=W0212
+            return location
+        if isinstance(result, list):
+            return [tag(location) for location in result]
+        return tag(result)
+
+    def _failover(self, method, query, kwargs):
+        """
+        Ask the geocoders one after another.
+        """
+        error = None
+        answered = False
+        for geocoder in self.geocoders:
+            try:
+                result = getattr(geocoder, method)(query, **kwargs)
+            except GeopyError as exc:
+                error = exc
+                continue
+            if result:
+                return self._tag(result, geocoder)
+            answered = True
+        if answered or error is None:
+            return None
+        raise error
+
+    def _hedged(self, method, query, kwargs):
+        """
+        Ask the next geocoder whenever the ones asked so far have failed,
+        or have taken longer than ``hedge_after``.
+        """
+        answers = Queue()
+
+        def ask(geocoder):
+            """
+            Put the answer of ``geocoder`` in ``answers``.
+            """
+            result = exc = None
+            try:
+                result = getattr(geocoder, method)(query, **kwargs)
+            except BaseException as error: # pylint: disable=W0703
+                # Anything else than a GeopyError, e.g. SystemExit, is
+                # raised to the caller rather than kept in this thread.
+                exc = error
+            finally:
+                answers.put((geocoder, result, exc))
+
+        waiting = list(self.geocoders)
+        asked = []
+        outstanding = 0
+        ask_next = True
+        error = None
+        answered = False
+        try:
+            while waiting or outstanding:
+                if ask_next and waiting:
+                    asked.append(self.hedge_pool.submit(ask, waiting.pop(0)))
+                    outstanding += 1
+                ask_next = False
+                try:
+                    geocoder, result, exc = answers.get(
+                        timeout=self.hedge_after if waiting else None
+                    )
+                except Empty:
+                    # Too slow; ask the next one as well.
+                    ask_next = True
+                    continue
+                outstanding -= 1
+                if exc is not None:
+                    if not isinstance(exc, GeopyError):
+                        raise exc
+                    error = exc
+                elif result:
+                    return self._tag(result, geocoder)
+                else:
+                    answered = True
+                ask_next = True
+        finally:
+            # Geocoders still queued for a thread are not asked any more.
+            for cancel in asked:
+                cancel.set()
+        if answered or error is None:
+            return None
+        raise error
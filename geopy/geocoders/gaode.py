@@ -9,6 +9,7 @@ from geopy.exc import (
     GeocoderQuotaExceeded,
     GeocoderAuthenticationFailure,
 )
+from geopy.keypool import PooledKey, uses_key_pool
 from geopy.location import Location
 from geopy.util import logger
 
@@ -21,6 +22,9 @@ class GaoDe(Geocoder):
     Geocoder using the GaoDe Maps v3 API. Documentation at:
         http://lbs.amap.com/api/webservice/guide/api/georegeo
     """
+
+    api_key = PooledKey()
+
     def __init__(
             self,
             api_key,
@@ -49,6 +53,7 @@ class GaoDe(Geocoder):
             )
         )
 
+    @uses_key_pool
     def geocode(
             self,
             query,
@@ -86,6 +91,7 @@ class GaoDe(Geocoder):
             self._call_geocoder(url, timeout=timeout), exactly_one=exactly_one
         )
 
+    @uses_key_pool
     def search(self, query, city=None, timeout=None, exactly_one=True):
         params = {
             'key': self.api_key,
@@ -100,6 +106,7 @@ class GaoDe(Geocoder):
             self._call_geocoder(url, timeout=timeout), exactly_one=exactly_one
         )
 
+    @uses_key_pool
     def reverse(self, query, timeout=None):  # pylint: disable=W0221
         """
         Given a point, find an address.
@@ -189,6 +196,12 @@ class GaoDe(Geocoder):
         else:
             return [parse_place(item) for item in place]
 
+    def _cacheable(self, response):
+        """
+        Responses with an error status are not cached.
+        """
+        return response.get('infocode') == '10000'
+
     @staticmethod
     def _check_status(status):
         """
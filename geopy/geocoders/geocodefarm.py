@@ -152,6 +152,14 @@ class GeocodeFarm(Geocoder):
         else:
             return places
 
+    def _cacheable(self, response):
+        """
+        Responses reporting an error are not cached.
+        """
+        results = (response or {}).get("geocoding_results", {})
+        status = results.get("STATUS", {})
+        return status.get("status", "") == "SUCCESS"
+
     @staticmethod
     def _check_for_api_errors(geocoding_results):
         """
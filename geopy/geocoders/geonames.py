@@ -142,6 +142,12 @@ class GeoNames(Geocoder): # pylint: disable=W0223
             exactly_one
         )
 
+    def _cacheable(self, response):
+        """
+        Responses with an error status are not cached.
+        """
+        return not response.get('status')
+
     def _parse_json(self, doc, exactly_one):
         """
         Parse JSON response body.
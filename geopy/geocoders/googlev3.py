@@ -14,7 +14,9 @@ from geopy.exc import (
     GeocoderParseError,
     GeocoderQueryError,
 )
+from geopy.keypool import PooledKey, uses_key_pool
 from geopy.location import Location
+from geopy.ratelimit import RateLimiter
 from geopy.util import logger
 
 try:
@@ -34,8 +36,14 @@ class GoogleV3(Geocoder):  # pylint: disable=R0902
     """
     Geocoder using the Google Maps v3 API. Documentation at:
         https://developers.google.com/maps/documentation/geocoding/
+
+    Requests to maps.googleapis.com are limited to 50 per second, the
+    service's own limit; see :mod:`geopy.ratelimit`.
     """
 
+    api_key = PooledKey()
+    rate_limiter = RateLimiter({'maps.googleapis.com': (50, 50)})
+
     def __init__(
             self,
             api_key=None,
@@ -59,6 +67,11 @@ class GoogleV3(Geocoder):  # pylint: disable=R0902
 
             .. versionadded:: 0.98.2
 
+            Several keys may be given, as a list or a
+            :class:`geopy.keypool.KeyPool`, to spread requests over them.
+
+            .. versionchanged:: 1.12.0
+
         :param string domain: Should be the localized Google Maps domain to
             connect to. The default is 'maps.googleapis.com', but if you're
             geocoding address in the UK (for example), you may want to set it
@@ -148,6 +161,7 @@ class GoogleV3(Geocoder):  # pylint: disable=R0902
       """
       return '%f,%f|%f,%f' % (bounds[0], bounds[1], bounds[2], bounds[3])
 
+    @uses_key_pool
     def geocode(
             self,
             query,
@@ -220,6 +234,7 @@ class GoogleV3(Geocoder):  # pylint: disable=R0902
             self._call_geocoder(url, timeout=timeout), exactly_one
         )
 
+    @uses_key_pool
     def reverse(
             self,
             query,
@@ -269,6 +284,7 @@ class GoogleV3(Geocoder):  # pylint: disable=R0902
             self._call_geocoder(url, timeout=timeout), exactly_one
         )
 
+    @uses_key_pool
     def timezone(self, location, at_time=None, timeout=None):
         """
         **This is an unstable API.**
@@ -353,6 +369,12 @@ class GoogleV3(Geocoder):  # pylint: disable=R0902
         else:
             return [parse_place(place) for place in places]
 
+    def _cacheable(self, response):
+        """
+        Responses with an error status are not cached.
+        """
+        return response.get('status') in ('OK', 'ZERO_RESULTS')
+
     @staticmethod
     def _check_status(status):
         """
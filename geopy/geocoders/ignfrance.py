@@ -4,9 +4,7 @@
 
 import xml.etree.ElementTree as ET
 
-from geopy.compat import (urlencode, HTTPPasswordMgrWithDefaultRealm,
-                          HTTPBasicAuthHandler, build_opener, u,
-                          install_opener, iteritems, Request)
+from geopy.compat import urlencode, u, iteritems, Request
 from geopy.geocoders.base import Geocoder, DEFAULT_TIMEOUT, DEFAULT_SCHEME
 from geopy.exc import (
     GeocoderQueryError,
@@ -316,53 +314,10 @@ class IGNFrance(Geocoder):   # pylint: disable=W0223
 
     def addSimpleHTTPAuthHeader(self):
         """
-        Create Urllib request object embedding HTTP simple authentication
+        Send HTTP simple authentication with every request made by this
+        geocoder. Credentials are held by this instance's transport only.
         """
-        sub_request = """
-        <GeocodeRequest returnFreeForm="{is_freeform}">
-            <Address countryCode="{query_type}">
-                <freeFormAddress>{query}</freeFormAddress>
-            </Address>
-        </GeocodeRequest>
-        """
-
-        xml_request = self.xml_request.format(
-            method_name='LocationUtilityService',
-            sub_request=sub_request,
-            maximum_responses=1
-        )
-
-        # Create query using parameters
-        request_string = xml_request.format(
-            is_freeform='false',
-            query='rennes',
-            query_type='PositionOfInterest'
-        )
-
-        params = {
-            'xls':  request_string
-        }
-
-        top_level_url = "?".join((self.api, urlencode(params)))
-        password_mgr = HTTPPasswordMgrWithDefaultRealm()
-
-        # Add the username and password.
-        # If we knew the realm, we could use it instead of None.
-        password_mgr.add_password(
-            None,
-            top_level_url,
-            self.username,
-            self.password
-        )
-
-        handler = HTTPBasicAuthHandler(password_mgr)
-
-        # create "opener" (OpenerDirector instance)
-        opener = build_opener(handler)
-
-        # Install the opener.
-        # Now all calls to urllib.request.urlopen use our opener.
-        install_opener(opener)
+        self.urlopen.auth = (self.username, self.password)
 
     def _parse_xml(self,
                    page,
@@ -181,6 +181,12 @@ class OpenCage(Geocoder):
         else:
             return [parse_place(place) for place in places]
 
+    def _cacheable(self, response):
+        """
+        Responses with an error status are not cached.
+        """
+        return response.get('status', {}).get('code') == 200
+
     @staticmethod
     def _check_status(status):
         """
@@ -10,6 +10,7 @@ from geopy.geocoders.base import (
 )
 from geopy.compat import urlencode
 from geopy.location import Location
+from geopy.ratelimit import RateLimiter
 from geopy.util import logger
 from geopy.exc import GeocoderQueryError
 
@@ -23,8 +24,13 @@ class Nominatim(Geocoder):
         https://wiki.openstreetmap.org/wiki/Nominatim
 
     Note that Nominatim does not support SSL.
+
+    Requests to nominatim.openstreetmap.org are limited to one per second,
+    as its usage policy requires; see :mod:`geopy.ratelimit`.
     """
 
+    rate_limiter = RateLimiter({'nominatim.openstreetmap.org': (1, 1)})
+
     structured_query_params = {
         'street',
         'city',
@@ -8,6 +8,7 @@ from geopy.exc import (
     GeocoderQuotaExceeded,
     GeocoderAuthenticationFailure,
 )
+from geopy.keypool import PooledKey, uses_key_pool
 from geopy.location import Location
 from geopy.util import logger
 
@@ -20,6 +21,8 @@ class Tencent(Geocoder):
         http://lbs.qq.com/webservice_v1/guide-geocoder.html
     """
 
+    api_key = PooledKey()
+
     def __init__(
             self,
             api_key,
@@ -36,6 +39,8 @@ class Tencent(Geocoder):
         :param string api_key: The API key required by Tencent Map to perform
             geocoding requests. API keys are managed through the Tencent APIs
             console (http://lbs.qq.com/mykey.html).
+            Several keys may be given, as a list or a
+            :class:`geopy.keypool.KeyPool`, to spread requests over them.
 
         :param string scheme: Use 'https' or 'http' as the API URL's scheme.
             Default is http and only http support.
@@ -65,6 +70,7 @@ class Tencent(Geocoder):
             )
         )
 
+    @uses_key_pool
     def geocode(
             self,
             query,
@@ -98,6 +104,7 @@ class Tencent(Geocoder):
             self._call_geocoder(url, timeout=timeout), exactly_one=exactly_one
         )
 
+    @uses_key_pool
     def reverse(self, query, timeout=None):  # pylint: disable=W0221
         """
         Given a point, find an address.
@@ -166,6 +173,12 @@ class Tencent(Geocoder):
         else:
             return [parse_place(item) for item in place]
 
+    def _cacheable(self, response):
+        """
+        Responses with an error status are not cached.
+        """
+        return response.get('status') == 0
+
     @staticmethod
     def _check_status(status):
         """
@@ -134,6 +134,12 @@ class What3Words(Geocoder):
             exactly_one
         )
 
+    def _cacheable(self, response):
+        """
+        Responses reporting an error are not cached.
+        """
+        return not response.get('error')
+
     def _parse_json(self, resources, exactly_one=True):
         """
         Parse type, words, latitude, and longitude and language from a
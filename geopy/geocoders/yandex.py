@@ -132,6 +132,12 @@ class Yandex(Geocoder): # pylint: disable=W0223
             exactly_one
         )
 
+    def _cacheable(self, response):
+        """
+        Responses reporting an error are not cached.
+        """
+        return not response.get('error')
+
     def _parse_json(self, doc, exactly_one):
         """
         Parse JSON response body.
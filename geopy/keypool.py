@@ -0,0 +1,237 @@
+"""
+Spreading requests over several API keys of one service.
+
+:class:`geopy.geocoders.GoogleV3`, :class:`geopy.geocoders.Bing`,
+:class:`geopy.geocoders.Baidu`, :class:`geopy.geocoders.GaoDe` and
+:class:`geopy.geocoders.Tencent` accept a :class:`.KeyPool`, or a list of
+keys, as their ``api_key``::
+
+    >>> from geopy.keypool import KeyPool
+    >>> from geopy.geocoders import GoogleV3
+    >>> keys = KeyPool(['key-1', 'key-2', 'key-3'], strategy='least_used')
+    >>> geolocator = GoogleV3(api_key=keys)
+
+Each call then uses a key of the pool. A key whose quota is used up, or
+which the service rejects, is benched for ``bench_for`` seconds, and the
+others are used meanwhile. ``stats()`` reports how each key is used::
+
+    >>> keys.stats()
+    {'key-1': KeyStats(requests=412, errors=1, benches=1, benched_for=3012.5),
+     'key-2': KeyStats(requests=418, errors=0, benches=0, benched_for=0.0),
+     'key-3': KeyStats(requests=417, errors=0, benches=0, benched_for=0.0)}
+
+.. versionadded:: 1.12.0
+"""
+
+import threading
+from collections import namedtuple
+from functools import wraps
+
+from geopy.compat import monotonic
+from geopy.exc import GeocoderAuthenticationFailure, GeocoderQuotaExceeded
+from geopy.geocoders import base
+
+
+__all__ = (
+    "KeyPool",
+    "KeyStats",
+    "PooledKey",
+    "uses_key_pool",
+)
+
+
+ROUND_ROBIN = 'round_robin'
+LEAST_USED = 'least_used'
+
+
+KeyStats = namedtuple(
+    "KeyStats", ("requests", "errors", "benches", "benched_for")
+)
+KeyStats.__doc__ = """
+Usage of one key of a :class:`.KeyPool`: the number of calls made with it,
+how many of them failed, how many times it was benched, and the seconds
+left until it is used again.
+"""
+
+
+class KeyPool(object):
+    """
+    API keys of one service, handed out round-robin or least-used first.
+    Thread-safe.
+    """
+
+    def __init__(
+            self,
+            keys,
+            strategy=ROUND_ROBIN,
+            bench_for=3600,
+            bench_on=(GeocoderQuotaExceeded, GeocoderAuthenticationFailure)
+        ):
+        """
+        :param list keys: API keys.
+
+        :param string strategy: ``'round_robin'`` to use the keys in turn,
+            or ``'least_used'`` to use the key with the fewest calls.
+
+        :param float bench_for: Seconds a failing key is left out for.
+
+        :param tuple bench_on: Exceptions for which a key is benched.
+        """
+        keys = list(keys)
+        if not keys:
+            raise ValueError("keys must not be empty")
+        if strategy not in (ROUND_ROBIN, LEAST_USED):
+            raise ValueError(
+                "strategy must be '%s' or '%s'" % (ROUND_ROBIN, LEAST_USED)
+            )
+        self.keys = keys
+        self.strategy = strategy
+        self.bench_for = bench_for
+        self.bench_on = tuple(bench_on)
+        self._requests = dict((key, 0) for key in keys)
+        self._errors = dict((key, 0) for key in keys)
+        self._benches = dict((key, 0) for key in keys)
+        self._benched_until = dict((key, 0.) for key in keys)
+        self._next = 0
+        self._lock = threading.Lock()
+
+    def get(self):
+        """
+        The key to make the next call with. Raises
+        :class:`geopy.exc.GeocoderQuotaExceeded` if every key is benched.
+        """
+        now = monotonic()
+        with self._lock:
+            available = [
+                key for key in self.keys if self._benched_until[key] <= now
+            ]
+            if not available:
+                retry_after = min(self._benched_until.values()) - now
+                error = GeocoderQuotaExceeded(
+                    'All %d API keys are benched.' % len(self.keys)
+                )
+                error.retry_after = retry_after
+                raise error
+            if self.strategy == LEAST_USED:
+                key = min(available, key=self._requests.__getitem__)
+            else:
+                count = len(self.keys)
+                for offset in range(count):
+                    key = self.keys[(self._next + offset) % count]
+                    if self._benched_until[key] <= now:
+                        self._next = (self._next + offset + 1) % count
+                        break
+            self._requests[key] += 1
+        return key
+
+    def record(self, key, error=None):
+        """
+        Record the outcome of a call made with ``key``: the exception it
+        raised, or None if it succeeded. Keys are benched for the errors
+        in ``bench_on``.
+        """
+        if error is None:
+            return
+        with self._lock:
+            self._errors[key] += 1
+            if isinstance(error, self.bench_on):
+                self._benches[key] += 1
+                self._benched_until[key] = monotonic() + self.bench_for
+
+    def bench(self, key, seconds=None):
+        """
+        Leave ``key`` out for ``seconds``, by default ``bench_for``.
+        """
+        with self._lock:
+            self._benches[key] += 1
+            self._benched_until[key] = monotonic() + (
+                seconds if seconds is not None else self.bench_for
+            )
+
+    def stats(self):
+        """
+        :class:`.KeyStats` of every key, by key.
+        """
+        now = monotonic()
+        with self._lock:
+            return dict(
+                (key, KeyStats(
+                    self._requests[key],
+                    self._errors[key],
+                    self._benches[key],
+                    max(0., self._benched_until[key] - now),
+                ))
+                for key in self.keys
+            )
+
+    def __len__(self):
+        return len(self.keys)
+
+
+# Key drawn from each pool for the call running on this thread.
+_bound = threading.local() # pylint: disable=C0103
+
+
+class PooledKey(object):
+    """
+    Descriptor for the ``api_key`` attribute of geocoders which accept a
+    :class:`.KeyPool`: reads as the key drawn for the call in progress, in
+    methods decorated with :func:`uses_key_pool`, and as the pool
+    elsewhere. A list of keys assigned to it becomes a pool.
+    """
+
+    def __init__(self, name='_api_key'):
+        self.name = name
+
+    def __get__(self, geocoder, owner=None):
+        if geocoder is None:
+            return self
+        value = getattr(geocoder, self.name, None)
+        if isinstance(value, KeyPool):
+            return getattr(_bound, 'keys', {}).get(id(value), value)
+        return value
+
+    def __set__(self, geocoder, value):
+        if isinstance(value, (list, tuple)):
+            value = KeyPool(value)
+        setattr(geocoder, self.name, value)
+
+
+def uses_key_pool(method):
+    """
+    Decorate a geocoder method so that, when the geocoder's ``api_key`` is
+    a :class:`.KeyPool`, the whole call, including the parsing of the
+    response, uses a single key of the pool, whose outcome is recorded.
+    """
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        """
+        Run ``method`` with a key drawn from the pool.
+        """
+        pool = getattr(self, '_api_key', None)
+        if not isinstance(pool, KeyPool):
+            return method(self, *args, **kwargs)
+        keys = _bound.__dict__.setdefault('keys', {})
+        if id(pool) in keys:
+            # Already bound by an enclosing call.
+            return method(self, *args, **kwargs)
+        # geopy.aio runs the method again for every response it fetches;
+        # every run must send the same key.
+        replayed = getattr(base._deferred, 'keys', None) # pylint: disable=W0212
+        if replayed is not None and id(pool) in replayed:
+            key = replayed[id(pool)]
+        else:
+            key = pool.get()
+            if replayed is not None:
+                replayed[id(pool)] = key
+        keys[id(pool)] = key
+        try:
+            result = method(self, *args, **kwargs)
+        except Exception as error:
+            pool.record(key, error)
+            raise
+        finally:
+            del keys[id(pool)]
+        pool.record(key)
+        return result
+    return wrapper
@@ -16,7 +16,7 @@ class Location(object): # pylint: disable=R0903,R0921
     .. versionadded:: 0.98
     """
 
-    __slots__ = ("_address", "_point", "_tuple", "_raw")
+    __slots__ = ("_address", "_point", "_tuple", "_raw", "_provider")
 
     def __init__(self, address="", point=None, raw=None):
         self._address = address
@@ -35,6 +35,7 @@ class Location(object): # pylint: disable=R0903,R0921
             )
         self._tuple = (self._address, (self._point[0], self._point[1]))
         self._raw = raw
+        self._provider = None
 
     @property
     def address(self):
@@ -93,6 +94,18 @@ class Location(object): # pylint: disable=R0903,R0921
         """
         return self._raw
 
+    @property
+    def provider(self):
+        """
+        Geocoder which found the location, when it was looked up through a
+        :class:`geopy.geocoders.CompositeGeocoder`.
+
+        .. versionadded:: 1.12.0
+
+        :rtype: :class:`geopy.geocoders.base.Geocoder` or None
+        """
+        return self._provider
+
     def __getitem__(self, index):
         """
         Backwards compatibility with geopy<0.98 tuples.
@@ -4,6 +4,7 @@
 """
 
 import re
+from array import array
 from itertools import islice
 from geopy import util, units
 from geopy.format import (
@@ -15,6 +16,19 @@ from geopy.format import (
 )
 from geopy.compat import string_compare
 
+try:
+    from importlib.util import find_spec
+except ImportError: # pragma: no cover
+    try:
+        import numpy
+        numpy_available = True
+    except ImportError:
+        numpy_available = False
+else:
+    # NumPy takes longer to import than the rest of geopy, so it is only
+    # imported once a PointArray is made.
+    numpy_available = find_spec('numpy') is not None
+
 
 POINT_PATTERN = re.compile(r"""
     .*?
@@ -44,6 +58,30 @@ POINT_PATTERN = re.compile(r"""
     "SEP": r'\s*[,;/\s]\s*',
 }, re.X)
 
+# Plain decimal "latitude, longitude", which :meth:`Point.from_string` would
+# read as such, so that it can be parsed without ``POINT_PATTERN``.
+PLAIN_POINT_PATTERN = re.compile(
+    r"\s*(-?\d+(?:\.\d+)?)\s*[,;/\s]\s*(-?\d+(?:\.\d+)?)\s*$"
+)
+
+
+def _normalize_latitude(latitude):
+    """
+    Wrap a latitude in degrees into [-90, 90].
+    """
+    if abs(latitude) > 90:
+        latitude = ((latitude + 90) % 180) - 90
+    return latitude
+
+
+def _normalize_longitude(longitude):
+    """
+    Wrap a longitude in degrees into [-180, 180].
+    """
+    if abs(longitude) > 180:
+        longitude = ((longitude + 180) % 360) - 180
+    return longitude
+
 
 class Point(object):
     """
@@ -97,9 +135,14 @@ class Point(object):
 
         >>> latitude, longitude, altitude = p
 
+    Points are hashable, and equal points hash alike, so they can be used
+    as dictionary keys or deduplicated with a set. A point's hash follows
+    its coordinates: what happens to a dictionary or set holding a point
+    whose coordinates are then changed is undefined.
+
     """
 
-    __slots__ = ("latitude", "longitude", "altitude", "_items")
+    __slots__ = ("latitude", "longitude", "altitude")
 
     POINT_PATTERN = POINT_PATTERN
 
@@ -118,6 +161,8 @@ class Point(object):
                 return cls.from_point(arg)
             elif isinstance(arg, string_compare):
                 return cls.from_string(arg)
+            elif isinstance(arg, (tuple, list)) and len(arg) <= 3:
+                return cls(*arg)
             else:
                 try:
                     seq = iter(arg)
@@ -129,12 +174,12 @@ class Point(object):
                     return cls.from_sequence(seq)
 
         latitude = float(latitude or 0.0)
-        if abs(latitude) > 90:
-            latitude = ((latitude + 90) % 180) - 90
+        if not -90 <= latitude <= 90:
+            latitude = _normalize_latitude(latitude)
 
         longitude = float(longitude or 0.0)
-        if abs(longitude) > 180:
-            longitude = ((longitude + 180) % 360) - 180
+        if not -180 <= longitude <= 180:
+            longitude = _normalize_longitude(longitude)
 
         altitude = float(altitude or 0.0)
 
@@ -142,20 +187,23 @@ class Point(object):
         self.latitude = latitude
         self.longitude = longitude
         self.altitude = altitude
-        self._items = [self.latitude, self.longitude, self.altitude]
         return self
 
     def __getitem__(self, index):
-        return self._items[index]
+        return (self.latitude, self.longitude, self.altitude)[index]
 
     def __setitem__(self, index, value):
-        self._items[index] = value
+        items = [self.latitude, self.longitude, self.altitude]
+        items[index] = value
+        self.latitude, self.longitude, self.altitude = items
 
     def __iter__(self):
         return iter((self.latitude, self.longitude, self.altitude))
 
     def __repr__(self):
-        return "Point(%r, %r, %r)" % tuple(self._items)
+        return "Point(%r, %r, %r)" % (
+            self.latitude, self.longitude, self.altitude
+        )
 
     def format(self, altitude=None, deg_char='', min_char='m', sec_char='s'):
         """
@@ -214,10 +262,20 @@ class Point(object):
         )
 
     def __eq__(self, other):
+        if isinstance(other, Point):
+            return (
+                self.latitude == other.latitude and
+                self.longitude == other.longitude and
+                self.altitude == other.altitude
+            )
         return tuple(self) == tuple(other)
 
     def __ne__(self, other):
-        return tuple(self) != tuple(other)
+        return not self == other
+
+    def __hash__(self):
+        # The same as the hash of the tuple the point is equal to.
+        return hash((self.latitude, self.longitude, self.altitude))
 
     @classmethod
     def parse_degrees(cls, degrees, arcminutes, arcseconds, direction=None):
@@ -342,6 +400,16 @@ class Point(object):
                 "Failed to create Point instance from string: unknown format."
             )
 
+    @classmethod
+    def parse_many(cls, strings):
+        """
+        Parse many strings at once, into a :class:`.PointArray`. See
+        :meth:`PointArray.from_strings`.
+
+        .. versionadded:: 1.12.0
+        """
+        return PointArray.from_strings(strings)
+
     @classmethod
     def from_sequence(cls, seq):
         """
@@ -359,3 +427,248 @@ class Point(object):
         instance.
         """
         return cls(point.latitude, point.longitude, point.altitude)
+
+
+def _column(values):
+    """
+    Contiguous buffer of floats: a NumPy array, or without NumPy a
+    memoryview of an ``array('d')``, which can be sliced without copying.
+    """
+    if numpy_available:
+        import numpy # pylint: disable=W0621
+        return numpy.array(values, dtype=float)
+    if not isinstance(values, array) or values.typecode != 'd':
+        values = array('d', values)
+    return memoryview(values)
+
+
+class PointView(Point):
+    """
+    A point of a :class:`.PointArray`. It behaves as a :class:`.Point`, but
+    holds no coordinates of its own: they are read from, and written to,
+    the array's buffers. As with points, do not change the array while
+    views of it are in a set or dictionary.
+
+    Views are made by indexing or iterating over the array. Copying or
+    pickling a view gives a plain :class:`.Point` of its coordinates.
+
+    .. versionadded:: 1.12.0
+    """
+
+    __slots__ = ("_array", "_index")
+
+    @classmethod
+    def _of(cls, point_array, index):
+        """
+        View of the point at ``index`` of ``point_array``, made without
+        going through :meth:`Point.__new__`.
+        """
+        # Set here rather than in __init__, since Point.__new__ takes
+        # coordinates rather than an array.
+        # pylint: disable=W0201
+        self = object.__new__(cls)
+        self._array = point_array
+        self._index = index
+        return self
+
+    def __reduce__(self):
+        return (Point, (self.latitude, self.longitude, self.altitude))
+
+    @property
+    def latitude(self): # pylint: disable=C0111
+        return float(self._array.latitudes[self._index])
+
+    @latitude.setter
+    def latitude(self, value): # pylint: disable=C0111
+        self._array.latitudes[self._index] = value
+
+    @property
+    def longitude(self): # pylint: disable=C0111
+        return float(self._array.longitudes[self._index])
+
+    @longitude.setter
+    def longitude(self, value): # pylint: disable=C0111
+        self._array.longitudes[self._index] = value
+
+    @property
+    def altitude(self): # pylint: disable=C0111
+        return float(self._array.altitudes[self._index])
+
+    @altitude.setter
+    def altitude(self, value): # pylint: disable=C0111
+        self._array.altitudes[self._index] = value
+
+
+class PointArray(object):
+    """
+    An array of points, stored by column in contiguous buffers of floats,
+    which take 24 bytes per point instead of the 80 or more a
+    :class:`.Point` object costs. Coordinates are normalized as by
+    :class:`.Point`.
+
+    The columns ``latitudes``, ``longitudes`` and ``altitudes`` are NumPy
+    arrays when NumPy is installed, and memoryviews of ``array('d')``
+    otherwise. Either way they support the buffer protocol, e.g.
+    ``numpy.frombuffer(points.latitudes)`` or writing them to a file, and
+    slicing the array, as in ``points[1000:2000]``, makes a new
+    ``PointArray`` over the same buffers rather than a copy.
+
+    Indexing and iteration give a :class:`.PointView` of each point::
+
+        >>> points = PointArray([41.5, 40.7], [-81.0, -74.0])
+        >>> points[1]
+        Point(40.7, -74.0, 0.0)
+        >>> [point.latitude for point in points]
+        [41.5, 40.7]
+
+    The distance classes of :mod:`geopy.distance` accept it wherever they
+    take a sequence of points.
+
+    .. versionadded:: 1.12.0
+    """
+
+    __slots__ = ("latitudes", "longitudes", "altitudes")
+
+    def __init__(self, latitudes=(), longitudes=(), altitudes=None):
+        """
+        :param latitudes: Latitudes in degrees, as any sequence of numbers.
+        :param longitudes: Longitudes in degrees.
+        :param altitudes: Altitudes in kilometers, by default all 0.
+        """
+        if numpy_available:
+            import numpy # pylint: disable=W0621
+            latitudes = numpy.asarray(latitudes, dtype=float)
+            longitudes = numpy.asarray(longitudes, dtype=float)
+            latitudes = numpy.where(
+                numpy.abs(latitudes) > 90, (latitudes + 90) % 180 - 90,
+                latitudes
+            )
+            longitudes = numpy.where(
+                numpy.abs(longitudes) > 180, (longitudes + 180) % 360 - 180,
+                longitudes
+            )
+        else:
+            latitudes = [_normalize_latitude(float(lat)) for lat in latitudes]
+            longitudes = [
+                _normalize_longitude(float(lng)) for lng in longitudes
+            ]
+        if altitudes is None:
+            altitudes = array('d', [0.0]) * len(latitudes)
+        if not len(latitudes) == len(longitudes) == len(altitudes):
+            raise ValueError("Coordinate sequences differ in length.")
+        self.latitudes = _column(latitudes)
+        self.longitudes = _column(longitudes)
+        self.altitudes = _column(altitudes)
+
+    @classmethod
+    def from_points(cls, points):
+        """
+        Create a ``PointArray`` from an iterable of anything
+        :class:`.Point` accepts, e.g. (latitude, longitude) tuples.
+        """
+        latitudes, longitudes, altitudes = array('d'), array('d'), array('d')
+        for point in points:
+            point = Point(point)
+            latitudes.append(point.latitude)
+            longitudes.append(point.longitude)
+            altitudes.append(point.altitude)
+        return cls._from_columns(
+            _column(latitudes), _column(longitudes), _column(altitudes)
+        )
+
+    @classmethod
+    def from_strings(cls, strings):
+        """
+        Parse an iterable of strings, such as the lines of a file, as
+        :meth:`Point.from_string` would, into one point per string.
+
+        Plain decimal coordinates, as in "41.5,-81.0", are read without
+        the full pattern of :meth:`Point.from_string`, which is only used
+        for the other strings, e.g. in degrees, minutes and seconds.
+
+        A string which cannot be parsed does not stop the others from
+        being read: its point's coordinates are NaN, and it is reported in
+        the list of errors returned along with the points::
+
+            >>> points, errors = PointArray.from_strings(lines)
+            >>> for index, error in errors:
+            ...     logger.warning("line %d: %s", index + 1, error)
+
+        :returns: (:class:`.PointArray`, list of (index, ``ValueError``))
+        """
+        latitudes, longitudes, altitudes = array('d'), array('d'), array('d')
+        errors = []
+        match_plain = PLAIN_POINT_PATTERN.match
+        nan = float('nan')
+        for index, string in enumerate(strings):
+            match = match_plain(string) if isinstance(
+                string, string_compare
+            ) else None
+            if match is not None:
+                latitude, longitude = match.groups()
+                latitude, longitude = float(latitude), float(longitude)
+                if not -90 <= latitude <= 90:
+                    latitude = _normalize_latitude(latitude)
+                if not -180 <= longitude <= 180:
+                    longitude = _normalize_longitude(longitude)
+                latitudes.append(latitude)
+                longitudes.append(longitude)
+                altitudes.append(0.0)
+                continue
+            try:
+                if not isinstance(string, string_compare):
+                    raise ValueError(
+                        "Failed to create Point instance from %r." % (string,)
+                    )
+                point = Point.from_string(string)
+            except ValueError as error:
+                errors.append((index, error))
+                latitudes.append(nan)
+                longitudes.append(nan)
+                altitudes.append(nan)
+            else:
+                latitudes.append(point.latitude)
+                longitudes.append(point.longitude)
+                altitudes.append(point.altitude)
+        points = cls._from_columns(
+            _column(latitudes), _column(longitudes), _column(altitudes)
+        )
+        return points, errors
+
+    @classmethod
+    def _from_columns(cls, latitudes, longitudes, altitudes):
+        """
+        Wrap columns which are already normalized, without copying them.
+        """
+        self = object.__new__(cls)
+        self.latitudes = latitudes
+        self.longitudes = longitudes
+        self.altitudes = altitudes
+        return self
+
+    def __len__(self):
+        return len(self.latitudes)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self._from_columns(
+                self.latitudes[index],
+                self.longitudes[index],
+                self.altitudes[index],
+            )
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("PointArray index out of range")
+        return PointView._of(self, index)
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield PointView._of(self, index)
+
+    def __repr__(self):
+        return "PointArray(%r, %r, %r)" % (
+            self.latitudes.tolist(),
+            self.longitudes.tolist(),
+            self.altitudes.tolist(),
+        )
@@ -0,0 +1,389 @@
+"""
+Client-side rate limiting of geocoder requests.
+
+A geocoder waits for its ``rate_limiter``, if it has one, before each
+request it sends. Services with a published usage policy come with one;
+e.g. :class:`geopy.geocoders.Nominatim` sends at most one request per
+second to ``nominatim.openstreetmap.org``. Limits may be changed for every
+geocoder of a class, or for a single geocoder::
+
+    >>> from geopy.ratelimit import RateLimiter, TokenBucket
+    >>> from geopy.geocoders import GoogleV3, Nominatim
+    >>> GoogleV3.rate_limiter = RateLimiter({'maps.googleapis.com': (10, 20)})
+    >>> geolocator = Nominatim(domain='nominatim.example.com')
+    >>> geolocator.rate_limiter = TokenBucket(rate=20, burst=5)
+
+Requests over the limit are delayed rather than refused, so a burst of
+requests is spread out over time at the configured rate. Limiters may be
+shared by any number of threads, and :class:`geopy.aio.AsyncGeocoder` waits
+for them without blocking the event loop.
+
+Worker processes sharing an API key share its limits through a
+:class:`.SQLiteRateLimiter`, which also enforces a daily quota::
+
+    >>> from geopy.ratelimit import SQLiteRateLimiter
+    >>> GoogleV3.rate_limiter = SQLiteRateLimiter(
+    ...     '/var/lib/geopy/limits.sqlite',
+    ...     rate=50, burst=50, daily_quota=100000,
+    ... )
+    >>> GoogleV3.rate_limiter.budgets()
+    [Budget(name='maps.googleapis.com:5ba4c8d0', tokens=48.2, used=5310,
+            remaining=94690)]
+
+.. versionadded:: 1.12.0
+"""
+
+import hashlib
+import os
+import threading
+from collections import namedtuple
+from time import gmtime, sleep, strftime, time
+
+try:
+    import sqlite3
+    sqlite3_available = True
+except ImportError: # pragma: no cover
+    sqlite3_available = False
+
+from geopy.compat import monotonic, urlparse
+from geopy.exc import GeocoderQuotaExceeded
+
+
+__all__ = (
+    "TokenBucket",
+    "RateLimiter",
+    "SQLiteRateLimiter",
+    "Budget",
+)
+
+
+Budget = namedtuple("Budget", ("name", "tokens", "used", "remaining"))
+Budget.__doc__ = """
+State of one :class:`.SQLiteRateLimiter` bucket: its ``name``, the number
+of ``tokens`` available now (negative while callers wait for their turn),
+and the number of requests ``used`` today and ``remaining`` in the daily
+quota (None without a quota).
+"""
+
+
+def _utc_day(timestamp):
+    """
+    The UTC date of ``timestamp``, e.g. "2017-05-31", on which daily quotas
+    are reset.
+    """
+    return strftime('%Y-%m-%d', gmtime(timestamp))
+
+
+class TokenBucket(object):
+    """
+    Token bucket allowing ``rate`` requests per second on average, and up
+    to ``burst`` requests at once after a quiet period.
+
+    Every request takes a token, and tokens are added back at ``rate`` per
+    second up to ``burst``. When the bucket is empty, callers are queued:
+    each is told how long to wait for its turn, so concurrent callers are
+    spaced ``1 / rate`` seconds apart in the order they arrived.
+    """
+
+    def __init__(self, rate, burst=1):
+        """
+        :param float rate: Requests per second.
+
+        :param int burst: Number of requests which may be sent at once.
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        if burst < 1:
+            raise ValueError("burst must be at least 1")
+        self.rate = float(rate)
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now):
+        """
+        Add the tokens earned since the last update. Call with the lock held.
+        """
+        self._tokens = min(
+            self.burst, self._tokens + (now - self._updated) * self.rate
+        )
+        self._updated = now
+
+    @property
+    def tokens(self):
+        """
+        Number of requests which may be sent right now. Negative while
+        callers are waiting for their turn.
+        """
+        with self._lock:
+            self._refill(monotonic())
+            return self._tokens
+
+    def reserve(self, url=None, key=None): # pylint: disable=W0613
+        """
+        Take a token, and return the number of seconds to wait before
+        sending the request it pays for.
+
+        :param string url: The request's url. A bucket limits every request
+            alike, so it is ignored, as is the request's API ``key``.
+        """
+        with self._lock:
+            self._refill(monotonic())
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.
+            return -self._tokens / self.rate
+
+    def acquire(self, url=None, key=None):
+        """
+        Wait until a request may be sent. Returns the time waited.
+        """
+        delay = self.reserve(url, key)
+        if delay > 0:
+            sleep(delay)
+        return delay
+
+
+class RateLimiter(object):
+    """
+    Rate limits by host: requests to each host listed in ``policies`` go
+    through a :class:`.TokenBucket` of their own.
+    """
+
+    def __init__(self, policies=None, default=None):
+        """
+        :param dict policies: ``(rate, burst)`` by host name, e.g.
+            {"nominatim.openstreetmap.org": (1, 1)}.
+
+        :param tuple default: ``(rate, burst)`` of hosts not in
+            ``policies``. By default they are not limited.
+        """
+        self.policies = dict(policies or {})
+        self.default = default
+        self.buckets = {}
+        self._lock = threading.Lock()
+
+    def bucket(self, host):
+        """
+        The :class:`.TokenBucket` of ``host``, or None if it is not limited.
+        """
+        bucket = self.buckets.get(host)
+        if bucket is None:
+            policy = self.policies.get(host, self.default)
+            if policy is None:
+                return None
+            with self._lock:
+                bucket = self.buckets.get(host)
+                if bucket is None:
+                    bucket = self.buckets[host] = TokenBucket(*policy)
+        return bucket
+
+    def reserve(self, url, key=None):
+        """
+        Take a token from the bucket of ``url``'s host, and return the number
+        of seconds to wait before sending the request.
+        """
+        bucket = self.bucket(urlparse(url).hostname)
+        if bucket is None:
+            return 0.
+        return bucket.reserve(url, key)
+
+    def acquire(self, url, key=None):
+        """
+        Wait until a request to ``url`` may be sent. Returns the time waited.
+        """
+        delay = self.reserve(url, key)
+        if delay > 0:
+            sleep(delay)
+        return delay
+
+
+class SQLiteRateLimiter(object):
+    """
+    Token buckets and daily quotas kept in an SQLite database, so that every
+    process on a host using the same file shares them.
+
+    There is a bucket for each host and API key: workers using one key
+    share its limits, while requests made with different keys are limited
+    separately. Keys are not stored; buckets are named after the host and a
+    digest of the key, e.g. ``maps.googleapis.com:5ba4c8d0``.
+
+    Requests beyond ``rate`` are delayed as with :class:`.TokenBucket`.
+    Once ``daily_quota`` requests have been made on a UTC day, further
+    requests raise :class:`geopy.exc.GeocoderQuotaExceeded` until the next.
+    """
+
+    def __init__(
+            self,
+            path,
+            rate=None,
+            burst=1,
+            daily_quota=None,
+            timeout=30
+        ): # pylint: disable=R0913
+        """
+        :param string path: Database file. It is created if missing.
+
+        :param float rate: Requests per second. By default only the daily
+            quota is enforced.
+
+        :param int burst: Number of requests which may be sent at once.
+
+        :param int daily_quota: Requests allowed per UTC day. By default
+            there is no quota.
+
+        :param float timeout: Seconds to wait for another process holding a
+            lock on the database.
+        """
+        if not sqlite3_available: # pragma: no cover
+            raise ImportError(
+                'sqlite3 is needed for SQLiteRateLimiter; Python was built '
+                'without it.'
+            )
+        if rate is not None and rate <= 0:
+            raise ValueError("rate must be positive")
+        if burst < 1:
+            raise ValueError("burst must be at least 1")
+        self.path = path
+        self.rate = float(rate) if rate is not None else None
+        self.burst = burst
+        self.daily_quota = daily_quota
+        self.timeout = timeout
+        self._local = threading.local()
+        self._connect()
+
+    def _connect(self):
+        """
+        This thread's connection to the database. Connections are not
+        shared between threads, nor inherited by forked processes.
+        """
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None and self._local.pid == os.getpid():
+            return conn
+        conn = sqlite3.connect(
+            self.path, timeout=self.timeout, isolation_level=None
+        )
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute(
+            'CREATE TABLE IF NOT EXISTS budgets ('
+            ' name TEXT PRIMARY KEY,'
+            ' tokens REAL NOT NULL,'
+            ' updated REAL NOT NULL,'
+            ' day TEXT NOT NULL,'
+            ' used INTEGER NOT NULL)'
+        )
+        self._local.conn = conn
+        self._local.pid = os.getpid()
+        return conn
+
+    @staticmethod
+    def bucket_name(url, key=None):
+        """
+        Name of the bucket of requests to ``url`` made with API ``key``.
+        """
+        host = urlparse(url).hostname or ''
+        if not key:
+            return host
+        digest = hashlib.sha1(key.encode('utf-8')).hexdigest()
+        return ':'.join((host, digest[:8]))
+
+    def _refilled(self, tokens, updated, now):
+        """
+        Tokens of a bucket last updated at ``updated``.
+        """
+        if self.rate is None:
+            return float(self.burst)
+        return min(self.burst, tokens + (now - updated) * self.rate)
+
+    def _budget(self, name, tokens, updated, day, used, now, today):
+        """
+        :class:`.Budget` of a row of the database as of ``now``.
+        """
+        if day != today:
+            used = 0
+        remaining = None
+        if self.daily_quota is not None:
+            remaining = max(0, self.daily_quota - used)
+        tokens = self._refilled(tokens, updated, now)
+        return Budget(name, tokens, used, remaining)
+
+    def reserve(self, url, key=None):
+        """
+        Take a token from the bucket of ``url``'s host and API ``key``, and
+        return the number of seconds to wait before sending the request.
+        Raises :class:`geopy.exc.GeocoderQuotaExceeded` if the day's quota
+        is used up.
+        """
+        name = self.bucket_name(url, key)
+        now = time()
+        today = _utc_day(now)
+        conn = self._connect()
+        # Taking the write lock up front serializes the processes.
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            row = conn.execute(
+                'SELECT tokens, updated, day, used FROM budgets WHERE name = ?',
+                (name, )
+            ).fetchone()
+            if row is None:
+                row = (float(self.burst), now, today, 0)
+            budget = self._budget(name, *(row + (now, today)))
+            if budget.remaining == 0:
+                raise GeocoderQuotaExceeded(
+                    'The daily quota of %d requests for %s is used up.' % (
+                        self.daily_quota, name
+                    )
+                )
+            tokens = budget.tokens
+            if self.rate is not None:
+                tokens -= 1
+            conn.execute(
+                'INSERT OR REPLACE INTO budgets'
+                ' (name, tokens, updated, day, used) VALUES (?, ?, ?, ?, ?)',
+                (name, tokens, now, today, budget.used + 1)
+            )
+        except BaseException:
+            conn.execute('ROLLBACK')
+            raise
+        conn.execute('COMMIT')
+        if tokens >= 0:
+            return 0.
+        return -tokens / self.rate
+
+    def acquire(self, url, key=None):
+        """
+        Wait until a request to ``url`` may be sent. Returns the time waited.
+        """
+        delay = self.reserve(url, key)
+        if delay > 0:
+            sleep(delay)
+        return delay
+
+    def budgets(self):
+        """
+        List the :class:`.Budget` of every bucket, as seen by all processes.
+        """
+        now = time()
+        today = _utc_day(now)
+        return [
+            self._budget(*(row + (now, today)))
+            for row in self._connect().execute(
+                'SELECT name, tokens, updated, day, used FROM budgets'
+                ' ORDER BY name'
+            )
+        ]
+
+    def budget(self, url, key=None):
+        """
+        The :class:`.Budget` of requests to ``url`` made with API ``key``.
+        """
+        name = self.bucket_name(url, key)
+        now = time()
+        row = self._connect().execute(
+            'SELECT tokens, updated, day, used FROM budgets WHERE name = ?',
+            (name, )
+        ).fetchone()
+        if row is None:
+            row = (float(self.burst), now, '', 0)
+        return self._budget(name, *(row + (now, _utc_day(now))))
@@ -0,0 +1,125 @@
+"""
+Retrying failed geocoder requests.
+
+A geocoder sends a request again when it fails with an error its
+``retry_policy`` deems transient: a server error status (5xx), too many
+requests (429), or a service which could not be reached or did not answer
+in time::
+
+    >>> from geopy.retry import RetryPolicy
+    >>> from geopy.geocoders import Bing
+    >>> geolocator = Bing(api_key)
+    >>> geolocator.retry_policy = RetryPolicy(attempts=4, deadline=10)
+
+or, for every geocoder::
+
+    >>> from geopy.geocoders.base import Geocoder
+    >>> Geocoder.retry_policy = RetryPolicy()
+
+Retries are spaced by exponential backoff with full jitter: before the
+n-th retry, the geocoder waits a random time between zero and
+``backoff * 2 ** (n - 1)`` seconds, so that clients which failed together
+do not retry together. A service asking for more time with ``Retry-After``
+is given it.
+
+.. versionadded:: 1.12.0
+"""
+
+import random
+from time import time
+
+from geopy.exc import (
+    GeocoderQuotaExceeded,
+    GeocoderTimedOut,
+    GeocoderUnavailable,
+)
+
+
+__all__ = (
+    "RetryPolicy",
+    "RETRYABLE_ERRORS",
+)
+
+
+# Errors of unreachable or unresponsive services, retried whatever their
+# status. They are matched by exact class, since other errors, e.g.
+# GeocoderCircuitOpen, derive from them.
+RETRYABLE_ERRORS = frozenset([GeocoderTimedOut, GeocoderUnavailable])
+
+
+class RetryPolicy(object):
+    """
+    When to send a failed request again.
+    """
+
+    def __init__(
+            self,
+            attempts=3,
+            retry_on=RETRYABLE_ERRORS,
+            backoff=0.5,
+            max_backoff=30,
+            jitter=True,
+            deadline=None
+        ): # pylint: disable=R0913
+        """
+        :param int attempts: Number of times a request is sent, at most.
+
+        :param retry_on: Classes of the :class:`geopy.exc.GeopyError`
+            retried, besides errors with a 5xx or 429 ``status`` and
+            exceeded quotas the service says when to retry. Subclasses are
+            not retried unless listed.
+
+        :param float backoff: Longest wait, in seconds, before the first
+            retry. It doubles with each retry.
+
+        :param float max_backoff: Longest wait before any retry, unless the
+            service asks for more with ``Retry-After``.
+
+        :param bool jitter: Wait a random fraction of the backoff, rather
+            than all of it.
+
+        :param float deadline: Seconds after the first attempt past which
+            no retry is started. By default only ``attempts`` limits
+            retries.
+        """
+        if attempts < 1:
+            raise ValueError("attempts must be at least 1")
+        self.attempts = attempts
+        self.retry_on = frozenset(retry_on)
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.deadline = deadline
+
+    def retryable(self, error):
+        """
+        Whether ``error`` is transient: a server error status, too many
+        requests, an exceeded quota with a ``Retry-After``, or one of
+        ``retry_on``. Other statuses, e.g. 404, are client mistakes.
+        """
+        if type(error) in self.retry_on:
+            return True
+        if isinstance(error, GeocoderQuotaExceeded) and getattr(
+                error, 'retry_after', None
+        ) is not None:
+            return True
+        status = getattr(error, 'status', None)
+        return status is not None and (status == 429 or status >= 500)
+
+    def delay(self, error, attempt, started):
+        """
+        Seconds to wait before retrying a request which failed with
+        ``error`` on its ``attempt``-th attempt, the first made at time
+        ``started``, or None if it should not be retried.
+        """
+        if attempt >= self.attempts or not self.retryable(error):
+            return None
+        delay = min(self.max_backoff, self.backoff * 2 ** (attempt - 1))
+        if self.jitter:
+            delay = random.uniform(0, delay)
+        retry_after = getattr(error, 'retry_after', None)
+        if retry_after is not None:
+            delay = max(delay, retry_after)
+        if self.deadline is not None and time() + delay - started > self.deadline:
+            return None
+        return delay
@@ -33,10 +33,15 @@ logger.setLevel(logging.CRITICAL)
 
 def pairwise(seq):
     """
-    Pair an iterable, e.g., (1, 2, 3, 4) -> ((1, 2), (3, 4))
+    Pair consecutive items of an iterable, e.g.,
+    (1, 2, 3, 4) -> ((1, 2), (2, 3), (3, 4)). ``seq`` is read lazily, so it
+    may be any iterator.
     """
-    for i in range(0, len(seq) - 1):
-        yield (seq[i], seq[i + 1])
+    items = iter(seq)
+    for previous in items:
+        for item in items:
+            yield (previous, item)
+            previous = item
 
 
 if not py3k:
@@ -54,21 +59,18 @@ else:
 
 
 if not py3k:
-    def decode_page(page):
+    def _page_body(page):
         """
-        Return unicode string of geocoder results.
-
-        Nearly all services use JSON, so assume UTF8 encoding unless the
-        response specifies otherwise.
+        Return the body of geocoder results, and its encoding.
         """
         if hasattr(page, 'read'): # urllib
             # note getparam in py2
             encoding = page.headers.getparam("charset") or "utf-8"
-            return unicode(page.read(), encoding=encoding)
+            return page.read(), encoding
         else: # requests?
             encoding = page.headers.get("charset", "utf-8")
-            return unicode(page.content, encoding=encoding)
-else:
+            return page.content, encoding
+
     def decode_page(page):
         """
         Return unicode string of geocoder results.
@@ -76,13 +78,41 @@ else:
         Nearly all services use JSON, so assume UTF8 encoding unless the
         response specifies otherwise.
         """
+        body, encoding = _page_body(page)
+        return unicode(body, encoding=encoding)
+else:
+    def _page_body(page):
+        """
+        Return the body of geocoder results, and its encoding.
+        """
         if hasattr(page, 'read'): # urllib
             # note get_param in py3
             encoding = page.headers.get_param("charset") or "utf-8"
-            return str(page.read(), encoding=encoding)
+            return page.read(), encoding
         else: # requests?
             encoding = page.headers.get("charset") or "utf-8"
-            return str(page.content, encoding=encoding)
+            return page.content, encoding
+
+    def decode_page(page):
+        """
+        Return unicode string of geocoder results.
+
+        Nearly all services use JSON, so assume UTF8 encoding unless the
+        response specifies otherwise.
+        """
+        body, encoding = _page_body(page)
+        return str(body, encoding=encoding)
+
+
+def read_page(page):
+    """
+    Return the body of geocoder results as UTF-8 encoded bytes, without
+    decoding it unless the response specifies another encoding.
+    """
+    body, encoding = _page_body(page)
+    if encoding.lower().replace('-', '').replace('_', '') != 'utf8':
+        body = body.decode(encoding).encode('utf-8')
+    return body
 
 
 def get_version():
@@ -90,3 +120,34 @@ def get_version():
     return str(GEOPY_VERSION)
 
 
+# The parser fast_json_loads uses, found on its first call.
+_fast_json_loads = None # pylint: disable=C0103
+
+
+def _json_loads(page):
+    """
+    json.loads, which only accepts bytes from Python 3.6 on.
+    """
+    import json
+    if py3k and isinstance(page, bytes):
+        page = page.decode('utf-8')
+    return json.loads(page)
+
+
+def fast_json_loads(page):
+    """
+    Parse a JSON document, given as UTF-8 encoded bytes or as text, with
+    orjson or ujson, whichever is installed, or else with json. They are
+    imported on the first call, so importing geopy does not pay for them.
+    """
+    global _fast_json_loads # pylint: disable=W0603
+    if _fast_json_loads is None:
+        try:
+            from orjson import loads
+        except ImportError:
+            try:
+                from ujson import loads
+            except ImportError:
+                loads = _json_loads
+        _fast_json_loads = loads
+    return _fast_json_loads(page)
@@ -31,6 +31,9 @@ setup(
     extras_require={
         "placefinder": ["requests_oauthlib>=0.4.0"],
         "timezone": ["pytz"],
+        "numpy": ["numpy"],
+        "geodesic": ["geographiclib"],
+        "fastjson": ["orjson"],
     },
     license='MIT',
     keywords='geocode geocoding gis geographical maps earth distance',
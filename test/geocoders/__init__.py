@@ -1,7 +1,7 @@
 
 from .arcgis import ArcGISTestCase, ArcGISAuthenticatedTestCase
 from .baidu import BaiduTestCase
-from .base import GeocoderTestCase
+from .base import GeocoderTestCase, GeocoderBatchTestCase
 from .bing import BingTestCase
 from .databc import DataBCTestCase
 from .dotus import GeocoderDotUSTestCase
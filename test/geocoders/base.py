@@ -1,12 +1,26 @@
 
+import itertools
+import json
+import os
+import subprocess
+import sys
+import time
 import unittest
 from mock import patch
 
 from geopy.point import Point
-from geopy.exc import GeocoderNotFound
-from geopy.geocoders import get_geocoder_for_service, GoogleV3
+from geopy.exc import GeocoderNotFound, GeocoderParseError, GeocoderQueryError
+from geopy.cache import LRUCache
+from geopy.geocoders import (
+    get_geocoder_for_service,
+    GoogleV3,
+    Nominatim,
+    SERVICE_TO_GEOCODER,
+)
 from geopy.geocoders.base import Geocoder, DEFAULT_TIMEOUT
+from geopy.util import fast_json_loads, read_page
 import geopy.geocoders.base
+from test.http_server import LocalServer
 
 class GetGeocoderTestCase(unittest.TestCase):
 
@@ -24,6 +38,36 @@ class GetGeocoderTestCase(unittest.TestCase):
         with self.assertRaises(GeocoderNotFound):
             get_geocoder_for_service("")
 
+    def test_service_to_geocoder(self):
+        """
+        SERVICE_TO_GEOCODER maps services to classes
+        """
+        self.assertEqual(SERVICE_TO_GEOCODER["googlev3"], GoogleV3)
+        self.assertIn("nominatim", SERVICE_TO_GEOCODER)
+        self.assertEqual(
+            dict(SERVICE_TO_GEOCODER)["nominatim"].__name__, "Nominatim"
+        )
+
+    def test_geocoders_are_imported_lazily(self):
+        """
+        geopy.geocoders imports geocoder modules on first use
+        """
+        code = (
+            "import sys, geopy, geopy.geocoders as g\n"
+            "assert 'geopy.geocoders.osm' not in sys.modules\n"
+            "g.Nominatim\n"
+            "assert 'geopy.geocoders.osm' in sys.modules\n"
+            "assert 'geopy.geocoders.googlev3' not in sys.modules\n"
+            "g.get_geocoder_for_service('google')\n"
+            "assert 'geopy.geocoders.googlev3' in sys.modules\n"
+            "assert 'geopy.geocoders.bing' not in sys.modules\n"
+            "from geopy import Bing\n"
+            "assert 'geopy.geocoders.bing' in sys.modules\n"
+            "assert 'Yandex' in dir(geopy) and 'Yandex' in dir(g)\n"
+        )
+        env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+        subprocess.check_call([sys.executable, "-c", code], env=env)
+
 
 class GeocoderTestCase(unittest.TestCase):
 
@@ -98,3 +142,181 @@ class GeocoderTestCase(unittest.TestCase):
             self.geocoder._coerce_point_to_string(self.coordinates_address),
             self.coordinates_address
         )
+
+
+class BatchGeocoder(Geocoder):
+    """
+    Geocoder answering from a dict, slowly for some queries.
+    """
+
+    def __init__(self, answers, delays=None):
+        super(BatchGeocoder, self).__init__()
+        self.answers = answers
+        self.delays = delays or {}
+        self.calls = []
+
+    def geocode(self, query, exactly_one=True, timeout=None):
+        self.calls.append(query)
+        time.sleep(self.delays.get(query, 0))
+        if query not in self.answers:
+            raise GeocoderQueryError("Unknown query %r" % query)
+        return self.answers[query]
+
+    def reverse(self, query, exactly_one=True, timeout=None):
+        return self._coerce_point_to_string(query)
+
+
+class GeocoderBatchTestCase(unittest.TestCase):
+    """
+    Geocoder.geocode_many and Geocoder.reverse_many
+    """
+
+    def test_order_and_errors(self):
+        """
+        Geocoder.geocode_many keeps input order and reports errors per item
+        """
+        geocoder = BatchGeocoder(
+            {'a': 1, 'b': 2, 'd': 4},
+            delays={'a': 0.05, 'b': 0.02},
+        )
+        results = list(geocoder.geocode_many(['a', 'b', 'c', 'd'], workers=3))
+        self.assertEqual([item.query for item in results], ['a', 'b', 'c', 'd'])
+        self.assertEqual([item.result for item in results], [1, 2, None, 4])
+        self.assertIsInstance(results[2].error, GeocoderQueryError)
+        self.assertIsNone(results[0].error)
+
+    def test_streams_input(self):
+        """
+        Geocoder.geocode_many reads its input lazily
+        """
+        geocoder = BatchGeocoder(dict((i, i) for i in range(1000)))
+        results = geocoder.geocode_many(itertools.count(), workers=2)
+        self.assertEqual(
+            [item.result for item in itertools.islice(results, 10)],
+            list(range(10))
+        )
+        results.close()
+        self.assertLess(len(geocoder.calls), 20)
+
+    def test_reverse_many(self):
+        """
+        Geocoder.reverse_many
+        """
+        geocoder = BatchGeocoder({})
+        results = list(geocoder.reverse_many([(1, 2), "3,4"], workers=1))
+        self.assertEqual([item.result for item in results], ["1,2", "3,4"])
+
+
+    def test_invalid_workers(self):
+        """
+        Geocoder.geocode_many checks workers when called, before iteration
+        """
+        geocoder = BatchGeocoder({})
+        with self.assertRaises(ValueError):
+            geocoder.geocode_many(['a'], workers=0)
+
+    def test_worker_killed(self):
+        """
+        Geocoder.geocode_many raises what killed a worker instead of waiting
+        for its answer forever
+        """
+        class Abort(BaseException):
+            """
+            Not an error a batch reports per item.
+            """
+
+        geocoder = BatchGeocoder({'a': 1})
+        original = geocoder.geocode
+
+        def geocode(query, **kwargs):
+            if query == 'b':
+                raise Abort()
+            return original(query, **kwargs)
+        geocoder.geocode = geocode
+        results = geocoder.geocode_many(['a', 'b', 'a'], workers=1)
+        self.assertEqual(next(results).result, 1)
+        with self.assertRaises(Abort):
+            next(results)
+
+
+class GeocoderJSONDeserializerTestCase(unittest.TestCase):
+    """
+    Geocoder.json_deserializer
+    """
+
+    def setUp(self):
+        self.server = LocalServer().start()
+        self.server.payload = [
+            {'lat': '40.7410861', 'lon': '-73.9896297', 'display_name': u'Caf\xe9'},
+        ]
+        self.geocoder = Nominatim(
+            domain='127.0.0.1:%s' % self.server.server_address[1],
+            scheme='http',
+            timeout=5,
+        )
+        self.geocoder.rate_limiter = None
+        self.pages = []
+
+    def tearDown(self):
+        self.server.stop()
+
+    def loads(self, page):
+        """
+        Deserializer recording the pages it parses.
+        """
+        self.pages.append(page)
+        if isinstance(page, bytes):
+            page = page.decode('utf-8')
+        return json.loads(page)
+
+    def test_parses_bytes(self):
+        """
+        Geocoder.json_deserializer parses the undecoded body
+        """
+        self.geocoder.json_deserializer = self.loads
+        location = self.geocoder.geocode('a')
+        self.assertEqual(location.address, u'Caf\xe9')
+        self.assertEqual(len(self.pages), 1)
+        self.assertIsInstance(self.pages[0], bytes)
+
+    def test_cached(self):
+        """
+        Geocoder.json_deserializer parses cached responses as text
+        """
+        self.geocoder.json_deserializer = self.loads
+        self.geocoder.cache = LRUCache()
+        self.geocoder.geocode('a')
+        location = self.geocoder.geocode('a')
+        self.assertEqual(location.address, u'Caf\xe9')
+        self.assertEqual(len(self.server.requests), 1)
+        self.assertNotIsInstance(self.pages[1], bytes)
+
+    def test_fast_json_loads(self):
+        """
+        Geocoder parses responses with fast_json_loads
+        """
+        self.geocoder.json_deserializer = fast_json_loads
+        location = self.geocoder.geocode('a')
+        self.assertEqual(location.address, u'Caf\xe9')
+        self.assertEqual(location.latitude, 40.7410861)
+
+    def test_parse_error(self):
+        """
+        Geocoder.json_deserializer errors show the body decoded
+        """
+        self.geocoder.json_deserializer = fast_json_loads
+        body = u'{\xe9'.encode('utf-8')
+        with patch.object(geopy.geocoders.base, 'read_page', return_value=body):
+            with self.assertRaises(GeocoderParseError) as context:
+                self.geocoder.geocode('a')
+        self.assertIn(u'{\xe9', str(context.exception))
+        self.assertNotIn("b'", str(context.exception))
+
+    def test_read_page_encoding(self):
+        """
+        read_page re-encodes bodies in another charset to UTF-8
+        """
+        class Page(object): # pylint: disable=R0903
+            headers = {'charset': 'latin-1'}
+            content = u'"Caf\xe9"'.encode('latin-1')
+        self.assertEqual(read_page(Page()), u'"Caf\xe9"'.encode('utf-8'))
@@ -0,0 +1,97 @@
+"""
+Local keep-alive HTTP server for exercising geopy's transport without
+hitting the network.
+"""
+
+import json
+import threading
+import time
+
+try:
+    from BaseHTTPServer import HTTPServer, BaseHTTPRequestHandler
+    from SocketServer import ThreadingMixIn
+except ImportError:
+    from http.server import HTTPServer, BaseHTTPRequestHandler
+    from socketserver import ThreadingMixIn
+
+
+class JSONHandler(BaseHTTPRequestHandler):
+    """
+    Answers every GET with the server's ``payload`` as JSON, by default a
+    document describing the request, and with the status code given by a
+    ``status`` query parameter, or else by the next of the server's
+    ``statuses``, after waiting the server's ``delay`` seconds.
+    """
+
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self): # pylint: disable=C0103
+        server = self.server
+        with server.lock:
+            server.requests.append(self.path)
+            server.connections.add(self.client_address)
+            status = server.statuses.pop(0) if server.statuses else 200
+        if 'status=' in self.path:
+            status = int(self.path.split('status=')[1].split('&')[0])
+        if server.delay:
+            time.sleep(server.delay)
+        payload = server.payload
+        if payload is None:
+            payload = {
+                'path': self.path,
+                'headers': dict(
+                    (key.lower(), value) for key, value in self.headers.items()
+                ),
+            }
+        body = json.dumps(payload).encode('utf-8')
+        self.send_response(status)
+        for key, value in server.extra_headers.items():
+            self.send_header(key, value)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args): # pylint: disable=W0221
+        pass
+
+
+class LocalServer(ThreadingMixIn, HTTPServer):
+    """
+    Threaded HTTP server bound to an ephemeral localhost port.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, handler=JSONHandler):
+        HTTPServer.__init__(self, ('127.0.0.1', 0), handler)
+        self.lock = threading.Lock()
+        self.requests = []
+        self.connections = set()
+        self.extra_headers = {}
+        self.statuses = []
+        self.delay = 0
+        self.payload = None
+        self.thread = threading.Thread(target=self.serve_forever)
+        self.thread.daemon = True
+
+    @property
+    def url(self):
+        """
+        Base url of the server.
+        """
+        return 'http://127.0.0.1:%s' % self.server_address[1]
+
+    def start(self):
+        """
+        Serve requests in a background thread.
+        """
+        self.thread.start()
+        return self
+
+    def stop(self):
+        """
+        Stop serving and close the listening socket.
+        """
+        self.shutdown()
+        self.server_close()
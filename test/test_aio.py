@@ -0,0 +1,143 @@
+"""
+Test the asyncio geocoding API.
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import unittest
+
+from geopy.cache import LRUCache, SQLiteCache
+from geopy.exc import GeocoderQuotaExceeded
+from geopy.geocoders import Nominatim
+from test.http_server import LocalServer
+
+if sys.version_info >= (3, 5):
+    import asyncio
+    from geopy.aio import AsyncGeocoder
+
+
+@unittest.skipIf(sys.version_info < (3, 5), "asyncio API requires Python 3.5")
+class AsyncGeocoderTestCase(unittest.TestCase): # pylint: disable=R0904
+    """
+    geopy.aio.AsyncGeocoder
+    """
+
+    def setUp(self):
+        self.server = LocalServer().start()
+        self.server.payload = [
+            {'lat': '40.7410861', 'lon': '-73.9896297', 'display_name': 'Flatiron'},
+            {'lat': '40.7', 'lon': '-73.9', 'display_name': 'New York'},
+        ]
+        self.geocoder = AsyncGeocoder(Nominatim(
+            domain='127.0.0.1:%s' % self.server.server_address[1],
+            scheme='http',
+            timeout=5,
+        ))
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+
+    def tearDown(self):
+        self.geocoder.transport.clear()
+        self.loop.close()
+        asyncio.set_event_loop(None)
+        self.server.stop()
+
+    def test_geocode(self):
+        """
+        AsyncGeocoder.geocode parses with the wrapped geocoder
+        """
+        location = self.loop.run_until_complete(
+            self.geocoder.geocode('175 5th Avenue NYC')
+        )
+        self.assertEqual(location.address, 'Flatiron')
+        self.assertAlmostEqual(location.latitude, 40.7410861)
+        self.assertTrue(self.server.requests[0].startswith('/search?'))
+
+    def test_reverse_many_in_flight(self):
+        """
+        AsyncGeocoder runs concurrent lookups over pooled connections
+        """
+        coroutines = [
+            self.geocoder.reverse((40.0 + i / 100., -73.0), exactly_one=False)
+            for i in range(50)
+        ]
+        results = self.loop.run_until_complete(asyncio.gather(*coroutines))
+        self.assertEqual(len(results), 50)
+        self.assertTrue(all(len(result) == 2 for result in results))
+        self.assertEqual(len(self.server.requests), 50)
+        self.assertLessEqual(len(self.server.connections), 50)
+
+    def test_error_mapping(self):
+        """
+        AsyncGeocoder raises the same exceptions as the geocoder
+        """
+        self.server.payload = None
+        geocoder = self.geocoder.geocoder
+        geocoder.api = geocoder.api + '?status=402&'
+        with self.assertRaises(GeocoderQuotaExceeded):
+            self.loop.run_until_complete(self.geocoder.geocode('x'))
+
+    def test_limiter_off_loop(self):
+        """
+        AsyncGeocoder calls the rate limiter outside the event loop's thread
+        """
+        threads = []
+
+        class Limiter(object): # pylint: disable=R0903
+            """
+            Rate limiter recording the thread it is called on.
+            """
+            def reserve(self, url, key=None): # pylint: disable=W0613,R0201
+                threads.append(threading.current_thread())
+                return 0.
+
+        self.geocoder.geocoder.rate_limiter = Limiter()
+        self.loop.run_until_complete(self.geocoder.geocode('x'))
+        self.assertEqual(len(threads), 1)
+        self.assertIsNot(threads[0], threading.current_thread())
+
+    def test_cache_looked_up_once(self):
+        """
+        AsyncGeocoder looks a response up in the cache once per call
+        """
+        cache = self.geocoder.geocoder.cache = LRUCache()
+        self.loop.run_until_complete(self.geocoder.geocode('x'))
+        self.assertEqual((cache.hits, cache.misses), (0, 1))
+        location = self.loop.run_until_complete(self.geocoder.geocode('x'))
+        self.assertEqual(location.address, 'Flatiron')
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+        self.assertEqual(len(self.server.requests), 1)
+
+    def test_sqlite_cache_off_loop(self):
+        """
+        AsyncGeocoder reads and writes an SQLiteCache outside the event
+        loop's thread
+        """
+        threads = []
+
+        class Cache(SQLiteCache):
+            """
+            SQLiteCache recording the threads it is used on.
+            """
+            def get(self, key):
+                threads.append(threading.current_thread())
+                return super(Cache, self).get(key)
+
+            def set(self, key, value):
+                threads.append(threading.current_thread())
+                return super(Cache, self).set(key, value)
+
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        cache = Cache(os.path.join(directory, 'cache.sqlite'))
+        self.geocoder.geocoder.cache = cache
+        for _ in range(2):
+            location = self.loop.run_until_complete(self.geocoder.geocode('x'))
+            self.assertEqual(location.address, 'Flatiron')
+        self.assertEqual(len(self.server.requests), 1)
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+        self.assertEqual(len(threads), 3)
+        self.assertNotIn(threading.current_thread(), threads)
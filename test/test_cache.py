@@ -0,0 +1,457 @@
+"""
+Test geocoder response caches.
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+import unittest
+
+from geopy.cache import LRUCache, SQLiteCache, ReverseCache, SingleFlight
+from geopy.exc import GeocoderQuotaExceeded
+from geopy.geocoders import GoogleV3, Nominatim
+from geopy.geocoders.base import Geocoder
+from geopy.location import Location
+from geopy.point import Point
+from test.http_server import LocalServer
+
+if sys.version_info >= (3, 5):
+    import asyncio
+    from geopy.aio import AsyncGeocoder
+
+
+class LRUCacheTestCase(unittest.TestCase): # pylint: disable=R0904
+    """
+    geopy.cache.LRUCache
+    """
+
+    def test_evicts_least_recently_used(self):
+        """
+        LRUCache drops the least recently used entry when full
+        """
+        cache = LRUCache(maxsize=2)
+        cache.set('a', 1)
+        cache.set('b', 2)
+        self.assertEqual(cache.get('a'), 1)
+        cache.set('c', 3)
+        self.assertIn('a', cache)
+        self.assertNotIn('b', cache)
+        self.assertEqual(len(cache), 2)
+
+    def test_ttl(self):
+        """
+        LRUCache discards expired entries
+        """
+        cache = LRUCache(ttl=0.01)
+        cache.set('a', 1)
+        time.sleep(0.02)
+        self.assertIsNone(cache.get('a'))
+        self.assertNotIn('a', cache)
+
+    def test_counters(self):
+        """
+        LRUCache counts hits and misses
+        """
+        cache = LRUCache()
+        cache.get('a')
+        cache.set('a', 1)
+        cache.get('a')
+        cache.get('a')
+        self.assertEqual((cache.hits, cache.misses), (2, 1))
+
+
+class SQLiteCacheTestCase(unittest.TestCase): # pylint: disable=R0904
+    """
+    geopy.cache.SQLiteCache
+    """
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, 'geopy.sqlite')
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_shared_between_instances(self):
+        """
+        SQLiteCache responses are seen by other users of the file
+        """
+        SQLiteCache(self.path).set('https://example.com/?q=a', u'{"a": 1}')
+        cache = SQLiteCache(self.path)
+        self.assertEqual(cache.get('https://example.com/?q=a'), u'{"a": 1}')
+        self.assertIsNone(cache.get('https://example.com/?q=b'))
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+    def test_ttl_per_host(self):
+        """
+        SQLiteCache expires responses according to their host's ttl
+        """
+        cache = SQLiteCache(self.path, ttls={'fast.example.com': -1})
+        cache.set('https://fast.example.com/?q=a', u'1')
+        cache.set('https://slow.example.com/?q=a', u'2')
+        self.assertIsNone(cache.get('https://fast.example.com/?q=a'))
+        self.assertEqual(cache.get('https://slow.example.com/?q=a'), u'2')
+        cache.evict()
+        self.assertEqual(len(cache), 1)
+
+    def test_max_size(self):
+        """
+        SQLiteCache evicts the least recently used responses beyond max_size
+        """
+        cache = SQLiteCache(self.path, max_size=25)
+        cache.ACCESS_INTERVAL = 0
+        for query in 'abc':
+            cache.set('https://example.com/?q=%s' % query, u'x' * 10)
+            time.sleep(0.01)
+        cache.get('https://example.com/?q=a')
+        cache.evict()
+        self.assertIn('https://example.com/?q=a', cache)
+        self.assertNotIn('https://example.com/?q=b', cache)
+        self.assertIn('https://example.com/?q=c', cache)
+
+    def test_max_size_on_set(self):
+        """
+        SQLiteCache enforces max_size as responses are added
+        """
+        cache = SQLiteCache(self.path, max_size=25)
+        cache.EVICTION_INTERVAL = 1
+        for query in 'abc':
+            cache.set('https://example.com/?q=%s' % query, u'x' * 10)
+            time.sleep(0.01)
+        self.assertEqual(len(cache), 2)
+        self.assertNotIn('https://example.com/?q=a', cache)
+
+    def test_size_in_bytes(self):
+        """
+        SQLiteCache counts the size of responses in UTF-8 bytes
+        """
+        cache = SQLiteCache(self.path, max_size=15)
+        cache.set('https://example.com/?q=a', u'\xe9' * 10)
+        cache.evict()
+        self.assertNotIn('https://example.com/?q=a', cache)
+
+    def test_lookups_read_only(self):
+        """
+        SQLiteCache records recent uses of a response without writing
+        """
+        cache = SQLiteCache(self.path)
+        cache.set('https://example.com/?q=a', u'1')
+        conn = cache._connect() # pylint: disable=W0212
+        changes = conn.total_changes
+        for _ in range(3):
+            cache.get('https://example.com/?q=a')
+        self.assertEqual(conn.total_changes, changes)
+
+
+class GeocoderCacheTestCase(unittest.TestCase): # pylint: disable=R0904
+    """
+    Geocoder.cache
+    """
+
+    def setUp(self):
+        self.server = LocalServer().start()
+        self.server.payload = [
+            {'lat': '40.7410861', 'lon': '-73.9896297', 'display_name': 'Flatiron'},
+        ]
+        self.geocoder = Nominatim(
+            domain='127.0.0.1:%s' % self.server.server_address[1],
+            scheme='http',
+            timeout=5,
+        )
+        self.geocoder.cache = LRUCache()
+
+    def tearDown(self):
+        self.server.stop()
+
+    def test_cache_hit(self):
+        """
+        Geocoder answers repeated queries from its cache
+        """
+        first = self.geocoder.geocode('175 5th Avenue NYC')
+        second = self.geocoder.geocode('175 5th Avenue NYC')
+        self.assertIsInstance(second, Location)
+        self.assertEqual(second.address, first.address)
+        self.assertEqual(second.point, first.point)
+        self.assertEqual(len(self.server.requests), 1)
+        self.assertEqual(self.geocoder.cache.hits, 1)
+
+    def test_error_status_not_cached(self):
+        """
+        Geocoder does not cache responses reporting an error in their body
+        """
+        self.server.payload = {'status': 'OVER_QUERY_LIMIT', 'results': []}
+        geocoder = GoogleV3(
+            domain='127.0.0.1:%s' % self.server.server_address[1],
+            scheme='http',
+            timeout=5,
+        )
+        geocoder.cache = self.geocoder.cache
+        with self.assertRaises(GeocoderQuotaExceeded):
+            geocoder.geocode('175 5th Avenue NYC')
+        self.assertEqual(len(geocoder.cache), 0)
+        self.server.payload = {'status': 'ZERO_RESULTS', 'results': []}
+        self.assertIsNone(geocoder.geocode('175 5th Avenue NYC'))
+        self.assertIsNone(geocoder.geocode('175 5th Avenue NYC'))
+        self.assertEqual(len(self.server.requests), 2)
+
+    def test_cache_key(self):
+        """
+        Geocoder._cache_key sorts parameters and leaves out credentials
+        """
+        geocoder = Geocoder()
+        self.assertEqual(
+            geocoder._cache_key(
+                'https://example.com/geocode?q=a&key=secret&format=json'
+            ),
+            geocoder._cache_key(
+                'https://example.com/geocode?format=json&q=a&key=other'
+            ),
+        )
+        self.assertNotIn(
+            'secret',
+            geocoder._cache_key('https://example.com/?auth-token=secret&q=a')
+        )
+
+    def test_persistent_cache(self):
+        """
+        Geocoder answers from an SQLiteCache filled by another geocoder
+        """
+        directory = tempfile.mkdtemp()
+        try:
+            path = os.path.join(directory, 'geopy.sqlite')
+            self.geocoder.cache = SQLiteCache(path)
+            self.geocoder.geocode('175 5th Avenue NYC')
+            other = Nominatim(domain=self.geocoder.domain, scheme='http')
+            other.cache = SQLiteCache(path)
+            location = other.geocode('175 5th Avenue NYC')
+            self.assertEqual(location.address, 'Flatiron')
+            self.assertEqual(len(self.server.requests), 1)
+        finally:
+            shutil.rmtree(directory)
+
+
+    def test_persistent_cache_skips_errors(self):
+        """
+        Geocoder does not store responses reporting an error in an
+        SQLiteCache
+        """
+        self.server.payload = {'status': 'OVER_QUERY_LIMIT', 'results': []}
+        geocoder = GoogleV3(
+            domain='127.0.0.1:%s' % self.server.server_address[1],
+            scheme='http',
+            timeout=5,
+        )
+        directory = tempfile.mkdtemp()
+        try:
+            geocoder.cache = SQLiteCache(os.path.join(directory, 'geopy.sqlite'))
+            for _ in range(2):
+                with self.assertRaises(GeocoderQuotaExceeded):
+                    geocoder.geocode('175 5th Avenue NYC')
+            self.assertEqual(len(geocoder.cache), 0)
+            self.assertEqual(len(self.server.requests), 2)
+        finally:
+            shutil.rmtree(directory)
+
+
+class SingleFlightTestCase(unittest.TestCase): # pylint: disable=R0904
+    """
+    geopy.cache.SingleFlight
+    """
+
+    def run_threads(self, flight, function, count=5):
+        """
+        Call ``function`` through ``flight`` from ``count`` threads at once,
+        and return their results and errors.
+        """
+        outcomes = []
+
+        def call():
+            try:
+                outcomes.append(flight.do('key', function))
+            except ValueError as error:
+                outcomes.append(error)
+
+        threads = [threading.Thread(target=call) for _ in range(count)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return outcomes
+
+    def test_shares_result(self):
+        """
+        SingleFlight makes one call for concurrent callers
+        """
+        flight = SingleFlight()
+        calls = []
+
+        def function():
+            calls.append(1)
+            time.sleep(0.1)
+            return 'result'
+
+        self.assertEqual(self.run_threads(flight, function), ['result'] * 5)
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(flight.shared, 4)
+        self.assertEqual(len(flight), 0)
+        flight.do('key', function)
+        self.assertEqual(len(calls), 2)
+
+    def test_shares_error(self):
+        """
+        SingleFlight raises the error of the call in every caller
+        """
+        flight = SingleFlight()
+        error = ValueError()
+
+        def function():
+            time.sleep(0.1)
+            raise error
+
+        self.assertEqual(self.run_threads(flight, function), [error] * 5)
+        self.assertEqual(len(flight), 0)
+
+
+class GeocoderSingleFlightTestCase(unittest.TestCase): # pylint: disable=R0904
+    """
+    Geocoder.single_flight
+    """
+
+    def setUp(self):
+        self.server = LocalServer().start()
+        self.server.payload = [
+            {'lat': '40.7410861', 'lon': '-73.9896297', 'display_name': 'Flatiron'},
+        ]
+        self.server.delay = 0.2
+        self.geocoder = Nominatim(
+            domain='127.0.0.1:%s' % self.server.server_address[1],
+            scheme='http',
+            timeout=5,
+        )
+        self.geocoder.rate_limiter = None
+        self.geocoder.single_flight = SingleFlight()
+
+    def tearDown(self):
+        self.server.stop()
+
+    def test_threads(self):
+        """
+        Geocoder sends one request for identical concurrent queries
+        """
+        locations = []
+        threads = [
+            threading.Thread(
+                target=lambda: locations.append(self.geocoder.geocode('a'))
+            )
+            for _ in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual([loc.address for loc in locations], ['Flatiron'] * 4)
+        self.assertEqual(len(self.server.requests), 1)
+        self.assertEqual(self.geocoder.single_flight.shared, 3)
+
+    def test_instances_not_shared(self):
+        """
+        Geocoders with their own transports do not share requests
+        """
+        other = Nominatim(domain=self.geocoder.domain, scheme='http', timeout=5)
+        other.rate_limiter = None
+        other.single_flight = self.geocoder.single_flight
+        threads = [
+            threading.Thread(target=geocoder.geocode, args=('a', ))
+            for geocoder in (self.geocoder, other)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(len(self.server.requests), 2)
+        self.assertEqual(self.geocoder.single_flight.shared, 0)
+
+    @unittest.skipIf(sys.version_info < (3, 5), "asyncio API requires Python 3.5")
+    def test_async(self):
+        """
+        AsyncGeocoder sends one request for identical concurrent queries
+        """
+        geocoder = AsyncGeocoder(self.geocoder)
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        try:
+            locations = loop.run_until_complete(asyncio.gather(
+                geocoder.geocode('a'), geocoder.geocode('a'), geocoder.geocode('b')
+            ))
+            self.assertEqual([loc.address for loc in locations], ['Flatiron'] * 3)
+            self.assertEqual(len(self.server.requests), 2)
+            self.assertEqual(self.geocoder.single_flight.shared, 1)
+        finally:
+            geocoder.transport.clear()
+            loop.close()
+            asyncio.set_event_loop(None)
+
+
+class CountingGeocoder(Geocoder):
+    """
+    Geocoder answering reverse queries with the point's string, counting
+    them.
+    """
+
+    calls = 0
+
+    def reverse(self, query, exactly_one=True, timeout=None):
+        self.calls += 1
+        if query == (0, 0):
+            return None
+        return self._coerce_point_to_string(query)
+
+
+class ReverseCacheTestCase(unittest.TestCase): # pylint: disable=R0904
+    """
+    geopy.cache.ReverseCache
+    """
+
+    def test_nearby_points_share_result(self):
+        """
+        ReverseCache reuses the result of points in the same cell
+        """
+        geocoder = ReverseCache(CountingGeocoder(), precision=3)
+        first = geocoder.reverse((52.50961, 13.37621))
+        self.assertEqual(geocoder.reverse("52.50962, 13.37624"), first)
+        self.assertEqual(geocoder.reverse(Point(52.50958, 13.37618)), first)
+        self.assertEqual(geocoder.geocoder.calls, 1)
+        self.assertEqual(geocoder.saved, 2)
+
+    def test_distant_points(self):
+        """
+        ReverseCache queries points of different cells
+        """
+        geocoder = ReverseCache(CountingGeocoder(), precision=4)
+        geocoder.reverse((52.5096, 13.3762))
+        geocoder.reverse((52.5106, 13.3762))
+        geocoder.reverse((52.5096, 13.3762), exactly_one=False)
+        self.assertEqual(geocoder.geocoder.calls, 3)
+        self.assertEqual(geocoder.saved, 0)
+
+    def test_caches_missing_address(self):
+        """
+        ReverseCache caches points without an address
+        """
+        geocoder = ReverseCache(CountingGeocoder())
+        self.assertIsNone(geocoder.reverse((0, 0)))
+        self.assertIsNone(geocoder.reverse((0, 0)))
+        self.assertEqual(geocoder.geocoder.calls, 1)
+
+    def test_eviction(self):
+        """
+        ReverseCache remembers at most maxsize cells
+        """
+        geocoder = ReverseCache(CountingGeocoder(), maxsize=1)
+        geocoder.reverse((1, 1))
+        geocoder.reverse((2, 2))
+        geocoder.reverse((1, 1))
+        self.assertEqual(geocoder.geocoder.calls, 3)
@@ -0,0 +1,304 @@
+"""
+Test circuit breakers.
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+import unittest
+
+from geopy.circuitbreaker import CircuitBreaker, CLOSED, OPEN, HALF_OPEN
+from geopy.exc import (
+    GeocoderCircuitOpen,
+    GeocoderQueryError,
+    GeocoderQuotaExceeded,
+    GeocoderServiceError,
+    GeocoderTimedOut,
+    GeocoderUnavailable,
+)
+from geopy.geocoders import Nominatim
+from geopy.ratelimit import SQLiteRateLimiter
+from geopy.retry import RetryPolicy
+from test.http_server import LocalServer
+
+if sys.version_info >= (3, 5):
+    import asyncio
+    from geopy.aio import AsyncGeocoder
+
+
+class CircuitBreakerTestCase(unittest.TestCase): # pylint: disable=R0904
+    """
+    geopy.circuitbreaker.CircuitBreaker
+    """
+
+    def test_opens_after_failures(self):
+        """
+        CircuitBreaker opens after consecutive failures, and fails fast
+        """
+        breaker = CircuitBreaker(failures=3, cooldown=60)
+        for _ in range(2):
+            breaker.before()
+            breaker.record(error=GeocoderTimedOut())
+        self.assertEqual(breaker.state(), CLOSED)
+        breaker.record(error=GeocoderUnavailable())
+        self.assertEqual(breaker.state(), OPEN)
+        try:
+            breaker.before()
+        except GeocoderCircuitOpen as error:
+            self.assertGreater(error.retry_after, 59)
+        else:
+            self.fail("GeocoderCircuitOpen not raised")
+        circuit = breaker.circuit()
+        self.assertEqual((circuit.trips, circuit.rejected), (1, 1))
+
+    def test_success_resets(self):
+        """
+        CircuitBreaker counts consecutive failures only
+        """
+        breaker = CircuitBreaker(failures=2)
+        breaker.record(error=GeocoderTimedOut())
+        breaker.record()
+        breaker.record(error=GeocoderTimedOut())
+        self.assertEqual(breaker.state(), CLOSED)
+        # The service answered, so a rejected query is not a failure.
+        breaker.record(error=GeocoderQueryError())
+        breaker.record(error=GeocoderTimedOut())
+        self.assertEqual(breaker.state(), CLOSED)
+
+    def test_half_open(self):
+        """
+        CircuitBreaker lets one trial through after its cool-down
+        """
+        breaker = CircuitBreaker(failures=1, cooldown=0.05)
+        breaker.record(error=GeocoderTimedOut())
+        time.sleep(0.06)
+        breaker.before()
+        self.assertEqual(breaker.state(), HALF_OPEN)
+        with self.assertRaises(GeocoderCircuitOpen):
+            breaker.before()
+        breaker.record(error=GeocoderTimedOut())
+        self.assertEqual(breaker.state(), OPEN)
+        time.sleep(0.06)
+        breaker.before()
+        breaker.record()
+        self.assertEqual(breaker.state(), CLOSED)
+        breaker.before()
+
+    def test_lost_trial(self):
+        """
+        CircuitBreaker lets another trial through once one is lost
+        """
+        breaker = CircuitBreaker(failures=1, cooldown=0.05, trial_timeout=0.05)
+        breaker.record(error=GeocoderTimedOut())
+        time.sleep(0.06)
+        breaker.before()
+        with self.assertRaises(GeocoderCircuitOpen):
+            breaker.before()
+        time.sleep(0.06)
+        breaker.before()
+        self.assertEqual(breaker.state(), HALF_OPEN)
+
+    def test_interrupted_trial(self):
+        """
+        CircuitBreaker counts a trial interrupted by another exception as failed
+        """
+        breaker = CircuitBreaker(failures=1, cooldown=0.05)
+        breaker.record(error=GeocoderTimedOut())
+        time.sleep(0.06)
+        breaker.before()
+        breaker.record(error=KeyboardInterrupt())
+        self.assertEqual(breaker.state(), OPEN)
+
+    def test_cancelled_trial(self):
+        """
+        CircuitBreaker lets the next request through when a trial is given back
+        """
+        breaker = CircuitBreaker(failures=1, cooldown=0.05)
+        breaker.record(error=GeocoderTimedOut())
+        time.sleep(0.06)
+        self.assertTrue(breaker.before())
+        breaker.cancel()
+        self.assertEqual(breaker.state(), OPEN)
+        self.assertTrue(breaker.before())
+        breaker.record()
+        self.assertFalse(breaker.before())
+
+    def test_per_host(self):
+        """
+        CircuitBreaker keeps a circuit per host
+        """
+        breaker = CircuitBreaker(failures=1, per_host=True)
+        breaker.record('https://a.example.com/?q=1', GeocoderTimedOut())
+        breaker.before('https://b.example.com/?q=1')
+        with self.assertRaises(GeocoderCircuitOpen):
+            breaker.before('https://a.example.com/?q=2')
+        self.assertEqual(
+            breaker.states(),
+            {'a.example.com': OPEN, 'b.example.com': CLOSED}
+        )
+
+    def test_threads(self):
+        """
+        CircuitBreaker counts failures from many threads
+        """
+        breaker = CircuitBreaker(failures=1000)
+
+        def fail():
+            for _ in range(100):
+                breaker.record(error=GeocoderTimedOut())
+
+        threads = [threading.Thread(target=fail) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(breaker.circuit().failures, 800)
+        self.assertEqual(breaker.circuit().trips, 0)
+
+
+class GeocoderCircuitBreakerTestCase(unittest.TestCase): # pylint: disable=R0904
+    """
+    Geocoder.circuit_breaker
+    """
+
+    def setUp(self):
+        self.server = LocalServer().start()
+        self.server.payload = [
+            {'lat': '40.7410861', 'lon': '-73.9896297', 'display_name': 'Flatiron'},
+        ]
+        self.geocoder = Nominatim(
+            domain='127.0.0.1:%s' % self.server.server_address[1],
+            scheme='http',
+            timeout=5,
+        )
+        self.geocoder.circuit_breaker = CircuitBreaker(failures=2, cooldown=60)
+
+    def tearDown(self):
+        self.server.stop()
+
+    def test_fails_fast(self):
+        """
+        Geocoder stops calling the service once its circuit is open
+        """
+        self.server.statuses = [503, 502]
+        with self.assertRaises(GeocoderTimedOut):
+            self.geocoder.geocode('a')
+        with self.assertRaises(GeocoderServiceError):
+            self.geocoder.geocode('b')
+        with self.assertRaises(GeocoderCircuitOpen):
+            self.geocoder.geocode('c')
+        self.assertEqual(len(self.server.requests), 2)
+
+    def test_retries_stop(self):
+        """
+        Geocoder does not retry once its circuit opens
+        """
+        self.geocoder.retry_policy = RetryPolicy(attempts=5, backoff=0.01)
+        self.server.statuses = [503] * 5
+        with self.assertRaises(GeocoderCircuitOpen):
+            self.geocoder.geocode('a')
+        self.assertEqual(len(self.server.requests), 2)
+
+    def test_open_skips_limiter(self):
+        """
+        Geocoder neither waits for nor spends its rate limit once its circuit
+        is open
+        """
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        self.geocoder.rate_limiter = SQLiteRateLimiter(
+            os.path.join(directory, 'limits.sqlite'),
+            rate=0.5, burst=2, daily_quota=3,
+        )
+        self.server.statuses = [503, 502]
+        for query in 'ab':
+            with self.assertRaises(GeocoderServiceError):
+                self.geocoder.geocode(query)
+        started = time.time()
+        for query in 'cd':
+            with self.assertRaises(GeocoderCircuitOpen):
+                self.geocoder.geocode(query)
+        self.assertLess(time.time() - started, 1)
+        budget = self.geocoder.rate_limiter.budget(self.geocoder.api)
+        self.assertEqual(budget.used, 2)
+        self.assertEqual(budget.remaining, 1)
+
+    def test_limiter_fails_before_trial(self):
+        """
+        Geocoder leaves the circuit open when its rate limiter refuses a trial
+        """
+        class ExhaustedLimiter(object): # pylint: disable=R0903
+            """
+            Rate limiter whose quota is used up.
+            """
+            def reserve(self, url, key=None): # pylint: disable=W0613,R0201
+                raise GeocoderQuotaExceeded('Daily quota used up.')
+
+        self.geocoder.circuit_breaker = CircuitBreaker(failures=1, cooldown=0.05)
+        self.server.statuses = [503]
+        with self.assertRaises(GeocoderTimedOut):
+            self.geocoder.geocode('a')
+        time.sleep(0.06)
+        self.geocoder.rate_limiter = ExhaustedLimiter()
+        with self.assertRaises(GeocoderQuotaExceeded):
+            self.geocoder.geocode('b')
+        self.assertEqual(self.geocoder.circuit_breaker.state(), OPEN)
+        self.geocoder.rate_limiter = None
+        self.assertEqual(self.geocoder.geocode('c').address, 'Flatiron')
+        self.assertEqual(self.geocoder.circuit_breaker.state(), CLOSED)
+
+    def test_interrupted(self):
+        """
+        Geocoder does not count a request its caller interrupts as a failure
+        """
+        class Abort(BaseException):
+            """
+            Interruption by the caller, as KeyboardInterrupt is.
+            """
+
+        def interrupt(*args, **kwargs): # pylint: disable=W0613
+            """
+            Requester interrupted while waiting for the service.
+            """
+            raise Abort()
+
+        breaker = self.geocoder.circuit_breaker = CircuitBreaker(
+            failures=1, cooldown=0.05
+        )
+        transport, self.geocoder.urlopen = self.geocoder.urlopen, interrupt
+        with self.assertRaises(Abort):
+            self.geocoder.geocode('a')
+        self.assertEqual(breaker.state(), CLOSED)
+        self.assertEqual(breaker.circuit().failures, 0)
+
+        breaker.record(error=GeocoderTimedOut())
+        time.sleep(0.06)
+        with self.assertRaises(Abort):
+            self.geocoder.geocode('b')
+        self.assertEqual(breaker.state(), OPEN)
+        self.geocoder.urlopen = transport
+        self.assertEqual(self.geocoder.geocode('c').address, 'Flatiron')
+        self.assertEqual(breaker.state(), CLOSED)
+
+    @unittest.skipIf(sys.version_info < (3, 5), "asyncio API requires Python 3.5")
+    def test_cancelled(self):
+        """
+        AsyncGeocoder does not count a cancelled request as a failure
+        """
+        breaker = self.geocoder.circuit_breaker = CircuitBreaker(failures=1)
+        self.server.delay = 0.5
+        geocoder = AsyncGeocoder(self.geocoder)
+        loop = asyncio.new_event_loop()
+        try:
+            with self.assertRaises(asyncio.TimeoutError):
+                loop.run_until_complete(
+                    asyncio.wait_for(geocoder.geocode('a'), 0.1)
+                )
+        finally:
+            geocoder.transport.clear()
+            loop.close()
+        self.assertEqual(breaker.state(), CLOSED)
+        self.assertEqual(breaker.circuit().failures, 0)
@@ -0,0 +1,202 @@
+"""
+Test looking queries up with several geocoders.
+"""
+
+import sys
+import threading
+import time
+import unittest
+
+from geopy.exc import ConfigurationError, GeocoderTimedOut, GeocoderQuotaExceeded
+from geopy.geocoders import CompositeGeocoder
+from geopy.geocoders.composite import _WorkerPool
+from geopy.geocoders.base import Geocoder
+from geopy.location import Location
+
+if sys.version_info >= (3, 5):
+    import asyncio
+    from geopy.aio import AsyncGeocoder
+
+
+class StubGeocoder(Geocoder):
+    """
+    Geocoder answering every query with ``answer``, after ``delay``
+    seconds; an exception class as ``answer`` is raised instead.
+    """
+
+    def __init__(self, answer, delay=0):
+        super(StubGeocoder, self).__init__()
+        self.answer = answer
+        self.delay = delay
+        self.calls = 0
+        self.lock = threading.Lock()
+
+    def geocode(self, query, exactly_one=True, timeout=None):
+        with self.lock:
+            self.calls += 1
+        time.sleep(self.delay)
+        if isinstance(self.answer, type):
+            raise self.answer('failed')
+        if self.answer is None:
+            return None
+        location = Location(self.answer, (1, 2))
+        return location if exactly_one else [location]
+
+    reverse = geocode
+
+
+class CompositeGeocoderTestCase(unittest.TestCase): # pylint: disable=R0904
+    """
+    geopy.geocoders.CompositeGeocoder
+    """
+
+    def test_failover(self):
+        """
+        CompositeGeocoder asks the next geocoder on error or no result
+        """
+        failing = StubGeocoder(GeocoderTimedOut)
+        empty = StubGeocoder(None)
+        working = StubGeocoder('found')
+        unused = StubGeocoder('unused')
+        geocoder = CompositeGeocoder([failing, empty, working, unused])
+        location = geocoder.geocode('a')
+        self.assertEqual(location.address, 'found')
+        self.assertIs(location.provider, working)
+        self.assertEqual(
+            [g.calls for g in (failing, empty, working, unused)], [1, 1, 1, 0]
+        )
+        locations = geocoder.reverse('1, 2', exactly_one=False)
+        self.assertTrue(all(l.provider is working for l in locations))
+
+    def test_nothing_found(self):
+        """
+        CompositeGeocoder returns None if any geocoder answered, and raises
+        the last error otherwise
+        """
+        geocoder = CompositeGeocoder([
+            StubGeocoder(GeocoderTimedOut), StubGeocoder(None)
+        ])
+        self.assertIsNone(geocoder.geocode('a'))
+        geocoder = CompositeGeocoder([
+            StubGeocoder(GeocoderTimedOut), StubGeocoder(GeocoderQuotaExceeded)
+        ])
+        with self.assertRaises(GeocoderQuotaExceeded):
+            geocoder.geocode('a')
+
+    def test_hedged(self):
+        """
+        CompositeGeocoder asks the next geocoder when the first is slow
+        """
+        slow = StubGeocoder('slow', delay=0.5)
+        fast = StubGeocoder('fast')
+        geocoder = CompositeGeocoder([slow, fast], mode='hedged', hedge_after=0.05)
+        start = time.time()
+        location = geocoder.geocode('a')
+        self.assertLess(time.time() - start, 0.4)
+        self.assertIs(location.provider, fast)
+
+    def test_hedged_prefers_first(self):
+        """
+        CompositeGeocoder does not ask the next geocoder when the first
+        answers within the budget
+        """
+        first = StubGeocoder('first', delay=0.01)
+        second = StubGeocoder('second')
+        geocoder = CompositeGeocoder([first, second], mode='hedged', hedge_after=1)
+        self.assertIs(geocoder.geocode('a').provider, first)
+        self.assertEqual(second.calls, 0)
+
+    def test_hedged_failure(self):
+        """
+        CompositeGeocoder asks the next geocoder at once when one fails
+        """
+        geocoder = CompositeGeocoder(
+            [StubGeocoder(GeocoderTimedOut), StubGeocoder('second')],
+            mode='hedged', hedge_after=10
+        )
+        start = time.time()
+        self.assertEqual(geocoder.geocode('a').address, 'second')
+        self.assertLess(time.time() - start, 1)
+        geocoder.geocoders = [StubGeocoder(GeocoderTimedOut)]
+        with self.assertRaises(GeocoderTimedOut):
+            geocoder.geocode('a')
+
+    def test_hedged_interrupted(self):
+        """
+        CompositeGeocoder raises what interrupted a hedged lookup instead of
+        waiting for its answer forever
+        """
+        class Abort(BaseException):
+            """
+            Not an error a geocoder reports.
+            """
+
+        geocoder = CompositeGeocoder(
+            [StubGeocoder(Abort)], mode='hedged', hedge_after=10
+        )
+        with self.assertRaises(Abort):
+            geocoder.geocode('a')
+
+    @unittest.skipIf(sys.version_info < (3, 5), "asyncio API requires Python 3.5")
+    def test_hedged_async(self):
+        """
+        CompositeGeocoder run by AsyncGeocoder asks its geocoders on the
+        event loop, in failover mode
+        """
+        threads = []
+        stub = StubGeocoder('found')
+        geocode = stub.geocode
+
+        def record(query, **kwargs):
+            threads.append(threading.current_thread())
+            return geocode(query, **kwargs)
+        stub.geocode = record
+        geocoder = AsyncGeocoder(CompositeGeocoder([stub], mode='hedged'))
+        loop = asyncio.new_event_loop()
+        try:
+            location = loop.run_until_complete(geocoder.geocode('a'))
+        finally:
+            loop.close()
+        self.assertEqual(location.address, 'found')
+        self.assertEqual(threads, [threading.current_thread()])
+
+    def test_pool_drops_cancelled(self):
+        """
+        CompositeGeocoder's thread pool drops tasks cancelled while queued
+        """
+        pool = _WorkerPool(1)
+        release = threading.Event()
+        ran = []
+        pool.submit(release.wait)
+        cancel = pool.submit(ran.append, 'cancelled')
+        pool.submit(ran.append, 'kept')
+        cancel.set()
+        release.set()
+        for _ in range(100):
+            if ran:
+                break
+            time.sleep(0.01)
+        self.assertEqual(ran, ['kept'])
+        self.assertEqual(len(pool.threads), 1)
+
+    def test_tags_copies(self):
+        """
+        CompositeGeocoder leaves the locations of its geocoders untagged
+        """
+        cached = Location('cached', (1, 2))
+        stub = StubGeocoder('unused')
+        stub.geocode = lambda query, **kwargs: cached
+        geocoder = CompositeGeocoder([stub])
+        location = geocoder.geocode('a')
+        self.assertIs(location.provider, stub)
+        self.assertEqual(location.address, 'cached')
+        self.assertIsNone(cached.provider)
+
+    def test_configuration(self):
+        """
+        CompositeGeocoder rejects empty lists and unknown modes
+        """
+        with self.assertRaises(ConfigurationError):
+            CompositeGeocoder([])
+        with self.assertRaises(ConfigurationError):
+            CompositeGeocoder([StubGeocoder(None)], mode='random')
@@ -2,14 +2,22 @@
 Test distance formulas
 """
 import math
+import subprocess
+import sys
+import tempfile
+from array import array
+from unittest import SkipTest
 
 from nose.tools import assert_raises, assert_almost_equal # pylint: disable=E0611
 
-from geopy.point import Point
+from geopy import distance as distance_module
+from geopy.point import Point, PointArray
 from geopy.distance import (Distance,
                             GreatCircleDistance,
                             VincentyDistance,
+                            GeodesicDistance,
                             EARTH_RADIUS,
+                            distance_matrix,
                             ELLIPSOIDS)
 
 
@@ -59,6 +67,15 @@ class CommonDistanceComputationCases:
         distance = self.cls((0, 180), (0, -180)).kilometers
         assert_almost_equal(distance, 0)
 
+    def test_should_measure_tuples_points_and_strings_alike(self):
+        distance = self.cls((41.5, -81), (40, -80)).kilometers
+        assert self.cls(Point(41.5, -81), Point(40, -80)).kilometers == distance
+        assert self.cls("41.5, -81", [40, -80, 1]).kilometers == distance
+
+    def test_should_normalize_tuples_out_of_range(self):
+        distance = self.cls((10, 190), (0, 0)).kilometers
+        assert distance == self.cls((10, -170), (0, 0)).kilometers
+
 
 class CommonMathematicalOperatorCases:
 
@@ -200,3 +217,393 @@ class TestWhenComputingVincentyDistance(CommonDistanceCases):
                        for y in range(len(results))
                        if x != y)
 
+
+
+class TestWhenComputingGeodesicDistance(CommonDistanceCases):
+
+    cls = GeodesicDistance
+
+    def setup(self, *_):
+        if not distance_module.geographiclib_available:
+            raise SkipTest("geographiclib is not installed")
+
+    setup_method = setup
+
+    def test_should_compute_distance_for_half_trip_around_equator(self):
+        # The shortest path goes over a pole: half a meridian.
+        distance = self.cls((0, 0), (0, 180)).kilometers
+        assert_almost_equal(distance, 20003.931459, 6)
+
+    def test_should_converge_for_nearly_antipodal_points(self):
+        assert_raises(ValueError, VincentyDistance, (0, 0), (0.5, 179.7))
+        distance = self.cls((0, 0), (0.5, 179.7)).kilometers
+        assert_almost_equal(distance, 19944.127421, 6)
+
+    def test_should_agree_with_vincenty(self):
+        for ellipsoid in ELLIPSOIDS:
+            distance = self.cls(
+                (41.49008, -71.312796), (41.499498, -81.695391),
+                ellipsoid=ellipsoid
+            )
+            expected = VincentyDistance(
+                (41.49008, -71.312796), (41.499498, -81.695391),
+                ellipsoid=ellipsoid
+            )
+            assert_almost_equal(distance.kilometers, expected.kilometers, 6)
+
+    def test_should_compute_destination_for_half_trip_around_equator(self):
+        distance = self.cls(ELLIPSOIDS['WGS-84'][0] * math.pi)
+        destination = distance.destination((0, 0), 90)
+        assert_almost_equal(destination.latitude, 0)
+        assert_almost_equal(abs(destination.longitude), 180)
+
+    def test_should_invert_destination(self):
+        start = (41.49008, -71.312796)
+        destination = self.cls(500).destination(start, 37)
+        assert_almost_equal(self.cls(start, destination).kilometers, 500, 6)
+
+
+class TestWhenMeasuringManyGreatCircleDistances:
+
+    cls = GreatCircleDistance
+
+    lats1 = [41.49008, 38.89037, 0, -16.1333333]
+    lngs1 = [-71.312796, -77.03196, 0, 180.0]
+    lats2 = [41.499498, 41.499498, 0, -90]
+    lngs2 = [-81.695391, -81.695391, 180, 0]
+
+    def measure_many_without_numpy(self, *args):
+        numpy_available = distance_module.numpy_available
+        distance_module.numpy_available = False
+        try:
+            return self.cls().measure_many(*args)
+        finally:
+            distance_module.numpy_available = numpy_available
+
+    def assert_measures_like_measure(self, distances):
+        assert len(distances) == len(self.lats1)
+        for i, measured in enumerate(distances):
+            expected = self.cls(
+                (self.lats1[i], self.lngs1[i]), (self.lats2[i], self.lngs2[i])
+            ).kilometers
+            assert_almost_equal(measured, expected, 6)
+
+    def test_should_measure_like_measure_with_numpy(self):
+        if not distance_module.numpy_available:
+            raise SkipTest("numpy is not installed")
+        import numpy
+        distances = self.cls().measure_many(
+            numpy.array(self.lats1), numpy.array(self.lngs1),
+            numpy.array(self.lats2), numpy.array(self.lngs2)
+        )
+        assert isinstance(distances, numpy.ndarray)
+        self.assert_measures_like_measure(distances)
+
+    def test_should_broadcast_a_single_destination_with_numpy(self):
+        if not distance_module.numpy_available:
+            raise SkipTest("numpy is not installed")
+        distances = self.cls().measure_many(self.lats1, self.lngs1, 0, 0)
+        assert_almost_equal(distances[2], 0)
+        assert_almost_equal(
+            distances[0], self.cls((self.lats1[0], self.lngs1[0]), (0, 0)).km
+        )
+
+    def test_should_measure_like_measure_without_numpy(self):
+        distances = self.measure_many_without_numpy(
+            array('d', self.lats1), array('d', self.lngs1),
+            self.lats2, self.lngs2
+        )
+        assert isinstance(distances, array)
+        self.assert_measures_like_measure(distances)
+
+    def test_should_use_radius(self):
+        distances = self.cls(radius=1).measure_many([0], [0], [0], [180])
+        assert_almost_equal(distances[0], math.pi)
+
+    def test_should_not_measure_sequences_of_different_lengths(self):
+        assert_raises(
+            ValueError, self.measure_many_without_numpy,
+            [0, 1], [0, 1], [0], [0]
+        )
+
+
+class TestWhenMeasuringManyVincentyDistances:
+
+    cls = VincentyDistance
+
+    lats1 = [41.49008, 38.89037, 0, 10, -16.1333333]
+    lngs1 = [-71.312796, -77.03196, 0, 10, 180.0]
+    lats2 = [41.499498, 41.499498, 0, 10, -90]
+    lngs2 = [-81.695391, -81.695391, 180, 10, 0]
+
+    # (0, 0) to (0, 180) does not converge.
+    failed = [2]
+
+    def assert_measures_like_measure(self, distances, ellipsoid='WGS-84'):
+        assert len(distances) == len(self.lats1)
+        for i, measured in enumerate(distances):
+            if i in self.failed:
+                assert math.isnan(measured)
+                continue
+            expected = self.cls(
+                (self.lats1[i], self.lngs1[i]),
+                (self.lats2[i], self.lngs2[i]),
+                ellipsoid=ellipsoid
+            ).kilometers
+            assert_almost_equal(measured, expected, 6)
+
+    def test_should_measure_like_measure_with_numpy(self):
+        if not distance_module.numpy_available:
+            raise SkipTest("numpy is not installed")
+        import numpy
+        for ellipsoid in ELLIPSOIDS:
+            distances = self.cls(ellipsoid=ellipsoid).measure_many(
+                numpy.array(self.lats1), numpy.array(self.lngs1),
+                numpy.array(self.lats2), numpy.array(self.lngs2)
+            )
+            self.assert_measures_like_measure(distances, ellipsoid)
+
+    def test_should_report_pairs_which_did_not_converge(self):
+        if not distance_module.numpy_available:
+            raise SkipTest("numpy is not installed")
+        import numpy
+        distances = self.cls().measure_many(
+            self.lats1, self.lngs1, self.lats2, self.lngs2
+        )
+        assert list(numpy.flatnonzero(numpy.isnan(distances))) == self.failed
+
+    def test_should_return_pairs_which_did_not_converge(self):
+        if not distance_module.numpy_available:
+            raise SkipTest("numpy is not installed")
+        distances, failed = self.cls().measure_many(
+            self.lats1 + [float('nan')], self.lngs1 + [0],
+            self.lats2 + [0], self.lngs2 + [0], return_failed=True
+        )
+        assert list(failed) == self.failed
+        assert math.isnan(distances[-1])
+
+    def test_should_return_pairs_which_did_not_converge_without_numpy(self):
+        numpy_available = distance_module.numpy_available
+        distance_module.numpy_available = False
+        try:
+            distances, failed = self.cls().measure_many(
+                self.lats1 + [float('nan')], self.lngs1 + [0],
+                self.lats2 + [0], self.lngs2 + [0], return_failed=True
+            )
+        finally:
+            distance_module.numpy_available = numpy_available
+        assert list(failed) == self.failed
+        assert math.isnan(distances[-1])
+
+    def test_should_keep_the_shape_of_the_coordinates(self):
+        if not distance_module.numpy_available:
+            raise SkipTest("numpy is not installed")
+        import numpy
+        lats = numpy.array([[0, 1], [2, 3]])
+        distances = self.cls().measure_many(lats, 0, 0, 0)
+        assert distances.shape == (2, 2)
+        assert distances[0, 0] == 0
+        assert_almost_equal(distances[1, 1], self.cls((3, 0), (0, 0)).km, 6)
+
+    def test_should_measure_like_measure_without_numpy(self):
+        numpy_available = distance_module.numpy_available
+        distance_module.numpy_available = False
+        try:
+            distances = self.cls().measure_many(
+                self.lats1, self.lngs1, self.lats2, self.lngs2
+            )
+        finally:
+            distance_module.numpy_available = numpy_available
+        assert isinstance(distances, array)
+        self.assert_measures_like_measure(distances)
+
+
+class TestWhenMeasuringManyGeodesicDistances(TestWhenMeasuringManyGreatCircleDistances):
+
+    cls = GeodesicDistance
+
+    def setup(self, *_):
+        if not distance_module.geographiclib_available:
+            raise SkipTest("geographiclib is not installed")
+
+    setup_method = setup
+
+    def test_should_use_radius(self):
+        raise SkipTest("geodesic takes an ellipsoid, not a radius")
+
+    def test_should_measure_nearly_antipodal_points(self):
+        distances = self.cls().measure_many([0], [0], [0.5], [179.7])
+        assert_almost_equal(distances[0], 19944.127421, 6)
+
+    def test_should_use_ellipsoid(self):
+        distances = self.cls(ellipsoid='Intl 1924').measure_many(
+            self.lats1, self.lngs1, self.lats2, self.lngs2
+        )
+        expected = self.cls(
+            (self.lats1[0], self.lngs1[0]), (self.lats2[0], self.lngs2[0]),
+            ellipsoid='Intl 1924'
+        )
+        assert_almost_equal(distances[0], expected.kilometers, 6)
+
+
+class TestWhenComputingDistanceMatrix:
+
+    points_a = [(41.49008, -71.312796), (38.89037, -77.03196), (0, 0)]
+    points_b = [(41.499498, -81.695391), (0, 0)]
+
+    def assert_matrix(self, matrix, cls=GreatCircleDistance, **kwargs):
+        assert len(matrix) == len(self.points_a)
+        for i, a in enumerate(self.points_a):
+            assert len(matrix[i]) == len(self.points_b)
+            for j, b in enumerate(self.points_b):
+                expected = cls(a, b, **kwargs).kilometers
+                assert_almost_equal(matrix[i][j], expected, 6)
+
+    def test_should_compute_great_circle_distances(self):
+        self.assert_matrix(distance_matrix(self.points_a, self.points_b))
+
+    def test_should_compute_vincenty_distances(self):
+        matrix = distance_matrix(
+            self.points_a, self.points_b, method='vincenty',
+            ellipsoid='Intl 1924'
+        )
+        self.assert_matrix(matrix, VincentyDistance, ellipsoid='Intl 1924')
+
+    def test_should_compute_geodesic_distances(self):
+        if not distance_module.geographiclib_available:
+            raise SkipTest("geographiclib is not installed")
+        matrix = distance_matrix(
+            self.points_a + [(0.5, 179.7)], self.points_b, method='geodesic'
+        )
+        assert_almost_equal(matrix[3][1], 19944.127421, 6)
+        matrix = distance_matrix(
+            self.points_a, self.points_b, method='geodesic',
+            ellipsoid='Intl 1924'
+        )
+        self.assert_matrix(matrix, GeodesicDistance, ellipsoid='Intl 1924')
+
+    def test_should_compute_in_chunks(self):
+        matrix = distance_matrix(self.points_a, self.points_b, chunk_size=1)
+        self.assert_matrix(matrix)
+
+    def test_should_compute_in_processes(self):
+        matrix = distance_matrix(
+            self.points_a, self.points_b, chunk_size=2, processes=2
+        )
+        self.assert_matrix(matrix)
+
+    def test_should_write_into_out(self):
+        if not distance_module.numpy_available:
+            raise SkipTest("numpy is not installed")
+        import numpy
+        out = numpy.zeros((len(self.points_a), len(self.points_b)))
+        assert distance_matrix(self.points_a, self.points_b, out=out) is out
+        self.assert_matrix(out)
+
+    def test_should_write_into_memmap(self):
+        if not distance_module.numpy_available:
+            raise SkipTest("numpy is not installed")
+        import numpy
+        with tempfile.NamedTemporaryFile() as matrix_file:
+            out = numpy.memmap(
+                matrix_file.name, dtype='float64', mode='w+',
+                shape=(len(self.points_a), len(self.points_b))
+            )
+            distance_matrix(self.points_a, self.points_b, out=out)
+            out.flush()
+            self.assert_matrix(numpy.fromfile(matrix_file.name).reshape(
+                len(self.points_a), len(self.points_b)
+            ))
+
+    def test_should_compute_without_numpy(self):
+        numpy_available = distance_module.numpy_available
+        distance_module.numpy_available = False
+        try:
+            matrix = distance_matrix(self.points_a, self.points_b)
+        finally:
+            distance_module.numpy_available = numpy_available
+        assert isinstance(matrix[0], array)
+        self.assert_matrix(matrix)
+
+    def test_should_not_accept_out_of_another_shape(self):
+        assert_raises(
+            ValueError, distance_matrix, self.points_a, self.points_b,
+            out=[[0, 0]]
+        )
+
+    def test_should_not_accept_unknown_method(self):
+        assert_raises(
+            ValueError, distance_matrix, self.points_a, self.points_b,
+            method='manhattan'
+        )
+
+
+class TestWhenImporting:
+
+    def test_should_not_import_numpy_nor_multiprocessing(self):
+        if sys.version_info < (3, 4):
+            raise SkipTest("NumPy is imported eagerly")
+        code = (
+            "import sys, geopy.distance\n"
+            "assert 'numpy' not in sys.modules\n"
+            "assert 'multiprocessing' not in sys.modules\n"
+        )
+        subprocess.check_call([sys.executable, '-c', code])
+
+
+class TestWhenMeasuringPaths:
+
+    path = [(41.49008, -71.312796), (41.499498, -81.695391),
+            (38.89037, -77.03196), (37.44188, -122.14302)]
+
+    def test_should_measure_path_like_distance(self):
+        for cls in (GreatCircleDistance, VincentyDistance):
+            expected = cls(*self.path).kilometers
+            assert cls().measure_path(self.path).kilometers == expected
+
+    def test_should_measure_path_on_the_same_ellipsoid(self):
+        path = VincentyDistance(ellipsoid='GRS-80').measure_path(self.path)
+        assert path.ELLIPSOID == ELLIPSOIDS['GRS-80']
+        assert path.kilometers == VincentyDistance(
+            *self.path, ellipsoid='GRS-80'
+        ).kilometers
+        path = GreatCircleDistance(radius=1).measure_path(self.path)
+        assert path.RADIUS == 1
+
+    def test_should_measure_point_array_as_a_path(self):
+        points = PointArray.from_points(self.path)
+        for cls in (GreatCircleDistance, VincentyDistance):
+            assert_almost_equal(
+                cls(points).kilometers, cls(*self.path).kilometers, 9
+            )
+
+    def test_should_measure_path_from_iterator(self):
+        points = (point for point in self.path)
+        expected = GreatCircleDistance(*self.path).kilometers
+        path = GreatCircleDistance().measure_path(points)
+        assert isinstance(path, GreatCircleDistance)
+        assert path.kilometers == expected
+
+    def test_should_measure_path_of_fewer_than_two_points(self):
+        assert GreatCircleDistance().measure_path(iter([])).kilometers == 0
+        assert GreatCircleDistance().measure_path(iter(self.path[:1])).km == 0
+
+    def test_should_yield_segments(self):
+        segments = GreatCircleDistance().segments(iter(self.path))
+        expected = [
+            GreatCircleDistance(a, b).kilometers
+            for a, b in zip(self.path, self.path[1:])
+        ]
+        assert list(segments) == expected
+
+    def test_should_read_points_lazily(self):
+        read = []
+
+        def points():
+            for point in self.path:
+                read.append(point)
+                yield point
+
+        segments = GreatCircleDistance().segments(points())
+        next(segments)
+        assert read == self.path[:2]
@@ -0,0 +1,139 @@
+"""
+Test spreading requests over pools of API keys.
+"""
+
+import sys
+import unittest
+
+from geopy.exc import GeocoderAuthenticationFailure, GeocoderQuotaExceeded
+from geopy.geocoders import GoogleV3
+from geopy.keypool import KeyPool
+from test.http_server import LocalServer
+
+if sys.version_info >= (3, 5):
+    import asyncio
+    from geopy.aio import AsyncGeocoder
+
+
+class KeyPoolTestCase(unittest.TestCase): # pylint: disable=R0904
+    """
+    geopy.keypool.KeyPool
+    """
+
+    def test_round_robin(self):
+        """
+        KeyPool hands keys out in turn
+        """
+        pool = KeyPool(['a', 'b', 'c'])
+        self.assertEqual([pool.get() for _ in range(5)], ['a', 'b', 'c', 'a', 'b'])
+
+    def test_least_used(self):
+        """
+        KeyPool hands out the key used least
+        """
+        pool = KeyPool(['a', 'b'], strategy='least_used')
+        pool.get()
+        pool.get()
+        pool.bench('a', seconds=0)
+        self.assertEqual(pool.get(), 'a')
+        self.assertEqual(pool.get(), 'b')
+
+    def test_benched(self):
+        """
+        KeyPool leaves out keys which ran out of quota
+        """
+        pool = KeyPool(['a', 'b'], bench_for=60)
+        pool.record('a', GeocoderQuotaExceeded())
+        pool.record('b', GeocoderAuthenticationFailure())
+        with self.assertRaises(GeocoderQuotaExceeded):
+            pool.get()
+        stats = pool.stats()
+        self.assertEqual(stats['a'][:3], (0, 1, 1))
+        self.assertGreater(stats['a'].benched_for, 59)
+
+    def test_other_errors_not_benched(self):
+        """
+        KeyPool keeps keys whose calls failed for other reasons
+        """
+        pool = KeyPool(['a', 'b'])
+        pool.record('a', ValueError())
+        self.assertEqual(pool.get(), 'a')
+        self.assertEqual(pool.stats()['a'], (1, 1, 0, 0.))
+
+
+class GeocoderKeyPoolTestCase(unittest.TestCase): # pylint: disable=R0904
+    """
+    Geocoders with a KeyPool as api_key
+    """
+
+    def setUp(self):
+        self.server = LocalServer().start()
+        self.server.payload = {
+            'results': [{
+                'formatted_address': 'Flatiron',
+                'geometry': {'location': {'lat': 40.74, 'lng': -73.99}},
+            }],
+            'status': 'OK',
+        }
+        self.geocoder = GoogleV3(
+            api_key=['a', 'b'],
+            domain='127.0.0.1:%s' % self.server.server_address[1],
+            scheme='http',
+        )
+
+    def tearDown(self):
+        self.server.stop()
+
+    def keys_sent(self):
+        """
+        The key of each request received.
+        """
+        return [path.split('key=')[1][0] for path in self.server.requests]
+
+    def test_spread(self):
+        """
+        Geocoder uses the keys of its pool in turn
+        """
+        self.assertIsInstance(self.geocoder.api_key, KeyPool)
+        for _ in range(4):
+            self.assertEqual(self.geocoder.geocode('x').address, 'Flatiron')
+        self.assertEqual(self.keys_sent(), ['a', 'b', 'a', 'b'])
+        self.assertEqual(self.geocoder.api_key.stats()['a'].requests, 2)
+
+    def test_bench_on_error_status(self):
+        """
+        Geocoder benches a key refused with an error status
+        """
+        self.server.statuses = [402]
+        with self.assertRaises(GeocoderQuotaExceeded):
+            self.geocoder.geocode('x')
+        self.geocoder.geocode('x')
+        self.geocoder.geocode('x')
+        self.assertEqual(self.keys_sent(), ['a', 'b', 'b'])
+
+    def test_bench_on_error_payload(self):
+        """
+        Geocoder benches a key refused in the response body
+        """
+        self.server.payload = {'results': [], 'status': 'OVER_QUERY_LIMIT'}
+        with self.assertRaises(GeocoderQuotaExceeded):
+            self.geocoder.geocode('x')
+        self.assertEqual(self.geocoder.api_key.stats()['a'].benches, 1)
+
+    @unittest.skipIf(sys.version_info < (3, 5), "asyncio API requires Python 3.5")
+    def test_async(self):
+        """
+        AsyncGeocoder sends one key per call
+        """
+        geocoder = AsyncGeocoder(self.geocoder)
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        try:
+            location = loop.run_until_complete(geocoder.geocode('x'))
+            self.assertEqual(location.address, 'Flatiron')
+            self.assertEqual(self.keys_sent(), ['a'])
+            self.assertEqual(self.geocoder.api_key.stats()['a'].requests, 1)
+        finally:
+            geocoder.transport.clear()
+            loop.close()
+            asyncio.set_event_loop(None)
@@ -2,10 +2,15 @@
 Test Point.
 """
 
+import copy
+import math
+import pickle
 import unittest
 
+from geopy import point as point_module
 from geopy.compat import u
-from geopy.point import Point
+from geopy.distance import GreatCircleDistance, distance_matrix
+from geopy.point import Point, PointArray, PointView
 
 class PointTestCase(unittest.TestCase): # pylint: disable=R0904
     """
@@ -96,5 +101,212 @@ class PointTestCase(unittest.TestCase): # pylint: disable=R0904
             Point(self.lat+10, self.lon-10, self.alt)
         )
 
+    def test_point_eq_sequence(self):
+        """
+        Point.__eq__ with a sequence
+        """
+        self.assertEqual(Point(self.lat, self.lon, self.alt), self.coords)
+        self.assertNotEqual(Point(self.lat, self.lon), self.coords)
+
+    def test_point_setitem_updates_attributes(self):
+        """
+        Point.__setitem__ changes the named coordinates too
+        """
+        point = Point(self.lat, self.lon, self.alt)
+        point[0] = 10.0
+        point[-1] = 5.0
+        self.assertEqual(point.latitude, 10.0)
+        self.assertEqual(point.altitude, 5.0)
+        self.assertEqual(point[1:], (self.lon, 5.0))
+
+    def test_point_hash(self):
+        """
+        Point.__hash__
+        """
+        point = Point(self.lat, self.lon, self.alt)
+        self.assertEqual(hash(point), hash(Point(*self.coords)))
+        self.assertEqual(hash(point), hash(self.coords))
+        points = set([point, Point(*self.coords), Point(self.lat, self.lon)])
+        self.assertEqual(len(points), 2)
+        self.assertEqual({point: 1}[Point(self.lat, self.lon, self.alt)], 1)
 
+    def test_point_has_no_dict(self):
+        """
+        Point stores its coordinates in slots only
+        """
+        point = Point(self.lat, self.lon, self.alt)
+        self.assertFalse(hasattr(point, '__dict__'))
+        self.assertEqual(
+            set(Point.__slots__),
+            set(('latitude', 'longitude', 'altitude'))
+        )
 
+    def test_point_hash_follows_coordinates(self):
+        """
+        Point can still be changed once hashed, and hashes its coordinates
+        """
+        point = Point(self.lat, self.lon, self.alt)
+        hash(point)
+        point[0] = 10.0
+        point.longitude = 20.0
+        self.assertEqual(hash(point), hash((10.0, 20.0, self.alt)))
+
+
+class PointArrayTestCase(unittest.TestCase): # pylint: disable=R0904
+    """
+    geopy.point.PointArray
+    """
+
+    lats = [40.74113, 41.5, 100, -95.5]
+    lons = [-73.989656, -81.0, 200, -190]
+    alts = [3, 0, 1, 2]
+
+    def assert_points(self, points):
+        """
+        Points of the array are those Point makes of the coordinates.
+        """
+        self.assertEqual(len(points), len(self.lats))
+        for i, point in enumerate(points):
+            self.assertIsInstance(point, PointView)
+            expected = Point(self.lats[i], self.lons[i], self.alts[i])
+            self.assertEqual(tuple(point), tuple(expected))
+
+    def test_point_array_normalizes_like_point(self):
+        """
+        PointArray() normalizes coordinates as Point() does
+        """
+        self.assert_points(PointArray(self.lats, self.lons, self.alts))
+
+    def test_point_array_without_numpy(self):
+        """
+        PointArray() with array('d') buffers
+        """
+        numpy_available = point_module.numpy_available
+        point_module.numpy_available = False
+        try:
+            points = PointArray(self.lats, self.lons, self.alts)
+            self.assertIsInstance(points.latitudes, memoryview)
+            self.assert_points(points)
+            self.assert_points(PointArray.from_points(zip(
+                self.lats, self.lons, self.alts
+            )))
+            self.assertEqual(points[1:3].longitudes.tolist(), [-81.0, -160.0])
+        finally:
+            point_module.numpy_available = numpy_available
+
+    def test_point_array_from_points(self):
+        """
+        PointArray.from_points
+        """
+        points = PointArray.from_points(
+            "%s, %s, %skm" % coordinates
+            for coordinates in zip(self.lats, self.lons, self.alts)
+        )
+        self.assert_points(points)
+
+    def test_point_array_default_altitude(self):
+        """
+        PointArray() altitudes default to 0
+        """
+        points = PointArray(self.lats, self.lons)
+        self.assertEqual([point.altitude for point in points], [0.0] * 4)
+
+    def test_point_array_slice_is_a_view(self):
+        """
+        PointArray slices share the array's buffers
+        """
+        points = PointArray(self.lats, self.lons)
+        tail = points[2:]
+        self.assertEqual(len(tail), 2)
+        tail[0][0] = 10.0
+        self.assertEqual(points.latitudes[2], 10.0)
+
+    def test_point_view_hash_follows_array(self):
+        """
+        PointView hashes its current coordinates, which may still change
+        """
+        points = PointArray(self.lats, self.lons)
+        view = points[0]
+        self.assertEqual(hash(view), hash(Point(self.lats[0], self.lons[0])))
+        view.latitude = 10.0
+        self.assertEqual(hash(view), hash(Point(10.0, self.lons[0])))
+
+    def test_point_view_copy_and_pickle(self):
+        """
+        PointView copies and pickles as a plain Point
+        """
+        view = PointArray(self.lats, self.lons, self.alts)[1]
+        for point in (copy.copy(view), pickle.loads(pickle.dumps(view))):
+            self.assertIs(type(point), Point)
+            self.assertEqual(point, view)
+
+    def test_point_array_buffer_protocol(self):
+        """
+        PointArray columns support the buffer protocol
+        """
+        points = PointArray(self.lats, self.lons)
+        view = memoryview(points.latitudes)
+        self.assertEqual(view.nbytes, 8 * len(self.lats))
+        self.assertEqual(view.tolist()[1], 41.5)
+
+    def test_point_array_index(self):
+        """
+        PointArray.__getitem__
+        """
+        points = PointArray(self.lats, self.lons)
+        self.assertEqual(points[-1], points[3])
+        self.assertEqual(points[0], Point(self.lats[0], self.lons[0]))
+        self.assertRaises(IndexError, lambda: points[4])
+
+    def test_point_array_length_mismatch(self):
+        """
+        PointArray() coordinate sequences must have the same length
+        """
+        self.assertRaises(ValueError, PointArray, [1, 2], [1])
+
+    def test_point_array_distances(self):
+        """
+        Distances accept PointArray
+        """
+        points = PointArray(self.lats, self.lons)
+        tuples = list(zip(
+            points.latitudes.tolist(), points.longitudes.tolist()
+        ))
+        self.assertEqual(
+            GreatCircleDistance().measure_path(points).kilometers,
+            GreatCircleDistance(*tuples).kilometers
+        )
+        matrix = distance_matrix(points, points[:1])
+        self.assertAlmostEqual(
+            matrix[1][0], GreatCircleDistance(tuples[1], tuples[0]).km
+        )
+
+    def test_point_array_from_strings(self):
+        """
+        PointArray.from_strings parses as Point.from_string
+        """
+        strings = [
+            "41.5,-81.0",
+            " -41.5 ; 200 ",
+            "41.5 -81.0",
+            "100, 0",
+            "23 26m 22s N 23 27m 30s E 21.0mi",
+            "-41.5 S, 81.0 E, 2.5km",
+        ]
+        points, errors = PointArray.from_strings(iter(strings))
+        self.assertEqual(errors, [])
+        self.assertEqual(len(points), len(strings))
+        for string, point in zip(strings, points):
+            self.assertEqual(point, Point.from_string(string))
+
+    def test_point_array_from_strings_errors(self):
+        """
+        PointArray.from_strings reports rows it cannot parse
+        """
+        points, errors = Point.parse_many(["41.5,-81.0", "nowhere", None])
+        self.assertEqual(len(points), 3)
+        self.assertEqual(points[0], Point(41.5, -81.0))
+        self.assertEqual([index for index, _ in errors], [1, 2])
+        for index, error in errors:
+            self.assertIsInstance(error, ValueError)
+            self.assertTrue(math.isnan(points[index].latitude))
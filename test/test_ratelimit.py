@@ -0,0 +1,267 @@
+"""
+Test client-side rate limiting.
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from multiprocessing import Pool
+
+from geopy.exc import GeocoderQuotaExceeded
+from geopy.geocoders import GoogleV3, Nominatim
+from geopy.ratelimit import RateLimiter, SQLiteRateLimiter, TokenBucket
+from test.http_server import LocalServer
+
+if sys.version_info >= (3, 5):
+    import asyncio
+    from geopy.aio import AsyncGeocoder
+
+
+class TokenBucketTestCase(unittest.TestCase): # pylint: disable=R0904
+    """
+    geopy.ratelimit.TokenBucket
+    """
+
+    def test_burst_then_spaced(self):
+        """
+        TokenBucket lets a burst through, then spaces requests out
+        """
+        bucket = TokenBucket(rate=10, burst=2)
+        delays = [bucket.reserve() for _ in range(4)]
+        self.assertEqual(delays[:2], [0., 0.])
+        self.assertAlmostEqual(delays[2], 0.1, places=2)
+        self.assertAlmostEqual(delays[3], 0.2, places=2)
+        self.assertLess(bucket.tokens, 0)
+
+    def test_refill(self):
+        """
+        TokenBucket earns tokens back over time, up to its burst
+        """
+        bucket = TokenBucket(rate=100, burst=1)
+        bucket.reserve()
+        time.sleep(0.05)
+        self.assertEqual(bucket.tokens, 1)
+        self.assertEqual(bucket.reserve(), 0.)
+
+    def test_threads_queued(self):
+        """
+        TokenBucket gives concurrent callers distinct turns
+        """
+        bucket = TokenBucket(rate=100, burst=1)
+        delays = []
+        lock = threading.Lock()
+
+        def reserve():
+            delay = bucket.reserve()
+            with lock:
+                delays.append(delay)
+
+        threads = [threading.Thread(target=reserve) for _ in range(20)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        delays.sort()
+        self.assertEqual(delays[0], 0.)
+        for previous, delay in zip(delays, delays[1:]):
+            self.assertLess(previous, delay)
+        self.assertAlmostEqual(delays[-1], 0.19, delta=0.05)
+
+    def test_invalid(self):
+        """
+        TokenBucket rejects non-positive rates
+        """
+        with self.assertRaises(ValueError):
+            TokenBucket(rate=0)
+        with self.assertRaises(ValueError):
+            TokenBucket(rate=1, burst=0)
+
+
+class RateLimiterTestCase(unittest.TestCase): # pylint: disable=R0904
+    """
+    geopy.ratelimit.RateLimiter
+    """
+
+    def test_per_host(self):
+        """
+        RateLimiter keeps a bucket per listed host
+        """
+        limiter = RateLimiter({'a.example.com': (10, 1)})
+        self.assertEqual(limiter.reserve('https://a.example.com/?q=1'), 0.)
+        self.assertGreater(limiter.reserve('https://a.example.com/?q=2'), 0.)
+        for _ in range(3):
+            self.assertEqual(limiter.reserve('https://b.example.com/'), 0.)
+        self.assertIsNone(limiter.bucket('b.example.com'))
+
+    def test_default(self):
+        """
+        RateLimiter limits unlisted hosts by its default
+        """
+        limiter = RateLimiter(default=(10, 1))
+        limiter.reserve('https://a.example.com/')
+        self.assertEqual(limiter.reserve('https://b.example.com/'), 0.)
+        self.assertGreater(limiter.reserve('https://b.example.com/'), 0.)
+
+    def test_provider_defaults(self):
+        """
+        Geocoders with a usage policy have a rate limiter by default
+        """
+        self.assertEqual(
+            Nominatim.rate_limiter.policies,
+            {'nominatim.openstreetmap.org': (1, 1)}
+        )
+        self.assertIn('maps.googleapis.com', GoogleV3.rate_limiter.policies)
+
+
+def _reserve_shared(path):
+    """
+    Reserve from an SQLiteRateLimiter in a worker process.
+    """
+    limiter = SQLiteRateLimiter(path, rate=100, burst=1)
+    return [limiter.reserve('https://example.com/', 'k') for _ in range(5)]
+
+
+class SQLiteRateLimiterTestCase(unittest.TestCase): # pylint: disable=R0904
+    """
+    geopy.ratelimit.SQLiteRateLimiter
+    """
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, 'limits.sqlite')
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_shared_between_processes(self):
+        """
+        SQLiteRateLimiter gives every process its own turn
+        """
+        pool = Pool(3)
+        try:
+            delays = sum(pool.map(_reserve_shared, [self.path] * 3), [])
+        finally:
+            pool.close()
+            pool.join()
+        self.assertEqual(len(delays), 15)
+        self.assertEqual(delays.count(0.), 1)
+        self.assertEqual(len(set(delays)), 15)
+        budget = SQLiteRateLimiter(self.path).budget('https://example.com/', 'k')
+        self.assertEqual(budget.used, 15)
+
+    def test_daily_quota(self):
+        """
+        SQLiteRateLimiter refuses requests beyond the daily quota
+        """
+        limiter = SQLiteRateLimiter(self.path, daily_quota=2)
+        other = SQLiteRateLimiter(self.path, daily_quota=2)
+        self.assertEqual(limiter.reserve('https://example.com/', 'a'), 0.)
+        self.assertEqual(other.reserve('https://example.com/', 'a'), 0.)
+        with self.assertRaises(GeocoderQuotaExceeded):
+            limiter.reserve('https://example.com/', 'a')
+        self.assertEqual(limiter.reserve('https://example.com/', 'b'), 0.)
+        budgets = dict(
+            (budget.name, budget.remaining) for budget in other.budgets()
+        )
+        self.assertEqual(budgets, {
+            SQLiteRateLimiter.bucket_name('https://example.com/', 'a'): 0,
+            SQLiteRateLimiter.bucket_name('https://example.com/', 'b'): 1,
+        })
+
+    def test_key_not_stored(self):
+        """
+        SQLiteRateLimiter names buckets after a digest of the key
+        """
+        name = SQLiteRateLimiter.bucket_name('https://example.com/', 'secret')
+        self.assertTrue(name.startswith('example.com:'))
+        self.assertNotIn('secret', name)
+        self.assertEqual(
+            SQLiteRateLimiter.bucket_name('https://example.com/'), 'example.com'
+        )
+
+
+class GeocoderRateLimitTestCase(unittest.TestCase): # pylint: disable=R0904
+    """
+    Geocoder.rate_limiter
+    """
+
+    def setUp(self):
+        self.server = LocalServer().start()
+        self.server.payload = [
+            {'lat': '40.7410861', 'lon': '-73.9896297', 'display_name': 'Flatiron'},
+        ]
+        self.geocoder = Nominatim(
+            domain='127.0.0.1:%s' % self.server.server_address[1],
+            scheme='http',
+            timeout=5,
+        )
+
+    def tearDown(self):
+        self.server.stop()
+
+    def test_self_hosted_not_limited(self):
+        """
+        Nominatim does not limit servers other than openstreetmap.org
+        """
+        self.assertEqual(self.geocoder._reserve(self.geocoder.api), 0.) # pylint: disable=W0212
+
+    def test_requests_spaced(self):
+        """
+        Geocoder waits for its rate limiter before each request
+        """
+        self.geocoder.rate_limiter = TokenBucket(rate=20, burst=1)
+        start = time.time()
+        for _ in range(4):
+            self.geocoder.geocode('175 5th Avenue NYC')
+        self.assertGreaterEqual(time.time() - start, 0.14)
+        self.assertEqual(len(self.server.requests), 4)
+
+    @unittest.skipIf(sys.version_info < (3, 5), "asyncio API requires Python 3.5")
+    def test_async_requests_spaced(self):
+        """
+        AsyncGeocoder waits for the rate limiter on the event loop
+        """
+        self.geocoder.rate_limiter = TokenBucket(rate=20, burst=1)
+        geocoder = AsyncGeocoder(self.geocoder)
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        try:
+            start = time.time()
+            results = loop.run_until_complete(asyncio.gather(*[
+                geocoder.geocode('query %d' % i) for i in range(4)
+            ]))
+            self.assertGreaterEqual(time.time() - start, 0.14)
+            self.assertEqual(len(results), 4)
+            self.assertEqual(len(self.server.requests), 4)
+        finally:
+            geocoder.transport.clear()
+            loop.close()
+            asyncio.set_event_loop(None)
+
+    def test_limited_by_key(self):
+        """
+        Geocoder rate limits by the API key in the request
+        """
+        limiter = SQLiteRateLimiter(
+            os.path.join(tempfile.mkdtemp(), 'limits.sqlite'), daily_quota=1
+        )
+        try:
+            geocoder = GoogleV3(
+                api_key='a',
+                domain='127.0.0.1:%s' % self.server.server_address[1],
+                scheme='http',
+            )
+            geocoder.rate_limiter = limiter
+            self.server.payload = {'results': [], 'status': 'ZERO_RESULTS'}
+            self.assertIsNone(geocoder.geocode('x'))
+            with self.assertRaises(GeocoderQuotaExceeded):
+                geocoder.geocode('x')
+            geocoder.api_key = 'b'
+            self.assertIsNone(geocoder.geocode('x'))
+            self.assertEqual(len(self.server.requests), 2)
+        finally:
+            shutil.rmtree(os.path.dirname(limiter.path))
@@ -0,0 +1,220 @@
+"""
+Test retrying failed geocoder requests.
+"""
+
+import sys
+import time
+import unittest
+
+from geopy.exc import (
+    GeocoderQueryError,
+    GeocoderQuotaExceeded,
+    GeocoderServiceError,
+    GeocoderTimedOut,
+    GeocoderUnavailable,
+)
+from geopy.geocoders import Nominatim
+from geopy.retry import RetryPolicy, RETRYABLE_ERRORS
+from test.http_server import LocalServer
+
+if sys.version_info >= (3, 5):
+    import asyncio
+    from geopy.aio import AsyncGeocoder
+
+
+class RetryPolicyTestCase(unittest.TestCase): # pylint: disable=R0904
+    """
+    geopy.retry.RetryPolicy
+    """
+
+    def test_retryable_errors(self):
+        """
+        RETRYABLE_ERRORS are those of unreachable services
+        """
+        self.assertEqual(RETRYABLE_ERRORS, frozenset([
+            GeocoderTimedOut, GeocoderUnavailable
+        ]))
+
+    def test_status(self):
+        """
+        RetryPolicy retries errors of server failure statuses only
+        """
+        policy = RetryPolicy()
+        started = time.time()
+        errors = dict(
+            (status, GeocoderServiceError()) for status in (404, 429, 500, 502)
+        )
+        for status, error in errors.items():
+            error.status = status
+        self.assertIsNone(policy.delay(errors[404], 1, started))
+        self.assertIsNotNone(policy.delay(errors[429], 1, started))
+        self.assertIsNotNone(policy.delay(errors[500], 1, started))
+        self.assertIsNotNone(policy.delay(errors[502], 1, started))
+        self.assertIsNone(policy.delay(GeocoderServiceError(), 1, started))
+
+    def test_not_retried(self):
+        """
+        RetryPolicy does not retry client errors, nor past its attempts
+        """
+        policy = RetryPolicy(attempts=2)
+        started = time.time()
+        self.assertIsNone(policy.delay(GeocoderQueryError(), 1, started))
+        self.assertIsNone(policy.delay(GeocoderQuotaExceeded(), 1, started))
+        self.assertIsNotNone(policy.delay(GeocoderTimedOut(), 1, started))
+        self.assertIsNone(policy.delay(GeocoderTimedOut(), 2, started))
+
+    def test_exponential_backoff(self):
+        """
+        RetryPolicy doubles its backoff, up to max_backoff
+        """
+        policy = RetryPolicy(attempts=10, backoff=1, max_backoff=5, jitter=False)
+        started = time.time()
+        self.assertEqual(
+            [policy.delay(GeocoderTimedOut(), n, started) for n in range(1, 6)],
+            [1, 2, 4, 5, 5]
+        )
+
+    def test_jitter(self):
+        """
+        RetryPolicy waits a random fraction of its backoff
+        """
+        policy = RetryPolicy(attempts=10, backoff=1)
+        delays = [
+            policy.delay(GeocoderTimedOut(), 3, time.time()) for _ in range(50)
+        ]
+        self.assertTrue(all(0 <= delay <= 4 for delay in delays))
+        self.assertGreater(len(set(delays)), 1)
+
+    def test_retry_after(self):
+        """
+        RetryPolicy waits at least as long as the service asks
+        """
+        error = GeocoderTimedOut()
+        error.retry_after = 7.
+        policy = RetryPolicy(backoff=1)
+        self.assertEqual(policy.delay(error, 1, time.time()), 7.)
+
+    def test_quota_retry_after(self):
+        """
+        RetryPolicy retries an exceeded quota the service says when to retry
+        """
+        error = GeocoderQuotaExceeded()
+        error.retry_after = 2.
+        policy = RetryPolicy(backoff=1)
+        self.assertEqual(policy.delay(error, 1, time.time()), 2.)
+
+    def test_deadline(self):
+        """
+        RetryPolicy starts no retry past its deadline
+        """
+        policy = RetryPolicy(attempts=10, backoff=1, jitter=False, deadline=3)
+        started = time.time()
+        self.assertEqual(policy.delay(GeocoderTimedOut(), 2, started), 2)
+        self.assertIsNone(policy.delay(GeocoderTimedOut(), 3, started))
+
+
+class GeocoderRetryTestCase(unittest.TestCase): # pylint: disable=R0904
+    """
+    Geocoder.retry_policy
+    """
+
+    def setUp(self):
+        self.server = LocalServer().start()
+        self.server.payload = [
+            {'lat': '40.7410861', 'lon': '-73.9896297', 'display_name': 'Flatiron'},
+        ]
+        self.geocoder = Nominatim(
+            domain='127.0.0.1:%s' % self.server.server_address[1],
+            scheme='http',
+            timeout=5,
+        )
+        self.geocoder.retry_policy = RetryPolicy(attempts=3, backoff=0.01)
+
+    def tearDown(self):
+        self.server.stop()
+
+    def test_retried(self):
+        """
+        Geocoder retries server failures
+        """
+        self.server.statuses = [503, 502]
+        location = self.geocoder.geocode('175 5th Avenue NYC')
+        self.assertEqual(location.address, 'Flatiron')
+        self.assertEqual(len(self.server.requests), 3)
+
+    def test_gives_up(self):
+        """
+        Geocoder raises the last error once out of attempts
+        """
+        self.server.statuses = [503, 503, 504, 503]
+        with self.assertRaises(GeocoderTimedOut):
+            self.geocoder.geocode('175 5th Avenue NYC')
+        self.assertEqual(len(self.server.requests), 3)
+
+    def test_client_error_not_retried(self):
+        """
+        Geocoder does not retry a bad request
+        """
+        self.server.statuses = [400]
+        with self.assertRaises(GeocoderQueryError):
+            self.geocoder.geocode('175 5th Avenue NYC')
+        self.assertEqual(len(self.server.requests), 1)
+
+    def test_not_found_not_retried(self):
+        """
+        Geocoder raises an unmapped client error status after one attempt
+        """
+        self.server.statuses = [404]
+        try:
+            self.geocoder.geocode('175 5th Avenue NYC')
+        except GeocoderServiceError as error:
+            self.assertEqual(error.status, 404)
+        else:
+            self.fail("GeocoderServiceError not raised")
+        self.assertEqual(len(self.server.requests), 1)
+
+    def test_retry_after(self):
+        """
+        Geocoder errors carry the service's Retry-After
+        """
+        self.geocoder.retry_policy = None
+        self.server.statuses = [503]
+        self.server.extra_headers['Retry-After'] = '120'
+        try:
+            self.geocoder.geocode('175 5th Avenue NYC')
+        except GeocoderTimedOut as error:
+            self.assertEqual(error.retry_after, 120.)
+        else:
+            self.fail("GeocoderTimedOut not raised")
+
+    def test_too_many_requests_retried(self):
+        """
+        Geocoder retries a 429 response after its Retry-After
+        """
+        self.server.statuses = [429]
+        self.server.extra_headers['Retry-After'] = '0.2'
+        started = time.time()
+        location = self.geocoder.geocode('175 5th Avenue NYC')
+        self.assertEqual(location.address, 'Flatiron')
+        self.assertEqual(len(self.server.requests), 2)
+        self.assertGreaterEqual(time.time() - started, 0.2)
+
+    @unittest.skipIf(sys.version_info < (3, 5), "asyncio API requires Python 3.5")
+    def test_async_retried(self):
+        """
+        AsyncGeocoder retries server failures on the event loop
+        """
+        self.server.statuses = [503, 502]
+        geocoder = AsyncGeocoder(self.geocoder)
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        try:
+            location = loop.run_until_complete(
+                geocoder.geocode('175 5th Avenue NYC')
+            )
+            self.assertEqual(location.address, 'Flatiron')
+            self.assertEqual(len(self.server.requests), 3)
+        finally:
+            geocoder.transport.clear()
+            loop.close()
+            asyncio.set_event_loop(None)
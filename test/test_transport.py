@@ -0,0 +1,271 @@
+"""
+Test the keep-alive HTTP transport.
+"""
+
+import json
+import socket
+import unittest
+from mock import patch
+
+from geopy.compat import HTTPError, URLError
+from geopy.geocoders.base import Geocoder
+from geopy.exc import GeocoderQuotaExceeded
+from geopy.transport import ConnectionPool, HTTPTransport, PoolManager
+from test.http_server import LocalServer
+
+
+class HTTPTransportTestCase(unittest.TestCase): # pylint: disable=R0904
+    """
+    geopy.transport.HTTPTransport
+    """
+
+    def setUp(self):
+        self.server = LocalServer().start()
+        self.pool_manager = PoolManager()
+        self.transport = HTTPTransport(
+            headers={'User-Agent': 'geopy-test'},
+            pool_manager=self.pool_manager,
+        )
+
+    def tearDown(self):
+        self.pool_manager.clear()
+        self.server.stop()
+
+    def test_reuses_connection(self):
+        """
+        HTTPTransport keeps the connection alive between requests
+        """
+        for _ in range(5):
+            page = self.transport(self.server.url + '/search?q=x', timeout=5)
+            self.assertEqual(page.getcode(), 200)
+            self.assertEqual(
+                json.loads(page.read().decode('utf-8'))['path'],
+                '/search?q=x'
+            )
+        self.assertEqual(len(self.server.requests), 5)
+        self.assertEqual(len(self.server.connections), 1)
+
+    def test_sends_default_headers(self):
+        """
+        HTTPTransport sends its default headers
+        """
+        page = self.transport(self.server.url, timeout=5)
+        headers = json.loads(page.read().decode('utf-8'))['headers']
+        self.assertEqual(headers['user-agent'], 'geopy-test')
+
+    def test_http_error(self):
+        """
+        HTTPTransport raises HTTPError for error statuses
+        """
+        with self.assertRaises(HTTPError) as context:
+            self.transport(self.server.url + '/?status=402', timeout=5)
+        self.assertEqual(context.exception.getcode(), 402)
+
+    def test_connection_refused(self):
+        """
+        HTTPTransport raises URLError when the host is unreachable
+        """
+        url = self.server.url
+        self.server.stop()
+        self.server = LocalServer().start()
+        with self.assertRaises(URLError):
+            self.transport(url, timeout=5)
+
+    def test_geocoder_uses_transport(self):
+        """
+        Geocoder._call_geocoder goes through the pooled transport
+        """
+        geocoder = Geocoder(scheme='http')
+        geocoder.urlopen.pool_manager = self.pool_manager
+        response = geocoder._call_geocoder(self.server.url + '/?a=1')
+        self.assertEqual(response['path'], '/?a=1')
+        with self.assertRaises(GeocoderQuotaExceeded):
+            geocoder._call_geocoder(self.server.url + '/?status=402')
+
+    def test_proxy(self):
+        """
+        HTTPTransport sends plain HTTP requests through its proxy
+        """
+        transport = HTTPTransport(
+            proxies={'http': 'http://user:secret@%s:%s' % self.server.server_address},
+            pool_manager=self.pool_manager,
+        )
+        page = transport('http://geocoder.invalid/search?q=x', timeout=5)
+        response = json.loads(page.read().decode('utf-8'))
+        self.assertEqual(response['path'], 'http://geocoder.invalid/search?q=x')
+        self.assertEqual(response['headers']['host'], 'geocoder.invalid')
+        self.assertTrue(
+            response['headers']['proxy-authorization'].startswith('Basic ')
+        )
+
+    def test_redirect_keeps_credentials_on_same_host(self):
+        """
+        HTTPTransport sends its credentials again when redirected on one host
+        """
+        self.transport.auth = ('user', 'secret')
+        self.server.statuses = [302]
+        self.server.extra_headers['Location'] = '/moved'
+        page = self.transport(self.server.url, timeout=5)
+        response = json.loads(page.read().decode('utf-8'))
+        self.assertEqual(response['path'], '/moved')
+        self.assertIn('authorization', response['headers'])
+
+    def test_redirect_drops_credentials_across_hosts(self):
+        """
+        HTTPTransport does not send its credentials to another host
+        """
+        other = LocalServer().start()
+        try:
+            self.transport.auth = ('user', 'secret')
+            self.server.statuses = [302]
+            self.server.extra_headers['Location'] = other.url + '/moved'
+            page = self.transport(self.server.url, timeout=5)
+            response = json.loads(page.read().decode('utf-8'))
+            self.assertEqual(response['path'], '/moved')
+            self.assertNotIn('authorization', response['headers'])
+            self.assertEqual(response['headers']['user-agent'], 'geopy-test')
+        finally:
+            other.stop()
+
+    def test_relative_redirect(self):
+        """
+        HTTPTransport resolves relative redirects against the request url
+        """
+        for location, path in (
+                ('moved', '/a/moved'),
+                ('../moved', '/moved'),
+                ('?q=1', '/a/b?q=1'),
+        ):
+            self.server.statuses = [302]
+            self.server.extra_headers['Location'] = location
+            page = self.transport(self.server.url + '/a/b', timeout=5)
+            response = json.loads(page.read().decode('utf-8'))
+            self.assertEqual(response['path'], path)
+
+    def test_keeps_header_case(self):
+        """
+        HTTPTransport sends header names in the case they were given in
+        """
+        self.transport.headers['X-API-Key'] = 'key'
+        _, _, _, headers = self.transport._prepare(self.server.url) # pylint: disable=W0212
+        self.assertEqual(headers['X-API-Key'], 'key')
+        self.assertEqual(headers['User-Agent'], 'geopy-test')
+
+    def test_default_port_shares_pool(self):
+        """
+        HTTPTransport uses one pool whether or not the url gives the
+        scheme's default port
+        """
+        for url in ('http://127.0.0.1/', 'http://127.0.0.1:80/'):
+            try:
+                self.transport(url, timeout=0.1)
+            except URLError:
+                pass
+        self.assertEqual(list(self.pool_manager.pools), [
+            ('http', '127.0.0.1', 80, None)
+        ])
+
+    def test_retries_dropped_connection_once(self):
+        """
+        HTTPTransport retries a request on a fresh connection, not on every
+        idle one, when a reused connection was dropped by the server
+        """
+        pool = self.pool_manager.connection_pool(
+            'http', '127.0.0.1', self.server.server_address[1]
+        )
+        dropped = [_DroppedConnection() for _ in range(3)]
+        for conn in dropped:
+            pool.put(conn)
+        page = self.transport(self.server.url, timeout=5)
+        self.assertEqual(page.getcode(), 200)
+        self.assertEqual([conn.attempts for conn in dropped], [0, 0, 1])
+        self.assertEqual(len(self.server.requests), 1)
+
+    def test_instances_are_isolated(self):
+        """
+        Geocoders' proxies and credentials do not leak to other geocoders
+        """
+        authenticated = Geocoder(scheme='http')
+        authenticated.urlopen.auth = ('user', 'secret')
+        proxied = Geocoder(
+            scheme='http',
+            proxies={'http': '%s:%s' % self.server.server_address}
+        )
+        plain = Geocoder(scheme='http')
+        for geocoder in (authenticated, proxied, plain):
+            geocoder.urlopen.pool_manager = self.pool_manager
+
+        response = authenticated._call_geocoder(self.server.url)
+        self.assertIn('authorization', response['headers'])
+        response = proxied._call_geocoder('http://geocoder.invalid/')
+        self.assertEqual(response['path'], 'http://geocoder.invalid/')
+        response = plain._call_geocoder(self.server.url + '/plain')
+        self.assertEqual(response['path'], '/plain')
+        self.assertNotIn('authorization', response['headers'])
+
+
+class _DroppedConnection(object): # pylint: disable=R0903
+    """
+    Pooled connection which the server has closed.
+    """
+
+    sock = None
+
+    def __init__(self):
+        self.attempts = 0
+
+    def request(self, *args, **kwargs): # pylint: disable=W0613
+        """
+        Fail as a dropped connection does.
+        """
+        self.attempts += 1
+        raise socket.error('Connection reset by peer')
+
+    def close(self):
+        """
+        Nothing to close.
+        """
+
+
+class ConnectionPoolTestCase(unittest.TestCase): # pylint: disable=R0904
+    """
+    geopy.transport.ConnectionPool
+    """
+
+    def test_maxsize(self):
+        """
+        ConnectionPool closes connections beyond maxsize
+        """
+        pool = ConnectionPool('http', '127.0.0.1', 80, maxsize=1)
+        first, reused = pool.get()
+        self.assertFalse(reused)
+        second, _ = pool.get()
+        pool.put(first)
+        pool.put(second)
+        self.assertEqual(len(pool), 1)
+
+    def test_idle_eviction(self):
+        """
+        ConnectionPool does not hand out connections idle for too long
+        """
+        pool = ConnectionPool('http', '127.0.0.1', 80, idle_timeout=-1)
+        conn, _ = pool.get()
+        pool.put(conn)
+        fresh, reused = pool.get()
+        self.assertFalse(reused)
+        self.assertIsNot(fresh, conn)
+        self.assertEqual(len(pool), 0)
+
+    def test_fork(self):
+        """
+        ConnectionPool does not hand the connections of a parent process to
+        its forked children
+        """
+        pool = ConnectionPool('http', '127.0.0.1', 80)
+        conn, _ = pool.get()
+        pool.put(conn)
+        with patch('geopy.transport.os.getpid', return_value=-1):
+            child, reused = pool.get()
+        self.assertFalse(reused)
+        self.assertIsNot(child, conn)
+        self.assertEqual(len(pool), 0)